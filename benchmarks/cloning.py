@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Cost of copying every registered strategy: clone() and the get_state() /
+set_state() round trip against copy.deepcopy().
+
+Usage: python -m benchmarks.cloning [copies] [warmup_spins]
+"""
+
+import copy
+import random
+import sys
+import time
+
+from casino.strategies import available_strategies, create_strategy
+
+# Arguments of the strategies that cannot be built with their defaults
+ARGUMENTS = {
+    "sequence": {"sequence_file": [{"bet_type": "red", "multiplier": 1}]},
+    "zero_and_half": {"other": "red"},
+}
+
+
+def warmed_up(name: str, spins: int):
+    """Strategy with some history, so the containers are not empty"""
+    strategy = create_strategy(name, **ARGUMENTS.get(name, {}))
+    rng = random.Random(0)
+    for _ in range(spins):
+        strategy.calculate_bets()
+        strategy.update_after_spin(won=rng.random() < 0.45, number=rng.randrange(37))
+    return strategy
+
+
+def time_per_call(function, copies: int) -> float:
+    """Nanoseconds per call"""
+    start = time.perf_counter_ns()
+    for _ in range(copies):
+        function()
+    return (time.perf_counter_ns() - start) / copies
+
+
+if __name__ == "__main__":
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    spins = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    print(f"{'Strategy':<24}{'deepcopy':>12}{'clone':>12}{'state':>12}{'speedup':>10}")
+    for name in available_strategies():
+        strategy = warmed_up(name, spins)
+        target = warmed_up(name, 0)
+        deep = time_per_call(lambda: copy.deepcopy(strategy), copies)
+        clone = time_per_call(strategy.clone, copies)
+        state = time_per_call(lambda: target.set_state(strategy.get_state()), copies)
+        print(
+            f"{name:<24}{deep:>10,.0f}ns{clone:>10,.0f}ns{state:>10,.0f}ns"
+            f"{deep / clone:>9.1f}x"
+        )
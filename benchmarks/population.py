@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Memory and throughput of a large player population.
+
+Usage: python -m benchmarks.population [num_players] [rounds]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from casino.player import Player
+from casino.strategies.martingale import MartingaleStrategy
+from casino.strategies.hot_cold_sectors import HotColdSectorsStrategy
+from roulette_table import RouletteTable
+
+
+def measure_memory(num_players: int) -> float:
+    """Bytes allocated per player (strategy and stats tracker included)"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    players = [
+        Player(f"player_{i}", 1000_00, MartingaleStrategy(base_bet=100))
+        for i in range(num_players)
+    ]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del players
+    return (after - before) / num_players
+
+
+def measure_throughput(num_players: int, rounds: int) -> float:
+    """Bets placed and settled per second"""
+    table = RouletteTable()
+    strategies = [MartingaleStrategy(base_bet=100) for _ in range(num_players)]
+    strategies.append(HotColdSectorsStrategy(base_bet=500))
+    placed = 0
+    start = time.perf_counter()
+    for _ in range(rounds):
+        number = table.spin()
+        for strategy in strategies:
+            bets = strategy.calculate_bets()
+            won = False
+            for bet in bets:
+                won |= table.check_win(bet.bet_type, number)
+            placed += len(bets)
+            strategy.update_after_spin(won=won, number=number)
+    return placed / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    num_players = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    print(f"Players:     {num_players:,}")
+    print(f"Memory:      {measure_memory(num_players):,.0f} bytes per player")
+    print(
+        f"Throughput:  {measure_throughput(num_players, rounds):,.0f} bets per second"
+    )
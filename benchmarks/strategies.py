@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Cost of calculate_bets() plus update_after_spin() for every registered
+strategy, over the same seeded spin tape.
+
+Reports the time per round, the memory allocated per round (peak traced
+memory above the start of the round, tracemalloc counts bytes, not calls)
+and the peak memory of the run. Results can be saved as JSON and compared
+with a previous run, e.g. of another commit.
+
+--check-summary plays every strategy at a table in "summary" mode, reports
+the bytes allocated per round and fails when the table builds per-bet
+outcomes for a strategy that does not set uses_outcome.
+
+Usage: python -m benchmarks.strategies [--rounds N] [--seed N]
+           [--output FILE] [--compare FILE] [--threshold PERCENT]
+           [--check-summary] [names...]
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from typing import List, Dict, Sequence, Tuple
+
+from casino.player import Player
+from casino.strategies import (
+    available_strategies,
+    create_strategy,
+    get_strategy_class,
+)
+from casino.strategies.base import Strategy, SpinOutcome
+from casino import table as table_module
+from casino.table import CasinoTable
+from roulette_table import RouletteTable
+
+from .cloning import ARGUMENTS
+
+_ROULETTE = RouletteTable()
+# Bet type -> (winning numbers, payout), filled as bet types show up
+_SETTLEMENT: Dict[str, tuple] = {}
+
+
+def spin_tape(rounds: int, seed: int) -> List[int]:
+    rng = random.Random(seed)
+    return [rng.randrange(37) for _ in range(rounds)]
+
+
+def play(strategy: Strategy, tape: Sequence[int]):
+    """Run the strategy over the tape, settling its bets like a table"""
+    uses_outcome = strategy.uses_outcome
+    for number in tape:
+        bets = strategy.calculate_bets()
+        won_mask = 0
+        profits = []
+        for i, bet in enumerate(bets):
+            settlement = _SETTLEMENT.get(bet.bet_type)
+            if settlement is None:
+                settlement = _SETTLEMENT[bet.bet_type] = (
+                    _ROULETTE.bets[bet.bet_type],
+                    _ROULETTE.get_payout(bet.bet_type),
+                )
+            numbers, payout = settlement
+            if number in numbers:
+                won_mask |= 1 << i
+                profits.append(int(bet.amount * payout))
+            else:
+                profits.append(-bet.amount)
+        strategy.update_after_spin(
+            won=sum(profits) > 0,
+            number=number,
+            outcome=SpinOutcome(bets, won_mask, profits) if uses_outcome else None,
+        )
+
+
+def measure(name: str, tape: List[int], warmup: List[int], repeat: int) -> Dict:
+    """ns per round (best of `repeat`), bytes allocated per round, peak bytes"""
+    best = None
+    for _ in range(repeat):
+        strategy = create_strategy(name, **ARGUMENTS.get(name, {}))
+        play(strategy, warmup)
+        start = time.perf_counter_ns()
+        play(strategy, tape)
+        elapsed = time.perf_counter_ns() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    start_memory = tracemalloc.get_traced_memory()[0]
+    strategy = create_strategy(name, **ARGUMENTS.get(name, {}))
+    play(strategy, warmup)
+    allocated = 0
+    for number in tape:
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        play(strategy, (number,))
+        allocated += tracemalloc.get_traced_memory()[1] - current
+    peak = tracemalloc.get_traced_memory()[1] - start_memory
+    tracemalloc.stop()
+    return {
+        "ns_per_round": best / len(tape),
+        "bytes_per_round": allocated / len(tape),
+        "peak_bytes": peak,
+    }
+
+
+class _CountedOutcome(SpinOutcome):
+    """SpinOutcome counting its instances, swapped in by check_summary()"""
+
+    __slots__ = ()
+    built = 0
+
+    def __init__(self, *args):
+        _CountedOutcome.built += 1
+        SpinOutcome.__init__(self, *args)
+
+
+def table_round(name: str, rounds: int) -> Tuple[float, int]:
+    """
+    Bytes allocated per round by a table playing the strategy in summary mode,
+    and the per-bet outcomes it built
+    """
+    table = CasinoTable("benchmark", seed=0)
+    table.add_player(
+        Player("p", 10**12, create_strategy(name, **ARGUMENTS.get(name, {})))
+    )
+    for _ in range(100):
+        table.play_round("summary")
+    tracemalloc.start()
+    allocated = 0
+    for _ in range(rounds):
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        table.play_round("summary")
+        allocated += tracemalloc.get_traced_memory()[1] - current
+    tracemalloc.stop()
+
+    _CountedOutcome.built = 0
+    table_module.SpinOutcome = _CountedOutcome
+    try:
+        for _ in range(rounds):
+            table.play_round("summary")
+    finally:
+        table_module.SpinOutcome = SpinOutcome
+    return allocated / rounds, _CountedOutcome.built
+
+
+def check_summary(names: List[str], rounds: int) -> List[str]:
+    """Strategies the summary path builds per-bet outcomes for without a reader"""
+    print(f"\n{'Summary path':<24}{'allocated':>12}{'outcomes':>10}")
+    failures = []
+    for name in names:
+        allocated, outcomes = table_round(name, rounds)
+        flag = ""
+        if outcomes and not get_strategy_class(name).uses_outcome:
+            failures.append(name)
+            flag = "  unread outcomes"
+        print(f"{name:<24}{allocated:>11,.0f}B{outcomes:>10,}{flag}")
+    return failures
+
+
+def compare(results: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Strategies more than `threshold` percent slower than the baseline"""
+    print(f"\n{'Strategy':<24}{'before':>12}{'after':>12}{'change':>10}")
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]["ns_per_round"]
+        after = result["ns_per_round"]
+        change = (after - before) / before * 100
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  regression"
+        print(f"{name:<24}{before:>10,.0f}ns{after:>10,.0f}ns{change:>+9.1f}%{flag}")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-strategy microbenchmarks")
+    parser.add_argument("names", nargs="*", help="Strategies to run, all by default")
+    parser.add_argument("--rounds", type=int, default=5000)
+    parser.add_argument("--warmup", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Save the results as JSON")
+    parser.add_argument("--compare", help="JSON results of a previous run")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Percent")
+    parser.add_argument(
+        "--check-summary",
+        action="store_true",
+        help="Fail when the summary path builds outcomes nobody reads",
+    )
+    args = parser.parse_args()
+
+    tape = spin_tape(args.warmup + args.rounds, args.seed)
+    warmup, tape = tape[: args.warmup], tape[args.warmup :]
+    results = {}
+    print(f"{'Strategy':<24}{'time':>12}{'allocated':>12}{'peak':>12}")
+    for name in args.names or available_strategies():
+        result = results[name] = measure(name, tape, warmup, args.repeat)
+        print(
+            f"{name:<24}{result['ns_per_round']:>10,.0f}ns"
+            f"{result['bytes_per_round']:>11,.0f}B{result['peak_bytes']:>11,}B"
+        )
+
+    if args.output:
+        report = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "rounds": args.rounds,
+            "warmup": args.warmup,
+            "seed": args.seed,
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("seed") != args.seed or baseline.get("rounds") != args.rounds:
+            print("Warning: the baseline ran another spin tape")
+        if compare(results, baseline["results"], args.threshold):
+            sys.exit(1)
+    if args.check_summary:
+        if check_summary(args.names or available_strategies(), args.rounds):
+            sys.exit(1)
@@ -0,0 +1,204 @@
+import asyncio
+import heapq
+import random
+from dataclasses import dataclass
+from typing import Callable, List, Tuple, Any
+
+from .player import Player, PlayerStatus
+from .table import Casino, ResultsLevel
+
+# Event kinds, also the tie-breaker between events at the same virtual time
+SPIN = 0
+BREAK_END = 1
+BREAK_START = 2
+DEPARTURE = 3
+ARRIVAL = 4
+
+
+@dataclass
+class SchedulerStats:
+    """Counters of a discrete-event run"""
+
+    time: float = 0.0  # Virtual seconds
+    events: int = 0
+    spins: int = 0
+    arrivals: int = 0
+    departures: int = 0
+    breaks: int = 0
+
+
+class CasinoScheduler:
+    """
+    Discrete-event engine running a Casino in virtual time.
+
+    Every table spins on its own cadence (CasinoTable.spin_interval), players
+    arrive following a Poisson process and may leave after an exponentially
+    distributed stay, tables can take periodic breaks. Nothing ever sleeps:
+    events are popped from a heap ordered by virtual time, so a full casino
+    day only costs the work done at the tables.
+    """
+
+    def __init__(
+        self,
+        casino: Casino,
+        *,
+        seed: int | None = None,
+        arrival_rate: float = 0.0,
+        player_factory: Callable[[random.Random, float], Player] | None = None,
+        mean_stay: float | None = None,
+        break_every: float | None = None,
+        break_duration: float = 900.0,
+        results: ResultsLevel = "none",
+        on_spin: Callable[[float, int, Any], None] | None = None,
+    ):
+        """
+        Args:
+            casino: Casino to simulate, players already added are seated at start
+            seed: Seed of the scheduler random generator (arrivals, stays, offsets)
+            arrival_rate: Mean player arrivals per virtual second
+            player_factory: Builds an arriving player from the generator and time
+            mean_stay: Mean seconds a player stays before leaving, None to only
+                leave when the strategy says so
+            break_every: Seconds of play between two breaks of a table
+            break_duration: Length of a table break in seconds
+            results: Results level requested from each table spin
+            on_spin: Called with (time, table index, results) after each spin
+        """
+        if arrival_rate > 0 and player_factory is None:
+            raise ValueError("player_factory is required when arrival_rate > 0")
+        self.casino = casino
+        self.rng = random.Random(seed)
+        self.arrival_rate = arrival_rate
+        self.player_factory = player_factory
+        self.mean_stay = mean_stay
+        self.break_every = break_every
+        self.break_duration = break_duration
+        self.results = results
+        self.on_spin = on_spin
+        self.stats = SchedulerStats()
+        self._events: List[Tuple[float, int, int, Any]] = []
+        self._sequence = 0
+        self._on_break = [False] * len(casino.tables)
+        # Spin chain of each table, SPIN events of an older chain are dropped
+        self._chain = [0] * len(casino.tables)
+        # Time of the pending spin, then during a break the time it had left
+        self._next_spin = [0.0] * len(casino.tables)
+        # Empty tables stop spinning until a player sits down
+        self._idle = [False] * len(casino.tables)
+        self._started = False
+
+    def schedule(self, time: float, kind: int, payload: Any = None):
+        """Push an event, events at the same time keep kind then insertion order"""
+        self._sequence += 1
+        heapq.heappush(self._events, (time, kind, self._sequence, payload))
+
+    def _start(self):
+        self._started = True
+        now = self.stats.time
+        for idx, table in enumerate(self.casino.tables):
+            # Random phase so tables with the same cadence do not spin in lockstep
+            self._schedule_spin(now + self.rng.uniform(0, table.spin_interval), idx)
+            if self.break_every:
+                self.schedule(now + self.break_every, BREAK_START, idx)
+        if self.arrival_rate > 0:
+            self.schedule(now + self.rng.expovariate(self.arrival_rate), ARRIVAL)
+        for player in self.casino.players:
+            self._schedule_departure(now, player)
+        self.casino.assign_players()
+
+    def _assign(self, now: float):
+        """Seat waiting players and wake up the idle tables they sat at"""
+        for idx in self.casino.assign_players():
+            if self._idle[idx]:
+                self._idle[idx] = False
+                if not self._on_break[idx]:
+                    table = self.casino.tables[idx]
+                    self._schedule_spin(now + table.spin_interval, idx)
+
+    def _schedule_spin(self, time: float, idx: int):
+        """Schedule the next spin of a table, replacing any pending one"""
+        self._chain[idx] += 1
+        self._next_spin[idx] = time
+        self.schedule(time, SPIN, (idx, self._chain[idx]))
+
+    def _schedule_departure(self, now: float, player: Player):
+        if self.mean_stay:
+            stay = self.rng.expovariate(1 / self.mean_stay)
+            self.schedule(now + stay, DEPARTURE, player)
+
+    def _handle(self, time: float, kind: int, payload: Any):
+        casino = self.casino
+        if kind == SPIN:
+            idx, chain = payload
+            if chain != self._chain[idx]:
+                return
+            if not casino.tables[idx].current_players:
+                self._idle[idx] = True
+                return
+            table_results = casino.play_table(idx, self.results)
+            self.stats.spins += 1
+            if casino.has_waiting_players():
+                self._assign(time)
+            if self.on_spin is not None:
+                self.on_spin(time, idx, table_results)
+            self._schedule_spin(time + casino.tables[idx].spin_interval, idx)
+        elif kind == ARRIVAL:
+            player = self.player_factory(self.rng, time)
+            casino.add_player(player)
+            self._assign(time)
+            self.stats.arrivals += 1
+            self._schedule_departure(time, player)
+            self.schedule(time + self.rng.expovariate(self.arrival_rate), ARRIVAL)
+        elif kind == DEPARTURE:
+            if payload.status != PlayerStatus.FINISHED:
+                casino.remove_player(payload)
+                self.stats.departures += 1
+        elif kind == BREAK_START:
+            # The wheel stops, the pending spin resumes where it was after the break
+            self._on_break[payload] = True
+            self._chain[payload] += 1
+            if self._idle[payload]:
+                self._next_spin[payload] = casino.tables[payload].spin_interval
+            else:
+                self._next_spin[payload] -= time
+            self.stats.breaks += 1
+            self.schedule(time + self.break_duration, BREAK_END, payload)
+        elif kind == BREAK_END:
+            self._on_break[payload] = False
+            self._idle[payload] = False
+            self._schedule_spin(time + self._next_spin[payload], payload)
+            self.schedule(time + self.break_every, BREAK_START, payload)
+
+    def step(self, until: float) -> bool:
+        """Process the next event if it happens before `until`"""
+        if not self._started:
+            self._start()
+        if not self._events or self._events[0][0] > until:
+            return False
+        time, kind, _, payload = heapq.heappop(self._events)
+        self.stats.time = time
+        self.stats.events += 1
+        self._handle(time, kind, payload)
+        return True
+
+    def run(self, until: float) -> SchedulerStats:
+        """Process every event up to virtual time `until` (in seconds)"""
+        while self.step(until):
+            pass
+        self.stats.time = max(self.stats.time, until)
+        return self.stats
+
+    async def run_async(
+        self, until: float, yield_every: int = 10_000
+    ) -> SchedulerStats:
+        """
+        Same as run() but hands control back to the event loop every
+        `yield_every` events, so other coroutines can watch the simulation.
+        """
+        processed = 0
+        while self.step(until):
+            processed += 1
+            if processed % yield_every == 0:
+                await asyncio.sleep(0)
+        self.stats.time = max(self.stats.time, until)
+        return self.stats
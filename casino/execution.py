@@ -0,0 +1,185 @@
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Set, Tuple, Any
+
+from .player import Player
+
+
+class SerialBackend:
+    """Play every table one after the other in the calling thread"""
+
+    def play_round(self, tables: List, results: str) -> List:
+        return [table.play_round(results) for table in tables]
+
+    def fetch_tables(self) -> Tuple[Dict[int, Any], List[Player]]:
+        return {}, []
+
+    def close(self):
+        pass
+
+
+class ThreadBackend:
+    """
+    Play tables concurrently in a thread pool.
+    Only worth it on free-threaded builds, with the GIL tables run one at a time.
+    """
+
+    def __init__(self, workers: int | None = None):
+        self.workers = workers or os.cpu_count() or 1
+        self._pool: ThreadPoolExecutor | None = None
+
+    def play_round(self, tables: List, results: str) -> List:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers)
+        return list(self._pool.map(lambda table: table.play_round(results), tables))
+
+    def fetch_tables(self) -> Tuple[Dict[int, Any], List[Player]]:
+        return {}, []
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+def _table_worker(connection, tables: Dict[int, Any]):
+    """Worker process loop: owns a subset of tables and their players"""
+    departed: Dict[str, Player] = {}  # Since the last "tables" command
+    while True:
+        command, payload = connection.recv()
+        if command == "play":
+            results, new_players, removed = payload
+            for idx, player_ids in removed.items():
+                # Made to leave by the parent, Casino.remove_player
+                table = tables[idx]
+                for player_id in player_ids:
+                    player = table.current_players.get(player_id)
+                    if player is not None:
+                        table.remove_player(player)
+                        departed[player_id] = player
+                table.departed.clear()
+            for idx, players in new_players.items():
+                for player in players:
+                    tables[idx].add_player(player)
+            round_results = []
+            for idx, table in tables.items():
+                seated = dict(table.current_players)
+                result = table.play_round(results)
+                left = table.departed
+                table.departed = []
+                for player_id in left:
+                    departed[player_id] = seated[player_id]
+                round_results.append((idx, result, left))
+            connection.send(round_results)
+        elif command == "tables":
+            # One message, so the strategies keep sharing their table's SpinStats
+            connection.send((tables, list(departed.values())))
+            departed.clear()
+        elif command == "stop":
+            connection.close()
+            return
+
+
+class ProcessBackend:
+    """
+    Distribute tables across worker processes.
+
+    Tables and their seated players are shipped to the workers on the first
+    round and then live there: every round the parent only sends the players
+    seated and the ids of the players removed since the previous round, and
+    receives the round summaries plus the ids of the players who left. The
+    parent copies of the tables (wheels, spin statistics) and of the seated
+    players are not updated while the workers run, call fetch_tables() (done
+    by Casino.close() and Casino.save()) to get the authoritative objects back.
+    """
+
+    def __init__(self, workers: int | None = None):
+        self.workers = workers or os.cpu_count() or 1
+        self._connections = []
+        self._processes = []
+        self._shipped: List[Set[str]] = []
+
+    def _start(self, tables: List):
+        context = multiprocessing.get_context()
+        workers = min(self.workers, len(tables))
+        for worker in range(workers):
+            owned = {idx: tables[idx] for idx in range(worker, len(tables), workers)}
+            parent_end, child_end = context.Pipe()
+            process = context.Process(
+                target=_table_worker, args=(child_end, owned), daemon=True
+            )
+            process.start()
+            child_end.close()
+            self._connections.append(parent_end)
+            self._processes.append(process)
+        self._shipped = [set(table.current_players) for table in tables]
+
+    def play_round(self, tables: List, results: str) -> List:
+        if results == "full":
+            raise ValueError("ProcessBackend only returns summary results")
+        if not self._connections:
+            self._start(tables)
+
+        workers = len(self._connections)
+        for worker, connection in enumerate(self._connections):
+            new_players = {}
+            removed = {}
+            for idx in range(worker, len(tables), workers):
+                shipped = self._shipped[idx]
+                current = tables[idx].current_players
+                gone = shipped - current.keys()
+                if gone:
+                    removed[idx] = list(gone)
+                    shipped -= gone
+                seated = [
+                    player
+                    for player_id, player in current.items()
+                    if player_id not in shipped
+                ]
+                if seated:
+                    new_players[idx] = seated
+                    shipped.update(player.player_id for player in seated)
+            connection.send(("play", (results, new_players, removed)))
+
+        round_results = [None] * len(tables)
+        for connection in self._connections:
+            for idx, result, left in connection.recv():
+                round_results[idx] = result
+                table = tables[idx]
+                for player_id in left:
+                    self._shipped[idx].discard(player_id)
+                    player = table.current_players.get(player_id)
+                    if player is not None:
+                        table.remove_player(player)
+        return round_results
+
+    def fetch_tables(self) -> Tuple[Dict[int, Any], List[Player]]:
+        """Tables as played by the workers, by index, and the players who left"""
+        tables = {}
+        departed = []
+        for connection in self._connections:
+            connection.send(("tables", None))
+        for connection in self._connections:
+            owned, left = connection.recv()
+            tables.update(owned)
+            departed.extend(left)
+        return tables, departed
+
+    def close(self):
+        for connection in self._connections:
+            connection.send(("stop", None))
+            connection.close()
+        for process in self._processes:
+            process.join()
+        self._connections = []
+        self._processes = []
+
+
+def default_backend(workers: int | None = None):
+    """Threads on free-threaded builds, processes otherwise"""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)
+    if not is_gil_enabled():
+        return ThreadBackend(workers)
+    return ProcessBackend(workers)
@@ -0,0 +1,247 @@
+"""
+Exact evaluation of a strategy as an absorbing Markov chain.
+
+Requires SciPy. A state of the chain is a bankroll and a strategy state as
+returned by Strategy.get_state(). From every state the 37 equally likely
+numbers lead to the next states through the same bets, payouts and exit
+rules as for a player seated at a table: the player leaves when the
+bankroll falls below the base bet (ruin) or hits the stop loss or the take
+profit, and sits out for good once it cannot cover its next bets (stalled).
+The take profit bounds the bankroll, so the chain is finite for strategies
+whose state only depends on the results, like the progressions.
+
+Usage: python -m casino.markov STRATEGY --bankroll CENTS --take-profit CENTS
+           [--stop-loss CENTS] [--param name=value ...] [--rounds N]
+"""
+
+import argparse
+from collections import Counter
+from dataclasses import dataclass
+from typing import List, Dict, Tuple, Hashable
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import spsolve
+
+from roulette_table import RouletteTable
+
+from .strategies import create_strategy
+from .strategies.base import Strategy, SpinOutcome
+
+# Ways of leaving the chain, in the order the player checks its exit rules
+ABSORBING = ("ruin", "stop_loss", "take_profit", "stalled")
+# Guard against chains too large to solve
+MAX_STATES = 1 << 20
+# Strategies whose state keeps growing, such as spin histories, lead to ~37
+# new strategy states from each one, bounded progressions to 1 or 2: past
+# GROWTH_CHECK strategy states, more than MAX_BRANCHING new ones per state
+# stops the build in well under a second instead of minutes at MAX_STATES
+GROWTH_CHECK = 256
+MAX_BRANCHING = 8
+
+# Strategy state -> total bet, then (profit, next strategy state) -> numbers
+Moves = Tuple[int, List[Tuple[Tuple[int, Hashable], int]]]
+
+
+@dataclass
+class MarkovResult:
+    absorption: Dict[str, float]  # Probability of every ABSORBING outcome
+    expected_rounds: float  # Rounds played before leaving or stalling
+    states: int  # Size of the chain
+
+    @property
+    def ruin_probability(self) -> float:
+        """Probability of ending unable to go on with the strategy"""
+        return self.absorption["ruin"] + self.absorption["stalled"]
+
+
+class MarkovChain:
+    """
+    Chain of a strategy played from `initial_bankroll` (in cents) until it
+    leaves the table, built once and solved with sparse linear algebra.
+    """
+
+    def __init__(
+        self,
+        strategy: Strategy,
+        initial_bankroll: int,
+        *,
+        take_profit: int,
+        stop_loss: int = 0,
+        max_states: int = MAX_STATES,
+    ):
+        if take_profit <= 0:
+            raise ValueError("A take profit is needed to bound the bankroll")
+        self.initial_bankroll = initial_bankroll
+        self.take_profit = take_profit
+        self.stop_loss = stop_loss
+        self.max_states = max_states
+        self._model = strategy.clone()  # Moved around with set_state()
+        self._roulette = RouletteTable()
+        self._moves: Dict[Hashable, Moves] = {}
+        self._seen = set()  # Strategy states reached so far, explored or not
+        # Chain state -> (bankroll, strategy state) and ABSORBING kind or None
+        self.states: List[Tuple[int, Hashable]] = []
+        self.kinds: List[str | None] = []
+        self.matrix = self._build(strategy.get_state())
+
+    def _strategy_moves(self, state: Hashable) -> Moves:
+        """Total bet and outcomes of the 37 numbers for a strategy state"""
+        moves = self._moves.get(state)
+        if moves is not None:
+            return moves
+        model = self._model
+        model.set_state(state)
+        bets = list(model.calculate_bets())
+        planned = model.get_state()  # calculate_bets() may update the state
+        outcomes = Counter()
+        for number in range(37):
+            won_mask = 0
+            profits = []
+            for i, bet in enumerate(bets):
+                if self._roulette.check_win(bet.bet_type, number):
+                    payout = self._roulette.get_payout(bet.bet_type)
+                    won_mask |= 1 << i
+                    profits.append(int(bet.amount * payout))
+                else:
+                    profits.append(-bet.amount)
+            profit = sum(profits)
+            model.set_state(planned)
+            model.update_after_spin(
+                won=profit > 0,
+                number=number,
+                outcome=SpinOutcome(bets, won_mask, profits),
+            )
+            outcomes[profit, model.get_state()] += 1
+        moves = self._moves[state] = (
+            sum(bet.amount for bet in bets),
+            list(outcomes.items()),
+        )
+        self._seen.add(state)
+        self._seen.update(next_state for _, next_state in outcomes)
+        explored = len(self._moves)
+        if explored >= GROWTH_CHECK and len(self._seen) > MAX_BRANCHING * explored:
+            raise ValueError(
+                "Strategy state keeps growing, does it depend on past spins?"
+            )
+        return moves
+
+    def _exit_kind(self, bankroll: int) -> str | None:
+        """Exit rule a bankroll triggers, checked like the player stats tracker"""
+        if bankroll < self._model.base_bet:
+            return "ruin"
+        if self.stop_loss and self.initial_bankroll - bankroll >= self.stop_loss:
+            return "stop_loss"
+        if bankroll - self.initial_bankroll >= self.take_profit:
+            return "take_profit"
+        return None
+
+    def _build(self, initial_state: Hashable) -> sparse.csr_matrix:
+        """Breadth-first over the reachable states, absorbing ones loop on themselves"""
+        start = (self.initial_bankroll, initial_state)
+        index = {start: 0}
+        self.states.append(start)
+        rows, columns, probabilities = [], [], []
+        i = 0
+        while i < len(self.states):
+            bankroll, state = self.states[i]
+            kind = self._exit_kind(bankroll)
+            if kind is None:
+                total_bet, outcomes = self._strategy_moves(state)
+                if total_bet > bankroll:
+                    kind = "stalled"
+            self.kinds.append(kind)
+            if kind is not None:
+                rows.append(i)
+                columns.append(i)
+                probabilities.append(1.0)
+                i += 1
+                continue
+            for (profit, next_state), numbers in outcomes:
+                target = (bankroll + profit, next_state)
+                j = index.get(target)
+                if j is None:
+                    if len(self.states) >= self.max_states:
+                        raise ValueError(
+                            "Chain has too many states, is the strategy state bounded?"
+                        )
+                    j = index[target] = len(self.states)
+                    self.states.append(target)
+                rows.append(i)
+                columns.append(j)
+                probabilities.append(numbers / 37)
+            i += 1
+        size = len(self.states)
+        return sparse.csr_matrix((probabilities, (rows, columns)), shape=(size, size))
+
+    def solve(self) -> MarkovResult:
+        """Absorption probabilities and expected rounds from the initial state"""
+        absorption = dict.fromkeys(ABSORBING, 0.0)
+        if self.kinds[0] is not None:
+            absorption[self.kinds[0]] = 1.0
+            return MarkovResult(absorption, 0.0, len(self.states))
+
+        transient = np.array([k is None for k in self.kinds])
+        transient_ids = np.flatnonzero(transient)
+        absorbing_ids = np.flatnonzero(~transient)
+        rows = self.matrix[transient_ids]
+        q = rows[:, transient_ids]
+        # Expected visits of every transient state: (I - Q)ᵀ x = e_start
+        system = (sparse.identity(len(transient_ids), format="csc") - q).T.tocsc()
+        start = np.zeros(len(transient_ids))
+        start[0] = 1.0  # The initial state is the first transient one
+        visits = np.atleast_1d(spsolve(system, start))
+        if not np.all(np.isfinite(visits)):
+            raise ValueError("Some states never reach an exit of the chain")
+
+        reached = rows[:, absorbing_ids].T @ visits
+        for state, probability in zip(absorbing_ids, reached):
+            absorption[self.kinds[state]] += float(probability)
+        return MarkovResult(absorption, float(visits.sum()), len(self.states))
+
+    def bankroll_distribution(self, rounds: int) -> Dict[int, float]:
+        """Bankroll (in cents) -> probability after `rounds` rounds"""
+        transposed = self.matrix.T.tocsr()
+        probabilities = np.zeros(len(self.states))
+        probabilities[0] = 1.0
+        for _ in range(rounds):
+            probabilities = transposed @ probabilities
+        distribution: Dict[int, float] = {}
+        for i in np.flatnonzero(probabilities):
+            bankroll = self.states[i][0]
+            distribution[bankroll] = distribution.get(bankroll, 0.0) + probabilities[i]
+        return dict(sorted(distribution.items()))
+
+
+if __name__ == "__main__":
+    from .sweep import parse_value
+
+    parser = argparse.ArgumentParser(description="Exact ruin probability of a strategy")
+    parser.add_argument("strategy", help="Registered strategy name, e.g. martingale")
+    parser.add_argument("--bankroll", type=int, default=74 * 100 * 2, help="In cents")
+    parser.add_argument("--take-profit", type=int, required=True, help="In cents")
+    parser.add_argument("--stop-loss", type=int, default=0, help="In cents")
+    parser.add_argument("--param", action="append", default=[], metavar="NAME=VALUE")
+    parser.add_argument("--rounds", type=int, default=0, help="Show the bankroll then")
+    args = parser.parse_args()
+
+    params = {}
+    for option in args.param:
+        name, _, text = option.partition("=")
+        params[name] = parse_value(text)
+    chain = MarkovChain(
+        create_strategy(args.strategy, **params),
+        args.bankroll,
+        take_profit=args.take_profit,
+        stop_loss=args.stop_loss,
+    )
+    result = chain.solve()
+    print(f"States:          {result.states:,}")
+    print(f"Ruin:            {result.ruin_probability:.6f}")
+    for kind, probability in result.absorption.items():
+        print(f"  {kind:<14} {probability:.6f}")
+    print(f"Expected rounds: {result.expected_rounds:,.2f}")
+    if args.rounds:
+        print(f"Bankroll after {args.rounds} rounds:")
+        for bankroll, probability in chain.bankroll_distribution(args.rounds).items():
+            print(f"  €{bankroll / 100:>10.2f}  {probability:.6f}")
@@ -2,7 +2,8 @@ from enum import Enum
 
 import casino_player
 
-from .strategies.base import Strategy, PlacedBet
+from . import profiling
+from .strategies.base import Strategy, PlacedBet, SpinOutcome
 
 
 class PlayerStatus(Enum):
@@ -14,13 +15,52 @@ class PlayerStatus(Enum):
 class Player:
     """Casino player with strategy and status tracking"""
 
-    def __init__(self, player_id: str, initial_bankroll: int, strategy: Strategy):
+    __slots__ = (
+        "player_id",
+        "initial_bankroll",
+        "stats_tracker",
+        "strategy",
+        "rounds_played",
+        "status",
+        "index",
+        "leave_status",
+    )
+
+    def __init__(
+        self,
+        player_id: str,
+        initial_bankroll: int,
+        strategy: Strategy,
+        *,
+        stop_loss: int = 0,
+        take_profit: int = 0,
+        max_rounds: int = 0,
+    ):
+        """
+        Args:
+            player_id: Unique name of the player
+            initial_bankroll: Bankroll in cents
+            strategy: Betting strategy
+            stop_loss: Leave once this many cents are lost (0 = never)
+            take_profit: Leave once this many cents are won (0 = never)
+            max_rounds: Leave after this many rounds (0 = never)
+        """
         self.player_id = player_id
         self.initial_bankroll = initial_bankroll
-        self.stats_tracker = casino_player.Player(initial_bankroll)
+        # The tracker checks the exit rules itself after each game, the player
+        # always leaves when it can no longer cover the strategy base bet
+        self.stats_tracker = casino_player.Player(
+            initial_bankroll,
+            stop_loss=stop_loss,
+            take_profit=take_profit,
+            max_rounds=max_rounds,
+            min_bankroll=strategy.base_bet,
+        )
+        self.leave_status = self.stats_tracker.get_status()
         self.strategy = strategy
         self.rounds_played = 0
         self.status = PlayerStatus.WAITING
+        self.index = -1  # Position in Casino.players, set when joining a casino
 
     def get_initial_bankroll(self) -> int:
         return self.initial_bankroll
@@ -30,14 +70,37 @@ class Player:
 
     def should_leave(self) -> bool:
         """Determine if player should leave the table"""
-        return self.get_current_bankroll() < self.strategy.base_bet
+        return self.leave_status != casino_player.KEEP_PLAYING
 
     def calculate_bets(self) -> list[PlacedBet]:
         """Get bets from strategy"""
+        if profiling.enabled:
+            profiling.start(profiling.method_phase(self.strategy, "calculate_bets"))
+            try:
+                return self.strategy.calculate_bets()
+            finally:
+                profiling.stop()
         return self.strategy.calculate_bets()
 
-    def update_after_round(self, total_profit: int, total_bet: int, number: int):
-        """Update player stats after a round"""
-        self.stats_tracker.add_game(total_profit, total_bet, number)
+    def update_after_round(
+        self,
+        total_profit: int,
+        total_bet: int,
+        number: int,
+        outcome: SpinOutcome | None = None,
+    ):
+        """Update player stats after a round, `outcome` settles each bet"""
+        self.leave_status = self.stats_tracker.add_game(total_profit, total_bet, number)
         self.rounds_played += 1
-        self.strategy.update_after_spin(won=total_profit > 0, number=number)
+        if profiling.enabled:
+            profiling.start(profiling.method_phase(self.strategy, "update_after_spin"))
+            try:
+                self.strategy.update_after_spin(
+                    won=total_profit > 0, number=number, outcome=outcome
+                )
+            finally:
+                profiling.stop()
+            return
+        self.strategy.update_after_spin(
+            won=total_profit > 0, number=number, outcome=outcome
+        )
@@ -0,0 +1,175 @@
+"""
+Opt-in timing of the simulation phases.
+
+Enabled by setting the CASINO_PROFILE environment variable, or with
+enable(). The instrumented code (Casino.simulate_round, Casino.assign_players,
+CasinoTable.play_round and the strategy calls of Player) brackets each phase
+with start()/stop(), which keep a per-thread stack of phases and add the
+perf_counter_ns() time and the calls of every stack of phases. When disabled
+a phase only costs a test of `enabled`.
+
+With CASINO_PROFILE=1 a summary table is printed to stderr at exit, any
+other value is a file the stacks are also written to in the collapsed
+format of flamegraph.pl and speedscope ("a;b;c nanoseconds" lines).
+
+Phases run in worker processes (ProcessBackend, sharded runs) are not seen
+by the calling process.
+"""
+
+import atexit
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from time import perf_counter_ns
+from typing import List, Dict, Tuple, Iterator, TextIO
+
+ENV_VAR = "CASINO_PROFILE"
+
+enabled = False
+
+# Stack of phase names -> [calls, cumulative ns], one dict per thread
+Stats = Dict[Tuple[str, ...], List[int]]
+
+
+class _Recorder(threading.local):
+    def __init__(self):
+        self.path: Tuple[str, ...] = ()
+        self.stack: List[Tuple[Tuple[str, ...], int]] = []  # (parent path, start)
+        self.stats: Stats = {}
+        with _lock:
+            _stats.append(self.stats)
+
+
+_lock = threading.Lock()
+_stats: List[Stats] = []  # Stats of every thread that recorded phases
+_recorder = _Recorder()
+_method_phases: Dict[Tuple[type, str], str] = {}
+
+
+def enable():
+    global enabled
+    enabled = True
+
+
+def disable():
+    global enabled
+    enabled = False
+
+
+def reset():
+    """Forget the recorded phases, of every thread"""
+    with _lock:
+        for stats in _stats:
+            stats.clear()
+    _recorder.path = ()
+    _recorder.stack.clear()
+
+
+def start(name: str):
+    """Enter a phase, nested in the current one of the thread"""
+    recorder = _recorder
+    recorder.stack.append((recorder.path, perf_counter_ns()))
+    recorder.path += (name,)
+
+
+def stop():
+    """Leave the current phase of the thread"""
+    now = perf_counter_ns()
+    recorder = _recorder
+    parent, started = recorder.stack.pop()
+    entry = recorder.stats.get(recorder.path)
+    if entry is None:
+        recorder.stats[recorder.path] = [1, now - started]
+    else:
+        entry[0] += 1
+        entry[1] += now - started
+    recorder.path = parent
+
+
+def method_phase(obj: object, method: str) -> str:
+    """Phase name of a method call, e.g. MartingaleStrategy.calculate_bets"""
+    key = (type(obj), method)
+    name = _method_phases.get(key)
+    if name is None:
+        name = _method_phases[key] = f"{type(obj).__name__}.{method}"
+    return name
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Time a block as a phase when profiling is enabled"""
+    if not enabled:
+        yield
+        return
+    start(name)
+    try:
+        yield
+    finally:
+        stop()
+
+
+def collect() -> Stats:
+    """Calls and cumulative ns of every stack of phases, all threads merged"""
+    merged: Stats = {}
+    with _lock:
+        for stats in _stats:
+            for path, (calls, elapsed) in list(stats.items()):
+                entry = merged.setdefault(path, [0, 0])
+                entry[0] += calls
+                entry[1] += elapsed
+    return merged
+
+
+def _self_times(stats: Stats) -> Dict[Tuple[str, ...], int]:
+    """Time spent in each stack of phases outside of its nested phases"""
+    own = {path: elapsed for path, (_, elapsed) in stats.items()}
+    for path, (_, elapsed) in stats.items():
+        if len(path) > 1 and path[:-1] in own:
+            own[path[:-1]] -= elapsed
+    return own
+
+
+def write_collapsed(file: str | TextIO):
+    """Collapsed stacks of the self times, for flamegraph.pl or speedscope"""
+    own = _self_times(collect())
+    lines = [f"{';'.join(path)} {max(ns, 0)}\n" for path, ns in sorted(own.items())]
+    if isinstance(file, str):
+        with open(file, "w", encoding="utf-8") as f:
+            f.writelines(lines)
+    else:
+        file.writelines(lines)
+
+
+def summary() -> str:
+    """Table of the phases, nested phases indented under their parent"""
+    stats = collect()
+    own = _self_times(stats)
+    total = sum(elapsed for path, (_, elapsed) in stats.items() if len(path) == 1)
+    lines = [
+        f"{'Phase':<48}{'calls':>12}{'total ms':>12}{'self ms':>12}"
+        f"{'avg ns':>10}{'%':>7}"
+    ]
+    for path in sorted(stats):
+        calls, elapsed = stats[path]
+        name = "  " * (len(path) - 1) + path[-1]
+        lines.append(
+            f"{name:<48}{calls:>12,}{elapsed / 1e6:>12,.1f}{own[path] / 1e6:>12,.1f}"
+            f"{elapsed / calls:>10,.0f}{elapsed / max(total, 1) * 100:>6.1f}%"
+        )
+    return "\n".join(lines)
+
+
+def _report():
+    if not collect():
+        return
+    print(summary(), file=sys.stderr)
+    target = os.environ.get(ENV_VAR, "")
+    if target not in ("", "0", "1"):
+        write_collapsed(target)
+        print(f"Collapsed stacks written to {target}", file=sys.stderr)
+
+
+if os.environ.get(ENV_VAR, "") not in ("", "0"):
+    enable()
+    atexit.register(_report)
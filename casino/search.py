@@ -0,0 +1,251 @@
+"""
+Adaptive search of strategy parameters.
+
+Usage: python -m casino.search STRATEGY --grid name=v1,v2 [--grid ...]
+           [--min-simulations N] [--max-simulations N] [--eta N] [--rounds N]
+"""
+
+import argparse
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Callable
+
+from .sweep import (
+    SweepCell,
+    CellResult,
+    Space,
+    run_cell,
+    grid,
+    random_samples,
+    cell_seed,
+    parse_value,
+)
+
+# Two-sided 95% normal quantile for the confidence intervals
+Z_95 = 1.959964
+
+
+@dataclass
+class Evaluation:
+    """Accumulated results of one configuration across the rungs it reached"""
+
+    params: Dict[str, Any]
+    simulations: int = 0
+    rung: int = 0  # Last rung the configuration was evaluated at
+    survived: int = 0
+    rounds_played: float = 0.0
+    profit_sum: float = 0.0  # In euros
+    profit_squares: float = 0.0
+
+    def add(self, result: CellResult):
+        n = result.simulations
+        self.simulations += n
+        self.survived += round(result.survival_rate * n / 100)
+        self.rounds_played += result.avg_rounds * n
+        self.profit_sum += result.avg_profit * n
+        self.profit_squares += result.profit_std**2 * (n - 1) + n * result.avg_profit**2
+
+    @property
+    def avg_profit(self) -> float:
+        return self.profit_sum / self.simulations if self.simulations else 0.0
+
+    @property
+    def survival_rate(self) -> float:
+        return self.survived / self.simulations * 100 if self.simulations else 0.0
+
+    @property
+    def avg_rounds(self) -> float:
+        return self.rounds_played / self.simulations if self.simulations else 0.0
+
+    @property
+    def confidence_interval(self) -> tuple[float, float]:
+        """95% interval of the mean profit, normal approximation"""
+        n = self.simulations
+        if n < 2:
+            return -math.inf, math.inf
+        variance = (self.profit_squares - n * self.avg_profit**2) / (n - 1)
+        margin = Z_95 * math.sqrt(max(variance, 0.0) / n)
+        return self.avg_profit - margin, self.avg_profit + margin
+
+
+@dataclass
+class SearchResult:
+    ranking: List[Evaluation]  # Best first
+    simulations_run: int  # Total simulations spent
+    rungs: int
+    history: List[List[Evaluation]] = field(default_factory=list)  # Survivors per rung
+
+    @property
+    def best(self) -> Evaluation:
+        return self.ranking[0]
+
+
+def _check_budget(min_simulations: int, max_simulations: int, eta: int):
+    if min_simulations < 1:
+        raise ValueError("min_simulations must be at least 1")
+    if max_simulations < 1:
+        raise ValueError("max_simulations must be at least 1")
+    if eta < 2:
+        raise ValueError("eta must be at least 2")
+
+
+class SuccessiveHalving:
+    """
+    Successive halving over a set of strategy configurations.
+
+    Every configuration first gets `min_simulations` simulations, then only
+    the best 1/eta of them (by average profit) move to the next rung, where
+    they are simulated eta times more, until one is left or `max_simulations`
+    is reached. New simulations at each rung use fresh seeds and are added
+    to the previous ones, so no simulation is ever run twice.
+    """
+
+    def __init__(
+        self,
+        strategy: str,
+        param_sets: List[Dict[str, Any]],
+        *,
+        min_simulations: int = 4,
+        max_simulations: int = 256,
+        eta: int = 3,
+        rounds: int = 300,
+        initial_bankroll: int = 74 * 100 * 2,
+        seed: int = 0,
+        workers: int | None = None,
+    ):
+        _check_budget(min_simulations, max_simulations, eta)
+        self.strategy = strategy
+        self.param_sets = param_sets
+        self.min_simulations = min_simulations
+        self.max_simulations = max_simulations
+        self.eta = eta
+        self.rounds = rounds
+        self.initial_bankroll = initial_bankroll
+        self.seed = seed
+        self.workers = workers or os.cpu_count() or 1
+
+    def _cell(self, params: Dict[str, Any], rung: int, simulations: int) -> SweepCell:
+        return SweepCell(
+            strategy=self.strategy,
+            params=params,
+            simulations=simulations,
+            rounds=self.rounds,
+            initial_bankroll=self.initial_bankroll,
+            # Distinct seeds per rung: the new simulations extend the old ones
+            seed=cell_seed(self.strategy, params, self.seed * 1_000_003 + rung),
+        )
+
+    def run(self) -> SearchResult:
+        evaluations = [Evaluation(params) for params in self.param_sets]
+        survivors = list(evaluations)
+        history = []
+        simulations_run = 0
+        rung = 0
+        target = min(self.min_simulations, self.max_simulations)
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            while True:
+                cells = [
+                    self._cell(evaluation.params, rung, target - evaluation.simulations)
+                    for evaluation in survivors
+                ]
+                for evaluation, result in zip(survivors, pool.map(run_cell, cells)):
+                    evaluation.add(result)
+                    evaluation.rung = rung
+                    simulations_run += result.simulations
+                survivors.sort(key=lambda e: e.avg_profit, reverse=True)
+                history.append(list(survivors))
+                if len(survivors) == 1 or target >= self.max_simulations:
+                    break
+                survivors = survivors[: max(1, len(survivors) // self.eta)]
+                target = min(target * self.eta, self.max_simulations)
+                rung += 1
+
+        ranking = sorted(
+            evaluations, key=lambda e: (e.rung, e.avg_profit), reverse=True
+        )
+        return SearchResult(ranking, simulations_run, rung + 1, history)
+
+
+def hyperband(
+    strategy: str,
+    space: Space,
+    *,
+    max_simulations: int = 81,
+    eta: int = 3,
+    sampler: Callable[[Space, int, int], List[Dict[str, Any]]] = random_samples,
+    seed: int = 0,
+    **kwargs,
+) -> SearchResult:
+    """
+    Hyperband: successive halving brackets trading the number of sampled
+    configurations against the simulations they start with, so a bad choice
+    of min_simulations does not ruin the search.
+    """
+    _check_budget(1, max_simulations, eta)
+    brackets = int(math.log(max_simulations) / math.log(eta) + 1e-9)
+    ranking = []
+    simulations_run = 0
+    history = []
+    for bracket in range(brackets, -1, -1):
+        configurations = math.ceil((brackets + 1) / (bracket + 1) * eta**bracket)
+        search = SuccessiveHalving(
+            strategy,
+            sampler(space, configurations, seed + bracket),
+            min_simulations=max(1, max_simulations // eta**bracket),
+            max_simulations=max_simulations,
+            eta=eta,
+            seed=seed,
+            **kwargs,
+        )
+        result = search.run()
+        simulations_run += result.simulations_run
+        ranking.extend(result.ranking)
+        history.extend(result.history)
+    ranking.sort(key=lambda e: (e.simulations, e.avg_profit), reverse=True)
+    return SearchResult(ranking, simulations_run, len(history), history)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Successive halving parameter search")
+    parser.add_argument("strategy", help="Registered strategy name, e.g. zero_timeout")
+    parser.add_argument("--grid", action="append", default=[], metavar="NAME=V1,V2")
+    parser.add_argument("--min-simulations", type=int, default=4)
+    parser.add_argument("--max-simulations", type=int, default=256)
+    parser.add_argument("--eta", type=int, default=3)
+    parser.add_argument("--rounds", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    values = {}
+    for option in args.grid:
+        name, _, text = option.partition("=")
+        values[name] = [parse_value(value) for value in text.split(",")]
+    param_sets = grid(values)
+
+    result = SuccessiveHalving(
+        args.strategy,
+        param_sets,
+        min_simulations=args.min_simulations,
+        max_simulations=args.max_simulations,
+        eta=args.eta,
+        rounds=args.rounds,
+        seed=args.seed,
+        workers=args.workers,
+    ).run()
+    exhaustive = len(param_sets) * args.max_simulations
+    print(
+        f"{len(param_sets)} configurations, {result.rungs} rungs, "
+        f"{result.simulations_run} simulations "
+        f"({result.simulations_run / exhaustive:.1%} of an exhaustive grid)"
+    )
+    for evaluation in result.ranking[: args.top]:
+        low, high = evaluation.confidence_interval
+        print(
+            f"{str(evaluation.params):<60} n={evaluation.simulations:<5} "
+            f"profit €{evaluation.avg_profit:+8.2f} [{low:+8.2f}, {high:+8.2f}] "
+            f"survival {evaluation.survival_rate:6.2f}%"
+        )
@@ -0,0 +1,271 @@
+import heapq
+import multiprocessing
+import os
+from array import array
+from collections import deque
+from dataclasses import dataclass, field
+from typing import List, Dict, Deque, Tuple, Iterator, Any
+
+from .player import Player, PlayerStatus
+from .table import Casino, CasinoTable, RoundRecord, ResultsLevel
+
+
+@dataclass
+class ShardedStats:
+    """Aggregate statistics of a sharded run"""
+
+    rounds: int = 0
+    players: int = 0
+    migrations: int = 0
+    rounds_played: int = 0  # Sum over players
+    total_profit: int = 0  # In cents
+    survivors: int = 0  # Players still seated at the end
+    # player_id -> (rounds played, initial bankroll, final bankroll)
+    per_player: Dict[str, Tuple[int, int, int]] = field(default_factory=dict)
+
+
+def _final_state(player: Player) -> Tuple[str, int, int, int, bool]:
+    """What finish() records of a player, and whether it is still seated"""
+    return (
+        player.player_id,
+        player.rounds_played,
+        player.get_initial_bankroll(),
+        player.get_current_bankroll(),
+        player.status == PlayerStatus.PLAYING,
+    )
+
+
+def _shard_worker(connection, tables: List[CasinoTable]):
+    """Shard process loop: runs a Casino made of the tables it owns"""
+    casino = Casino(tables=tables)
+    by_id = {table.table_id: table for table in tables}
+    table_index = {table.table_id: idx for idx, table in enumerate(tables)}
+    global_index = array("l")  # Shard Casino.players index -> coordinator index
+    while True:
+        command, payload = connection.recv()
+        if command == "round":
+            new_players, closing, results = payload
+            evicted = []
+            for table_id in closing:
+                table = by_id[table_id]
+                table.max_players = 0  # Never seats anybody again
+                for player in list(table.current_players.values()):
+                    casino.remove_player(player)
+                    player.status = PlayerStatus.WAITING
+                    evicted.append((global_index[player.index], player))
+            for index, player, table_id in new_players:
+                # Sit at the table the coordinator reserved, or wait if it is
+                # full after all
+                casino.add_player(player, table_index[table_id])
+                global_index.append(index)
+            if casino.has_waiting_players():
+                casino.assign_players()
+            round_results = casino.simulate_round(results)
+            if results != "full":
+                for summary in round_results.values():
+                    summary.players = array(
+                        "l", (global_index[i] for i in summary.players)
+                    )
+            free_seats = [
+                (table.table_id, table.max_players - len(table.current_players))
+                for table in tables
+            ]
+            connection.send((round_results, free_seats, evicted, casino.active_players))
+        elif command == "finish":
+            # Evicted players are reported by the coordinator, or by the shard
+            # they migrated to, players waiting for a seat here are not evicted
+            connection.send(
+                [
+                    _final_state(player)
+                    for player in casino.players
+                    if player.status != PlayerStatus.WAITING
+                ]
+                + [_final_state(player) for player in casino.waiting_players]
+            )
+        elif command == "stop":
+            connection.close()
+            return
+
+
+class ShardedCasino:
+    """
+    Casino split across worker processes.
+
+    The coordinator (this object) owns the waiting players and routes them to
+    shards with free seats matching their bet, each shard is a process running
+    a regular Casino on its own tables. When a table closes, its players come
+    back to the coordinator and migrate to another shard. Everything goes over
+    multiprocessing pipes, so a single machine without broker is enough.
+    """
+
+    def __init__(self, tables: List[CasinoTable], shards: int | None = None):
+        """
+        Args:
+            tables: Tables of the casino, split round-robin across the shards
+            shards: Number of worker processes, one per core by default
+        """
+        shards = min(shards or os.cpu_count() or 1, len(tables))
+        self.shards = [tables[shard::shards] for shard in range(shards)]
+        self._shard_of = {
+            table.table_id: shard
+            for shard, shard_tables in enumerate(self.shards)
+            for table in shard_tables
+        }
+        # table_id -> (min_bet, max_bet), and free seats as last reported
+        self._limits = {
+            table.table_id: (table.min_bet, table.max_bet) for table in tables
+        }
+        self._free_seats = {
+            table.table_id: table.max_players - len(table.current_players)
+            for table in tables
+        }
+        self._eligible: Dict[int, List[str]] = {}
+        self._waiting: Dict[int, Deque[Tuple[int, Player]]] = {}
+        self._closing: List[List[str]] = [[] for _ in self.shards]
+        self._connections = []
+        self._processes = []
+        self.player_ids: List[str] = []  # Coordinator index -> player_id
+        self.active_players = 0
+        self.stats = ShardedStats()
+
+    def add_player(self, player: Player):
+        self._queue(len(self.player_ids), player)
+        self.player_ids.append(player.player_id)
+
+    def _queue(self, index: int, player: Player):
+        bracket = player.strategy.base_bet
+        if bracket not in self._eligible:
+            self._eligible[bracket] = [
+                table_id
+                for table_id, (min_bet, max_bet) in self._limits.items()
+                if min_bet <= bracket <= max_bet
+            ]
+        self._waiting.setdefault(bracket, deque()).append((index, player))
+
+    def close_table(self, table_id: str):
+        """Close a table before the next round, its players migrate"""
+        self._closing[self._shard_of[table_id]].append(table_id)
+        self._free_seats[table_id] = 0
+        del self._limits[table_id]
+        for eligible in self._eligible.values():
+            if table_id in eligible:
+                eligible.remove(table_id)
+
+    def _route(self) -> List[List[Tuple[int, Player, str]]]:
+        """Reserve a free matching seat for as many waiting players as possible"""
+        routed = [[] for _ in self.shards]
+        # Heads of the bracket queues by arrival order, like Casino.assign_players
+        heads = [(queue[0][0], bracket) for bracket, queue in self._waiting.items()]
+        heapq.heapify(heads)
+        # Per bracket, position of the first eligible table that may have a seat
+        first_free: Dict[int, int] = {}
+        while heads:
+            _, bracket = heapq.heappop(heads)
+            eligible = self._eligible[bracket]
+            position = first_free.get(bracket, 0)
+            while position < len(eligible) and not self._free_seats[eligible[position]]:
+                position += 1
+            first_free[bracket] = position
+            if position == len(eligible):
+                # Every table of the bracket is full, it waits for a seat
+                continue
+            table_id = eligible[position]
+            self._free_seats[table_id] -= 1
+            queue = self._waiting[bracket]
+            index, player = queue.popleft()
+            routed[self._shard_of[table_id]].append((index, player, table_id))
+            if queue:
+                heapq.heappush(heads, (queue[0][0], bracket))
+            else:
+                del self._waiting[bracket]
+        return routed
+
+    def _start(self):
+        context = multiprocessing.get_context()
+        for shard_tables in self.shards:
+            parent_end, child_end = context.Pipe()
+            process = context.Process(
+                target=_shard_worker, args=(child_end, shard_tables), daemon=True
+            )
+            process.start()
+            child_end.close()
+            self._connections.append(parent_end)
+            self._processes.append(process)
+
+    def has_waiting_players(self) -> bool:
+        return bool(self._waiting)
+
+    def simulate_round(self, results: ResultsLevel = "summary") -> Dict[str, Any]:
+        """Route waiting players, play one round on every shard"""
+        if not self._connections:
+            self._start()
+        routed = self._route()
+        for shard, connection in enumerate(self._connections):
+            connection.send(("round", (routed[shard], self._closing[shard], results)))
+            self._closing[shard] = []
+
+        round_results = {}
+        self.active_players = 0
+        for connection in self._connections:
+            shard_results, free_seats, evicted, active = connection.recv()
+            round_results.update(shard_results)
+            for table_id, free in free_seats:
+                if table_id in self._limits:
+                    self._free_seats[table_id] = free
+            for index, player in evicted:
+                self._queue(index, player)
+            self.stats.migrations += len(evicted)
+            self.active_players += active
+        self.stats.rounds += 1
+        return round_results
+
+    def iter_rounds(
+        self,
+        max_rounds: int,
+        stop_when_empty: bool = True,
+        results: ResultsLevel = "summary",
+    ) -> Iterator[RoundRecord]:
+        """Same contract as Casino.iter_rounds"""
+        for round_number in range(1, max_rounds + 1):
+            if (
+                stop_when_empty
+                and round_number > 1
+                and not self.active_players
+                and not self.has_waiting_players()
+            ):
+                return
+            round_results = self.simulate_round(results)
+            yield RoundRecord(round_number, round_results, self.active_players)
+
+    def finish(self) -> ShardedStats:
+        """Collect the final state of every player and stop the shards"""
+        stats = self.stats
+        for connection in self._connections:
+            connection.send(("finish", None))
+        reports = [connection.recv() for connection in self._connections]
+        # Players still queued here: never routed, or evicted and not reseated
+        reports.append(
+            [
+                _final_state(player)
+                for queue in self._waiting.values()
+                for _, player in queue
+            ]
+        )
+        for report in reports:
+            for player_id, rounds, initial, bankroll, seated in report:
+                stats.per_player[player_id] = (rounds, initial, bankroll)
+                stats.rounds_played += rounds
+                stats.total_profit += bankroll - initial
+                stats.survivors += seated
+        stats.players = len(self.player_ids)
+        self.close()
+        return stats
+
+    def close(self):
+        for connection in self._connections:
+            connection.send(("stop", None))
+            connection.close()
+        for process in self._processes:
+            process.join()
+        self._connections = []
+        self._processes = []
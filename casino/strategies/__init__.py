@@ -0,0 +1,86 @@
+"""
+Strategy registry.
+
+Strategies are looked up by name and their module is only imported when a
+strategy is first built, so a process running one strategy does not pay for
+importing all of them. Other packages can register strategies under the
+"casino.strategies" entry point group, e.g. in their pyproject.toml:
+
+    [project.entry-points."casino.strategies"]
+    my_strategy = "my_package.strategies:MyStrategy"
+"""
+
+import importlib
+from typing import Dict, List
+
+ENTRY_POINT_GROUP = "casino.strategies"
+
+# Name -> "module:Class", modules relative to this package
+STRATEGIES: Dict[str, str] = {
+    "adaptive_distribution": ".adaptive_distribution:AdaptiveDistributionStrategy",
+    "column_pattern": ".column_pattern:ColumnPatternStrategy",
+    "corner_momentum": ".corner_momentum:CornerMomentumStrategy",
+    "dalembert": ".dalembert:DAlembertStrategy",
+    "dynamic_sectors": ".dynamic_sectors:DynamicSectorsStrategy",
+    "enhanced_zero_trend": ".enhanced_zero_trend:EnhancedZeroTrendStrategy",
+    "fibonacci": ".fibonacci:FibonacciStrategy",
+    "hot_cold_sectors": ".hot_cold_sectors:HotColdSectorsStrategy",
+    "hybrid_martingale": ".hybrid_martingale:HybridMartingaleStrategy",
+    "james_bond": ".james_bond:JamesBondStrategy",
+    "labouchere": ".labouchere:LabouchereStrategy",
+    "martingale": ".martingale:MartingaleStrategy",
+    "multi_pattern": ".multi_pattern:MultiPatternStrategy",
+    "opposite_sectors": ".opposite_sectors:OppositeSectorsStrategy",
+    "paroli": ".paroli:ParoliStrategy",
+    "progressive_coverage": ".progressive_coverage:ProgressiveCoverageStrategy",
+    "sector_chain": ".sector_chain:SectorChainStrategy",
+    "sequence": ".sequence:SequenceStrategy",
+    "split_pattern": ".split_pattern:SplitPatternStrategy",
+    "thirds_coverage": ".thirds_coverage:ThirdsCoverageStrategy",
+    "wheel_sections": ".wheel_sections:WheelSectionsStrategy",
+    "zero_always": ".zero_always:ZeroAlwaysStrategy",
+    "zero_and_half": ".zero_and_half:ZeroAndHalfStrategy",
+    "zero_neighbours": ".zero_neighbours:ZeroNeighboursStrategy",
+    "zero_simple": ".zero_simple:ZeroSimpleStrategy",
+    "zero_timeout": ".zero_timeout:ZeroTimeoutStrategy",
+    "zero_trend": ".zero_trend:ZeroTrendStrategy",
+}
+
+_classes: Dict[str, type] = {}
+_plugins_loaded = False
+
+
+def _load_plugins():
+    """Add the entry point strategies, only done on a name miss"""
+    global _plugins_loaded
+    _plugins_loaded = True
+    from importlib.metadata import entry_points
+
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        STRATEGIES.setdefault(entry_point.name, entry_point.value)
+
+
+def available_strategies() -> List[str]:
+    if not _plugins_loaded:
+        _load_plugins()
+    return sorted(STRATEGIES)
+
+
+def get_strategy_class(name: str) -> type:
+    """Strategy class registered under `name`, imported on first use"""
+    strategy_class = _classes.get(name)
+    if strategy_class is not None:
+        return strategy_class
+    if name not in STRATEGIES and not _plugins_loaded:
+        _load_plugins()
+    if name not in STRATEGIES:
+        raise KeyError(f"Unknown strategy {name!r}")
+    module_name, class_name = STRATEGIES[name].split(":")
+    module = importlib.import_module(module_name, package=__name__)
+    strategy_class = _classes[name] = getattr(module, class_name)
+    return strategy_class
+
+
+def create_strategy(name: str, **kwargs):
+    """Build the strategy registered under `name` with the given arguments"""
+    return get_strategy_class(name)(**kwargs)
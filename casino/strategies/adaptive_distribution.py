@@ -1,7 +1,7 @@
-from collections import deque
 from typing import List, Dict, Set
 
-from .base import Strategy, PlacedBet
+from .base import Strategy, PlacedBet, SpinOutcome
+from .spin_stats import WHEEL_SEQUENCE
 
 
 class AdaptiveDistributionStrategy(Strategy):
@@ -11,6 +11,8 @@ class AdaptiveDistributionStrategy(Strategy):
     in number frequencies and adapts betting patterns accordingly.
     """
 
+    _state_fields = Strategy._state_fields + ("confidence_threshold",)
+
     def __init__(
         self,
         base_bet: int = 100,
@@ -19,50 +21,35 @@ class AdaptiveDistributionStrategy(Strategy):
         confidence_threshold: float = 0.15,
     ):
         super().__init__(base_bet, max_progression)
-        self.history = deque(maxlen=history_size)
+        # Single pocket arcs keep the numbers bucketed by count
+        self._track_spins(history_size, arcs=(1,))
         self.confidence_threshold = confidence_threshold
         self.expected_probability = 1 / 37
-        self.number_frequencies: Dict[int, float] = {i: 0.0 for i in range(37)}
         self.bet_distribution = {"straight": 0.4, "corner": 0.6}
 
+    @property
+    def number_frequencies(self) -> Dict[int, float]:
+        """Frequency of each number in the window"""
+        total_spins = self.spin_stats.length(self.spin_window)
+        counts = self.spin_stats.number_counts(self.spin_window)
+        return {
+            num: counts[num] / total_spins if total_spins else 0.0 for num in range(37)
+        }
+
     def _calculate_chi_squared(self) -> float:
         """Calculate chi-squared statistic for current distribution"""
-        if not self.history:
-            return 0.0
-
-        observed = [0] * 37
-        for num in self.history:
-            observed[num] += 1
-
-        n = len(self.history)
-        expected = n * self.expected_probability
-
-        chi_squared = sum((obs - expected) ** 2 / expected for obs in observed)
-
-        return chi_squared
+        return self.spin_stats.chi_squared(self.spin_window)
 
     def _identify_underrepresented_numbers(self) -> Set[int]:
         """Identify numbers appearing less frequently than expected"""
-        if not self.history:
+        total_spins = self.spin_stats.length(self.spin_window)
+        if not total_spins:
             return set(range(1, 37))  # Exclude 0 for corner bets
 
-        # Update frequencies
-        total_spins = len(self.history)
-        frequencies = {i: 0 for i in range(37)}
-        for num in self.history:
-            frequencies[num] += 1
-
-        # Calculate probabilities
-        for num in frequencies:
-            self.number_frequencies[num] = frequencies[num] / total_spins
-
         # Find underrepresented numbers, excluding zero for corner bets
-        return {
-            num
-            for num, freq in self.number_frequencies.items()
-            if freq < (self.expected_probability - self.confidence_threshold)
-            and num > 0
-        }
+        limit = total_spins * (self.expected_probability - self.confidence_threshold)
+        positions = self.spin_stats.arcs_below(self.spin_window, 1, limit)
+        return {WHEEL_SEQUENCE[pos] for pos in positions} - {0}
 
     @staticmethod
     def _get_valid_corner_bets(numbers: Set[int]) -> List[str]:
@@ -88,7 +75,7 @@ class AdaptiveDistributionStrategy(Strategy):
         if 0 in target_numbers:
             zero_bet = self.validate_bet_amount(int(total_bet * 0.1))
             if zero_bet > 0:
-                bets.append(PlacedBet(bet_type="straight_0", amount=zero_bet))
+                bets.append(PlacedBet.of(bet_type="straight_0", amount=zero_bet))
             total_bet -= zero_bet
             target_numbers.remove(0)
 
@@ -101,7 +88,7 @@ class AdaptiveDistributionStrategy(Strategy):
 
             if bet_per_corner > 0:
                 for corner in corner_bets:
-                    bets.append(PlacedBet(bet_type=corner, amount=bet_per_corner))
+                    bets.append(PlacedBet.of(bet_type=corner, amount=bet_per_corner))
 
         remaining_bet = total_bet - sum(bet.amount for bet in bets)
         if remaining_bet > 0 and target_numbers:
@@ -111,17 +98,19 @@ class AdaptiveDistributionStrategy(Strategy):
             if bet_per_number > 0:
                 for num in target_numbers:
                     bets.append(
-                        PlacedBet(bet_type=f"straight_{num}", amount=bet_per_number)
+                        PlacedBet.of(bet_type=f"straight_{num}", amount=bet_per_number)
                     )
 
         return bets
 
-    def update_after_spin(self, *, won: bool, number: int):
+    def update_after_spin(
+        self, *, won: bool, number: int, outcome: SpinOutcome | None = None
+    ):
         """Update distribution tracking"""
-        super().update_after_spin(won=won, number=number)
+        super().update_after_spin(won=won, number=number, outcome=outcome)
 
         if number is not None:
-            self.history.append(number)
+            self._record_spin(number)
 
             # Adjust confidence threshold based on chi-squared test
             if self._calculate_chi_squared() > 43.77:  # 95% confidence level
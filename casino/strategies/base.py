@@ -1,17 +1,94 @@
 from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
 from dataclasses import dataclass
-from typing import List
+from typing import List, Dict, Tuple, Hashable, Sequence, Any
 
+from .spin_stats import SpinStats, SpinRing
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class PlacedBet:
     bet_type: str
     amount: int  # Amount in cents
 
+    @staticmethod
+    def of(bet_type: str, amount: int) -> "PlacedBet":
+        """Shared instance for this bet, strategies reuse a handful of them"""
+        key = (bet_type, amount)
+        bet = _BETS_CACHE.get(key)
+        if bet is None:
+            if len(_BETS_CACHE) >= _BETS_CACHE_SIZE:
+                _BETS_CACHE.clear()
+            bet = _BETS_CACHE[key] = PlacedBet(bet_type, amount)
+        return bet
+
+
+_BETS_CACHE: Dict[Tuple[str, int], PlacedBet] = {}
+_BETS_CACHE_SIZE = 4096
+
+
+@dataclass(slots=True)
+class SpinOutcome:
+    """Settlement of the bets returned by calculate_bets(), in the same order"""
+
+    bets: Sequence[PlacedBet]
+    won_mask: int  # Bit i set when bets[i] won
+    profits: List[int]  # Net profit of every bet in cents, lost bets negative
+
+    def won(self, i: int) -> bool:
+        return bool(self.won_mask >> i & 1)
+
+
+def _copy_value(value: Any) -> Any:
+    """Copy of a state value: containers are copied, nested ones included"""
+    if type(value) is dict:
+        return {key: _copy_value(item) for key, item in value.items()}
+    if type(value) in (list, deque, set, SpinRing):
+        return value.copy()  # Items are numbers or strings
+    return value
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable snapshot of a state value"""
+    if type(value) is dict:
+        return tuple((key, _freeze(item)) for key, item in value.items())
+    if type(value) in (list, deque, SpinRing):
+        return tuple(value)
+    if type(value) is set:
+        return frozenset(value)
+    return value
+
+
+def _thaw(snapshot: Any, like: Any) -> Any:
+    """Value of the same kind as `like` from a _freeze snapshot"""
+    if type(like) is dict:
+        return {key: _thaw(item, like.get(key)) for key, item in snapshot}
+    if type(like) is deque:
+        return deque(snapshot, maxlen=like.maxlen)
+    if type(like) is SpinRing:
+        return SpinRing(like.capacity, snapshot)
+    if type(like) is set or type(snapshot) is frozenset:
+        return set(snapshot)
+    if type(like) is list or type(snapshot) is tuple:
+        return list(snapshot)
+    return snapshot
+
 
 class Strategy(ABC):
     """Abstract base class for all roulette strategies"""
 
+    # Spins looked at by the strategy, 0 when it ignores past spins
+    spin_window = 0
+    spin_arcs: Tuple[int, ...] = ()  # Widths of the wheel arcs it counts
+    spin_stats: SpinStats | None = None
+    _owns_spin_stats = False
+    # Whether update_after_spin() reads `outcome`, tables only settle the bets
+    # one by one for the strategies that do
+    uses_outcome = False
+    # Attributes changed by update_after_spin, the only ones clone() copies:
+    # the others (sectors, chains, bet patterns...) are shared with the clone
+    _state_fields: Tuple[str, ...] = ("consecutive_losses",)
+
     @staticmethod
     def validate_bet_amount(amount: int) -> int:
         """Round bet amount to nearest 50 or 100 cents"""
@@ -28,13 +105,149 @@ class Strategy(ABC):
         self.consecutive_losses = 0
 
     @abstractmethod
-    def calculate_bets(self) -> List[PlacedBet]:
+    def calculate_bets(self) -> Sequence[PlacedBet]:
         """Calculate bets for the next round"""
         pass
 
-    def update_after_spin(self, *, won: bool, number: int):
-        """Update strategy state after a spin"""
+    def update_after_spin(
+        self, *, won: bool, number: int, outcome: SpinOutcome | None = None
+    ):
+        """
+        Update strategy state after a spin. `outcome` tells which of the bets
+        won when the caller settled them, like the casino tables do for the
+        strategies setting uses_outcome.
+        """
         if won:
             self.consecutive_losses = 0
         else:
             self.consecutive_losses += 1
+
+    def _track_spins(self, window: int, arcs: Tuple[int, ...] = ()):
+        """Count the last `window` spins, privately until bound to a table"""
+        self.spin_window = window
+        self.spin_arcs = arcs
+        self.spin_stats = SpinStats(window)
+        for width in arcs:
+            self.spin_stats.add_arcs(window, width)
+        self._owns_spin_stats = True
+
+    def _record_spin(self, number: int):
+        # A table-bound SpinStats is fed once per spin by the table itself
+        if self._owns_spin_stats:
+            self.spin_stats.push(number)
+
+    def bind_spin_stats(self, stats: SpinStats):
+        """
+        Read the spins from the shared stats of the table the player sits at.
+        The strategy then sees the last spins of the table, like the board
+        next to the wheel: spins from before the player sat down and from the
+        rounds it sat out count, the spins it counted privately are dropped.
+        """
+        if not self.spin_window or self.spin_stats is stats:
+            return
+        if not self._owns_spin_stats:
+            self._release_spin_stats()
+        self._hold_spin_stats(stats)
+        self.spin_stats = stats
+        self._owns_spin_stats = False
+
+    def unbind_spin_stats(self):
+        """Count privately again once the player left the table, from its last spins"""
+        if not self.spin_window or self._owns_spin_stats:
+            return
+        spins = bytes(self.spin_stats.last(self.spin_window))
+        self._release_spin_stats()
+        self._track_spins(self.spin_window, self.spin_arcs)
+        for number in spins:
+            self.spin_stats.push(number)
+
+    def _hold_spin_stats(self, stats: SpinStats):
+        stats.add_window(self.spin_window)
+        for width in self.spin_arcs:
+            stats.add_arcs(self.spin_window, width)
+
+    def _release_spin_stats(self):
+        # Undo _hold_spin_stats so the table stops counting unread windows
+        for width in self.spin_arcs:
+            self.spin_stats.remove_arcs(self.spin_window, width)
+        self.spin_stats.remove_window(self.spin_window)
+
+    def clone(self) -> "Strategy":
+        """
+        Copy following the original independently from now on. Mutable state
+        is copied, configuration and lookup tables are shared. A private
+        SpinStats is copied, a table-bound one is shared with the clone.
+        """
+        clone = object.__new__(type(self))
+        state = clone.__dict__
+        state.update(self.__dict__)
+        for name in self._state_fields:
+            state[name] = _copy_value(state[name])
+        if self._owns_spin_stats:
+            clone.spin_stats = self.spin_stats.copy()
+        elif self.spin_window:
+            self._hold_spin_stats(self.spin_stats)
+        return clone
+
+    def get_state(self) -> Tuple:
+        """
+        Hashable tuple of the mutable state, values in _state_fields order,
+        then the spins of a private SpinStats (None when table-bound)
+        """
+        state = self.__dict__
+        spins = None
+        if self._owns_spin_stats:
+            spins = tuple(self.spin_stats.last(len(self.spin_stats)))
+        return (*(_freeze(state[name]) for name in self._state_fields), spins)
+
+    def set_state(self, snapshot: Tuple):
+        """Restore a state returned by get_state() of an instance of this class"""
+        *values, spins = snapshot
+        state = self.__dict__
+        for name, value in zip(self._state_fields, values):
+            state[name] = _thaw(value, state[name])
+        if spins is not None and self._owns_spin_stats:
+            self._track_spins(self.spin_window, self.spin_arcs)
+            for number in spins:
+                self.spin_stats.push(number)
+
+
+class PlanCachedStrategy(Strategy):
+    """
+    Strategy whose bets only depend on a small state, plan_key(). The bets of
+    every key are built once and shared by every instance of the class:
+    calculate_bets() returns _cached_plan().
+    """
+
+    # Plans kept per class, least recently used dropped first
+    plan_cache_size = 1024
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._plan_cache = OrderedDict()  # plan_key() -> bets
+
+    @abstractmethod
+    def plan_key(self) -> Hashable:
+        """Everything the bets depend on"""
+        pass
+
+    @abstractmethod
+    def _build_plan(self) -> List[PlacedBet]:
+        """Bets for plan_key()"""
+        pass
+
+    def _cached_plan(self) -> Tuple[PlacedBet, ...]:
+        """Bets of the current plan_key(), built on first use"""
+        cache = self._plan_cache
+        key = self.plan_key()
+        plan = cache.get(key)
+        if plan is None:
+            plan = cache[key] = tuple(self._build_plan())
+            if len(cache) > self.plan_cache_size:
+                cache.popitem(last=False)
+        elif len(cache) > 1:
+            try:
+                cache.move_to_end(key)
+            except KeyError:  # Evicted by another thread in between
+                pass
+        return plan
@@ -0,0 +1,299 @@
+"""
+Vectorized stepping of many instances of the same progression strategy.
+
+Requires NumPy. A batch copies the state of its strategies into arrays,
+steps all of them with array operations and writes the state back with
+write_back() when the strategy objects are needed again.
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Dict, Sequence, Tuple, Type
+
+import numpy as np
+
+from .base import Strategy, PlacedBet
+from .dalembert import DAlembertStrategy
+from .fibonacci import FibonacciStrategy
+from .labouchere import LabouchereStrategy
+from .martingale import MartingaleStrategy
+from .paroli import ParoliStrategy
+from .zero_simple import ZeroSimpleStrategy
+
+
+def validate_bet_amounts(amounts: np.ndarray) -> np.ndarray:
+    """Strategy.validate_bet_amount over an array"""
+    remainder = amounts % 100
+    rounded = np.where(
+        remainder >= 50, amounts + (100 - remainder), amounts - remainder
+    )
+    return np.where(amounts <= 0, 100, rounded)
+
+
+class StrategyBatch(ABC):
+    """
+    Array-backed state of strategies of one class.
+
+    calculate_bets_batch() returns, for every instance, an index into
+    bet_types and an amount (0 when the instance does not bet this round).
+    update_batch() applies one spin to every instance.
+    """
+
+    strategy_class: Type[Strategy]
+    # Extra mutable attributes copied to and from the strategies
+    state_fields: Tuple[str, ...] = ()
+
+    def __init__(self, strategies: Sequence[Strategy]):
+        self.strategies = list(strategies)
+        for strategy in self.strategies:
+            if type(strategy) is not self.strategy_class:
+                raise TypeError(
+                    f"{type(self).__name__} only steps {self.strategy_class.__name__}"
+                )
+        self.base_bet = self._column("base_bet")
+        self.max_progression = self._column("max_progression")
+        self.consecutive_losses = self._column("consecutive_losses")
+        for name in self.state_fields:
+            setattr(self, name, self._column(name))
+        self.bet_types, self.bet_ids = self._bet_ids()
+
+    def __len__(self) -> int:
+        return len(self.strategies)
+
+    def _column(self, name: str) -> np.ndarray:
+        return np.array([getattr(s, name) for s in self.strategies], dtype=np.int64)
+
+    def _bet_type(self, strategy: Strategy) -> str:
+        return strategy.bet_type
+
+    def _bet_ids(self) -> Tuple[List[str], np.ndarray]:
+        bet_types: Dict[str, int] = {}
+        ids = [
+            bet_types.setdefault(self._bet_type(strategy), len(bet_types))
+            for strategy in self.strategies
+        ]
+        return list(bet_types), np.array(ids, dtype=np.int64)
+
+    def calculate_bets_batch(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(bet ids, amounts) of the next round for every instance"""
+        amounts = self._amounts()
+        return self.bet_ids, amounts
+
+    def bets(self, i: int) -> List[PlacedBet]:
+        """Bets of one instance, as calculate_bets() would return them"""
+        bet_ids, amounts = self.calculate_bets_batch()
+        if not amounts[i]:
+            return []
+        return [PlacedBet.of(self.bet_types[bet_ids[i]], int(amounts[i]))]
+
+    @abstractmethod
+    def _amounts(self) -> np.ndarray:
+        """Amount of the next bet of every instance, 0 to skip the round"""
+        pass
+
+    def update_batch(self, won_mask: np.ndarray, number: int):
+        """Apply one spin to every instance, like Strategy.update_after_spin"""
+        self.consecutive_losses = np.where(won_mask, 0, self.consecutive_losses + 1)
+
+    def write_back(self):
+        """Store the batch state back into the strategy objects"""
+        names = ("consecutive_losses",) + self.state_fields
+        columns = [getattr(self, name).tolist() for name in names]
+        for i, strategy in enumerate(self.strategies):
+            for name, column in zip(names, columns):
+                setattr(strategy, name, column[i])
+
+
+class MartingaleBatch(StrategyBatch):
+    strategy_class = MartingaleStrategy
+
+    def _bet_type(self, strategy: MartingaleStrategy) -> str:
+        return strategy.color
+
+    def _amounts(self) -> np.ndarray:
+        steps = np.minimum(self.consecutive_losses, self.max_progression)
+        amounts = np.minimum(self.base_bet * (1 << steps), 2000)
+        return validate_bet_amounts(amounts)
+
+
+class DAlembertBatch(StrategyBatch):
+    strategy_class = DAlembertStrategy
+    state_fields = ("current_level",)
+
+    def _amounts(self) -> np.ndarray:
+        amounts = validate_bet_amounts(
+            self.base_bet + self.current_level * (self.base_bet // 2)
+        )
+        return np.minimum(np.maximum(self.base_bet, amounts), 2000)
+
+    def update_batch(self, won_mask: np.ndarray, number: int):
+        # Like DAlembertStrategy, consecutive_losses is left untouched
+        self.current_level = np.where(
+            won_mask,
+            np.maximum(0, self.current_level - 1),
+            np.minimum(self.max_progression, self.current_level + 1),
+        )
+
+
+class FibonacciBatch(StrategyBatch):
+    strategy_class = FibonacciStrategy
+    state_fields = ("current_position",)
+
+    def __init__(self, strategies: Sequence[FibonacciStrategy]):
+        super().__init__(strategies)
+        # Every instance sequence is a prefix of the longest one
+        longest = max(strategies, key=lambda s: len(s.sequence), default=None)
+        self.sequence = np.array(longest.sequence if longest else [1], dtype=np.int64)
+
+    def _amounts(self) -> np.ndarray:
+        amounts = validate_bet_amounts(
+            self.base_bet * self.sequence[self.current_position]
+        )
+        return np.where(amounts >= 50, amounts, 0)
+
+    def update_batch(self, won_mask: np.ndarray, number: int):
+        self.current_position = np.where(
+            won_mask,
+            np.maximum(0, self.current_position - 2),
+            np.minimum(self.max_progression, self.current_position + 1),
+        )
+        super().update_batch(won_mask, number)
+
+
+class ParoliBatch(StrategyBatch):
+    strategy_class = ParoliStrategy
+    state_fields = ("consecutive_wins",)
+
+    def _amounts(self) -> np.ndarray:
+        steps = np.minimum(self.consecutive_wins, self.max_progression)
+        return validate_bet_amounts(self.base_bet * (1 << steps))
+
+    def update_batch(self, won_mask: np.ndarray, number: int):
+        wins = self.consecutive_wins + 1
+        wins[wins >= self.max_progression] = 0
+        self.consecutive_wins = np.where(won_mask, wins, 0)
+        super().update_batch(won_mask, number)
+
+
+class LabouchereBatch(StrategyBatch):
+    """
+    The sequences are rows of a matrix, each one stored in the columns
+    [start, end) of its row and moved back to column 0 when it reaches the
+    last column.
+    """
+
+    strategy_class = LabouchereStrategy
+
+    def __init__(self, strategies: Sequence[LabouchereStrategy]):
+        super().__init__(strategies)
+        self.sequence_length = self._column("sequence_length")
+        lengths = [len(strategy.sequence) for strategy in self.strategies]
+        capacity = max(lengths + [1]) * 2
+        self.sequences = np.zeros((len(self.strategies), capacity), dtype=np.int64)
+        for i, strategy in enumerate(self.strategies):
+            self.sequences[i, : lengths[i]] = strategy.sequence
+        self.start = np.zeros(len(self.strategies), dtype=np.int64)
+        self.end = np.array(lengths, dtype=np.int64)
+        self._rows = np.arange(len(self.strategies))
+
+    def _ends(self) -> np.ndarray:
+        """First plus last number of every sequence, the first one if alone"""
+        first = self.sequences[self._rows, self.start]
+        last = self.sequences[self._rows, np.maximum(self.end - 1, 0)]
+        return np.where(self.end - self.start >= 2, first + last, first)
+
+    def _reset(self, mask: np.ndarray):
+        self.start[mask] = 0
+        self.end[mask] = self.sequence_length[mask]
+        columns = np.arange(self.sequences.shape[1])
+        self.sequences[mask] = columns < self.sequence_length[mask, None]
+
+    def _amounts(self) -> np.ndarray:
+        self._reset(self.end == self.start)
+        amounts = validate_bet_amounts(self.base_bet * self._ends())
+        return np.where(amounts > 0, amounts, 0)
+
+    def _make_room(self):
+        """Move the full rows to column 0, grow the matrix if still needed"""
+        full = self.end == self.sequences.shape[1]
+        if not full.any():
+            return
+        lengths = self.end - self.start
+        capacity = self.sequences.shape[1]
+        if (lengths[full] >= capacity).any():
+            self.sequences = np.pad(self.sequences, ((0, 0), (0, capacity)))
+        for i in np.flatnonzero(full):
+            start, end = self.start[i], self.end[i]
+            self.sequences[i, : lengths[i]] = self.sequences[i, start:end]
+        self.start[full] = 0
+        self.end[full] = lengths[full]
+
+    def update_batch(self, won_mask: np.ndarray, number: int):
+        won_mask = np.asarray(won_mask, dtype=bool)
+        lengths = self.end - self.start
+        lost_amounts = self._ends()
+        cancel = won_mask & (lengths >= 2)
+        self.start[cancel] += 1
+        self.end[cancel] -= 1
+
+        lost = ~won_mask
+        self._make_room()
+        self.sequences[self._rows[lost], self.end[lost]] = lost_amounts[lost]
+        self.end[lost] += 1
+
+        self._reset(self.end == self.start)
+        super().update_batch(won_mask, number)
+
+    def write_back(self):
+        super().write_back()
+        for i, strategy in enumerate(self.strategies):
+            strategy.sequence = self.sequences[i, self.start[i] : self.end[i]].tolist()
+
+
+class ZeroSimpleBatch(StrategyBatch):
+    strategy_class = ZeroSimpleStrategy
+    state_fields = ("wait_before_bet", "non_zero_count", "is_betting")
+
+    def _bet_type(self, strategy: ZeroSimpleStrategy) -> str:
+        return "straight_0"
+
+    def _amounts(self) -> np.ndarray:
+        return np.where(self.is_betting, self.base_bet, 0)
+
+    def update_batch(self, won_mask: np.ndarray, number: int):
+        super().update_batch(won_mask, number)
+        if number:
+            self.non_zero_count = self.non_zero_count + 1
+            self.is_betting = self.is_betting | (
+                self.non_zero_count >= self.wait_before_bet
+            )
+        else:
+            self.non_zero_count = np.zeros_like(self.non_zero_count)
+            self.is_betting = np.zeros_like(self.is_betting)
+
+    def write_back(self):
+        super().write_back()
+        for strategy in self.strategies:
+            strategy.is_betting = bool(strategy.is_betting)
+
+
+BATCH_CLASSES: Dict[Type[Strategy], Type[StrategyBatch]] = {
+    batch.strategy_class: batch
+    for batch in (
+        MartingaleBatch,
+        DAlembertBatch,
+        FibonacciBatch,
+        ParoliBatch,
+        LabouchereBatch,
+        ZeroSimpleBatch,
+    )
+}
+
+
+def make_batch(strategies: Sequence[Strategy]) -> StrategyBatch:
+    """Batch of strategies that all share one of the supported classes"""
+    if not strategies:
+        raise ValueError("Cannot batch an empty list of strategies")
+    strategy_class = type(strategies[0])
+    if strategy_class not in BATCH_CLASSES:
+        raise TypeError(f"No batch implementation for {strategy_class.__name__}")
+    return BATCH_CLASSES[strategy_class](strategies)
@@ -1,6 +1,5 @@
 from typing import List, Set
-from collections import deque
-from .base import Strategy, PlacedBet
+from .base import Strategy, PlacedBet, SpinOutcome
 
 
 class ColumnPatternStrategy(Strategy):
@@ -10,11 +9,13 @@ class ColumnPatternStrategy(Strategy):
     Uses progressive betting on columns showing potential patterns.
     """
 
+    _state_fields = Strategy._state_fields + ("current_columns", "column_streaks")
+
     def __init__(
         self, base_bet: int = 100, max_progression: int = 4, history_size: int = 20
     ):
         super().__init__(base_bet, max_progression)
-        self.history = deque(maxlen=history_size)
+        self._track_spins(history_size)
         self.columns = {
             1: set(range(1, 37, 3)),  # 1, 4, 7, ..., 34
             2: set(range(2, 37, 3)),  # 2, 5, 8, ..., 35
@@ -32,15 +33,12 @@ class ColumnPatternStrategy(Strategy):
 
     def _analyze_patterns(self) -> Set[int]:
         """Analyze column patterns to determine the best columns to bet on"""
-        if not self.history:
+        if not self.spin_stats.length(self.spin_window):
             return {1, 2}
 
-        # Count recent hits for each column
-        column_hits = {1: 0, 2: 0, 3: 0}
-        for num in self.history:
-            col = self._get_column(num)
-            if col > 0:  # Ignore zero
-                column_hits[col] += 1
+        # Count recent hits for each column, ignoring zero
+        counts = self.spin_stats.column_counts(self.spin_window)
+        column_hits = {1: counts[1], 2: counts[2], 3: counts[3]}
 
         # Find the two columns with the least hits (cold columns)
         sorted_columns = sorted(column_hits.items(), key=lambda x: x[1])
@@ -60,17 +58,19 @@ class ColumnPatternStrategy(Strategy):
         bet_per_column = current_bet // len(self.current_columns)
 
         return [
-            PlacedBet(bet_type=f"column_{col}", amount=bet_per_column)
+            PlacedBet.of(bet_type=f"column_{col}", amount=bet_per_column)
             for col in self.current_columns
             if bet_per_column > 0
         ]
 
-    def update_after_spin(self, *, won: bool, number: int):
+    def update_after_spin(
+        self, *, won: bool, number: int, outcome: SpinOutcome | None = None
+    ):
         """Update strategy state and pattern analysis"""
-        super().update_after_spin(won=won, number=number)
+        super().update_after_spin(won=won, number=number, outcome=outcome)
 
         if number is not None:
-            self.history.append(number)
+            self._record_spin(number)
             col = self._get_column(number)
 
             # Update column streaks
@@ -1,6 +1,5 @@
 from typing import List, Set, Dict
-from collections import deque
-from .base import Strategy, PlacedBet
+from .base import Strategy, PlacedBet, SpinOutcome
 
 
 class CornerMomentumStrategy(Strategy):
@@ -19,7 +18,7 @@ class CornerMomentumStrategy(Strategy):
     ):
         super().__init__(base_bet, max_progression)
         self.momentum_threshold = momentum_threshold
-        self.history = deque(maxlen=history_size)
+        self._track_spins(history_size)
         self.corners = self._initialize_corners()
         self.quadrants = self._initialize_quadrants()
         self.active_corners: Set[str] = set()
@@ -58,15 +57,15 @@ class CornerMomentumStrategy(Strategy):
 
     def _analyze_momentum(self) -> List[str]:
         """Analyze quadrant momentum and select best corners"""
-        if not self.history:
+        if not self.spin_stats.length(self.spin_window):
             return []
 
         # Count quadrant hits
-        quadrant_hits = {name: 0 for name in self.quadrants}
-        for num in self.history:
-            for quad_name, quad_numbers in self.quadrants.items():
-                if num in quad_numbers:
-                    quadrant_hits[quad_name] += 1
+        counts = self.spin_stats.number_counts(self.spin_window)
+        quadrant_hits = {
+            quad_name: sum(counts[num] for num in quad_numbers)
+            for quad_name, quad_numbers in self.quadrants.items()
+        }
 
         # Find hot quadrants
         hot_quadrants = [
@@ -95,7 +94,7 @@ class CornerMomentumStrategy(Strategy):
         if not active_corners:
             # Default to corners around most recent numbers if no momentum
             recent_corners = set()
-            for num in list(self.history)[-3:]:
+            for num in self.spin_stats.last(min(3, self.spin_window)):
                 corner_key = self._get_corner_key(num)
                 if corner_key:
                     recent_corners.add(corner_key)
@@ -111,17 +110,19 @@ class CornerMomentumStrategy(Strategy):
         )
 
         return [
-            PlacedBet(bet_type=f"corner_{corner}", amount=bet_per_corner)
+            PlacedBet.of(bet_type=f"corner_{corner}", amount=bet_per_corner)
             for corner in active_corners
             if bet_per_corner >= 50
         ]
 
-    def update_after_spin(self, *, won: bool, number: int):
+    def update_after_spin(
+        self, *, won: bool, number: int, outcome: SpinOutcome | None = None
+    ):
         """Update strategy state and momentum tracking"""
-        super().update_after_spin(won=won, number=number)
+        super().update_after_spin(won=won, number=number, outcome=outcome)
 
         if number is not None:
-            self.history.append(number)
+            self._record_spin(number)
             # Reset if we hit zero
             if number == 0:
                 self.active_corners.clear()
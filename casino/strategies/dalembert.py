@@ -1,9 +1,11 @@
 from typing import List
 
-from .base import PlacedBet, Strategy
+from .base import PlacedBet, Strategy, SpinOutcome
 
 
 class DAlembertStrategy(Strategy):
+    _state_fields = Strategy._state_fields + ("current_level",)
+
     def __init__(
         self, base_bet: int = 100, max_progression: int = 8, bet_type: str = "red"
     ):
@@ -16,9 +18,11 @@ class DAlembertStrategy(Strategy):
             self.base_bet + (self.current_level * (self.base_bet // 2))
         )
         current_bet = min(max(self.base_bet, current_bet), 2000)  # Cap at 2000 cents
-        return [PlacedBet(bet_type=self.bet_type, amount=current_bet)]
+        return [PlacedBet.of(bet_type=self.bet_type, amount=current_bet)]
 
-    def update_after_spin(self, *, won: bool, number: int):
+    def update_after_spin(
+        self, *, won: bool, number: int, outcome: SpinOutcome | None = None
+    ):
         if won:
             self.current_level = max(0, self.current_level - 1)
         else:
@@ -1,7 +1,7 @@
-from collections import deque
 from typing import List, Set
 
-from .base import Strategy, PlacedBet
+from .base import Strategy, PlacedBet, SpinOutcome
+from .spin_stats import WHEEL_POSITION
 
 
 class DynamicSectorsStrategy(Strategy):
@@ -11,12 +11,14 @@ class DynamicSectorsStrategy(Strategy):
     and wheel momentum analysis.
     """
 
+    _state_fields = Strategy._state_fields + ("current_focus",)
+
     def __init__(
         self, base_bet: int = 100, max_progression: int = 4, momentum_size: int = 8
     ):
         super().__init__(base_bet, max_progression)
         self.momentum_size = momentum_size
-        self.history = deque(maxlen=20)
+        self._track_spins(20)
         # fmt: off
         self.wheel_sequence = [
             0, 32, 15, 19, 4, 21, 2, 25, 17, 34, 6, 27, 13, 36, 11, 30, 8, 23, 10, 5,
@@ -27,10 +29,10 @@ class DynamicSectorsStrategy(Strategy):
 
     def _get_neighbors(self, number: int, radius: int = 2) -> Set[int]:
         """Get neighboring numbers on the wheel"""
-        if number not in self.wheel_sequence:
+        if not 0 <= number <= 36:
             return set()
 
-        idx = self.wheel_sequence.index(number)
+        idx = WHEEL_POSITION[number]
         neighbors = set()
         for i in range(-radius, radius + 1):
             neighbor_idx = (idx + i) % len(self.wheel_sequence)
@@ -39,10 +41,10 @@ class DynamicSectorsStrategy(Strategy):
 
     def _analyze_momentum(self) -> Set[int]:
         """Analyze recent numbers to detect potential wheel momentum"""
-        if len(self.history) < 2:
+        if self.spin_stats.length(self.spin_window) < 2:
             return set()
 
-        recent_numbers = list(self.history)[-self.momentum_size :]
+        recent_numbers = self.spin_stats.last(min(self.momentum_size, self.spin_window))
         # Look for clusters in recent numbers
         all_neighbors = set()
         for num in recent_numbers:
@@ -73,16 +75,18 @@ class DynamicSectorsStrategy(Strategy):
         )
 
         return [
-            PlacedBet(bet_type=f"straight_{num}", amount=bet_per_number)
+            PlacedBet.of(bet_type=f"straight_{num}", amount=bet_per_number)
             for num in self.current_focus
             if bet_per_number >= 50
         ]
 
-    def update_after_spin(self, *, won: bool, number: int):
+    def update_after_spin(
+        self, *, won: bool, number: int, outcome: SpinOutcome | None = None
+    ):
         """Update history and momentum analysis"""
-        super().update_after_spin(won=won, number=number)
+        super().update_after_spin(won=won, number=number, outcome=outcome)
         if number is not None:
-            self.history.append(number)
+            self._record_spin(number)
 
         # Reset focus after significant losses
         if self.consecutive_losses >= 3:
@@ -1,6 +1,6 @@
 from typing import List
 
-from .base import PlacedBet
+from .base import PlacedBet, SpinOutcome
 from .zero_trend import ZeroTrendStrategy
 
 
@@ -9,6 +9,8 @@ class EnhancedZeroTrendStrategy(ZeroTrendStrategy):
     Enhanced version of ZeroTrendStrategy with additional analysis and betting patterns
     """
 
+    _state_fields = ZeroTrendStrategy._state_fields + ("consecutive_near_misses",)
+
     def __init__(
         self,
         base_bet: int = 100,
@@ -34,26 +36,30 @@ class EnhancedZeroTrendStrategy(ZeroTrendStrategy):
             self.base_bet * (2 ** min(self.consecutive_losses, self.max_progression))
         )
 
-        bets.append(PlacedBet(bet_type="straight_0", amount=current_bet))
+        bets.append(PlacedBet.of(bet_type="straight_0", amount=current_bet))
 
-        recent_spins = list(self.spins_history)[-5:]
+        recent_spins = self.spins_history.last(5)
         near_misses = sum(1 for num in recent_spins if self.is_near_miss(num))
 
         if near_misses >= 2:
             neighbours_bet = self.validate_bet_amount(current_bet // 2)
             if neighbours_bet >= 50:
-                bets.append(PlacedBet(bet_type="neighbours_0", amount=neighbours_bet))
+                bets.append(
+                    PlacedBet.of(bet_type="neighbours_0", amount=neighbours_bet)
+                )
 
         if self.non_zero_count >= self.zero_threshold * 2:
             dozen_bet = self.validate_bet_amount(current_bet // 3)
             if dozen_bet >= 50:
-                bets.append(PlacedBet(bet_type="first_dozen", amount=dozen_bet))
+                bets.append(PlacedBet.of(bet_type="first_dozen", amount=dozen_bet))
 
         return bets
 
-    def update_after_spin(self, *, won: bool, number: int):
+    def update_after_spin(
+        self, *, won: bool, number: int, outcome: SpinOutcome | None = None
+    ):
         """Enhanced update with near miss tracking"""
-        super().update_after_spin(won=won, number=number)
+        super().update_after_spin(won=won, number=number, outcome=outcome)
 
         if number is not None:
             if self.is_near_miss(number):
@@ -68,7 +74,7 @@ class EnhancedZeroTrendStrategy(ZeroTrendStrategy):
             {
                 "consecutive_near_misses": self.consecutive_near_misses,
                 "recent_near_misses": sum(
-                    1 for num in list(self.spins_history)[-5:] if self.is_near_miss(num)
+                    1 for num in self.spins_history.last(5) if self.is_near_miss(num)
                 ),
             }
         )
@@ -1,5 +1,5 @@
 from typing import List
-from .base import Strategy, PlacedBet
+from .base import Strategy, PlacedBet, SpinOutcome
 
 
 class FibonacciStrategy(Strategy):
@@ -9,6 +9,8 @@ class FibonacciStrategy(Strategy):
     Moves back two numbers in the sequence after a win.
     """
 
+    _state_fields = Strategy._state_fields + ("current_position",)
+
     def __init__(
         self, base_bet: int = 100, max_progression: int = 8, bet_type: str = "black"
     ):
@@ -31,12 +33,14 @@ class FibonacciStrategy(Strategy):
         current_bet = self.validate_bet_amount(int(self.base_bet * multiplier))
 
         return (
-            [PlacedBet(bet_type=self.bet_type, amount=current_bet)]
+            [PlacedBet.of(bet_type=self.bet_type, amount=current_bet)]
             if current_bet >= 50
             else []
         )
 
-    def update_after_spin(self, *, won: bool, number: int):
+    def update_after_spin(
+        self, *, won: bool, number: int, outcome: SpinOutcome | None = None
+    ):
         """Update position in Fibonacci sequence based on result"""
         if won:
             # Move back two positions after a win
@@ -44,4 +48,4 @@ class FibonacciStrategy(Strategy):
         else:
             # Move forward one position after a loss
             self.current_position = min(self.max_progression, self.current_position + 1)
-        super().update_after_spin(won=won, number=number)
+        super().update_after_spin(won=won, number=number, outcome=outcome)
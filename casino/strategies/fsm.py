@@ -0,0 +1,199 @@
+"""
+Finite-state machine strategies described in JSON.
+
+    {
+      "initial": "bet",
+      "counters": {"since_zero": 20, "paused": 5},
+      "states": {
+        "bet": {
+          "bets": [{"bet_type": "straight_0", "multiplier": 1}],
+          "on": [
+            {"number": "straight_0", "reset": ["since_zero"]},
+            {"counter": "since_zero", "at_least": 19, "goto": "pause",
+             "reset": ["since_zero"]},
+            {"inc": ["since_zero"]}
+          ]
+        },
+        "pause": {
+          "bets": [],
+          "on": [
+            {"counter": "paused", "at_least": 4, "goto": "bet", "reset": ["paused"]},
+            {"inc": ["paused"]}
+          ]
+        }
+      }
+    }
+
+After each spin the rules of the current state are tried in order and the
+first matching one applies. A rule matches on the round result ("result":
+"win" or "loss"), on the class of the winning number ("number": any bet type
+of RouletteTable such as "red", "first_dozen" or "straight_0") and on a
+counter lower bound ("counter" with "at_least"), all optional. It zeroes the
+"reset" counters, increments the "inc" ones (saturating at the maximum
+declared in "counters") and moves to "goto", the same state by default. When
+no rule matches nothing changes.
+
+A plain list of {"bet_type", "multiplier"} entries is a machine cycling
+through the entries whatever the result.
+
+compile_machine() expands every (state, counter values) pair reachable from
+the initial state into a compiled state, then tabulates the next compiled
+state for each result and winning number, so running a machine is a single
+array lookup per spin.
+"""
+
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from typing import List, Dict, Tuple, Any
+
+from roulette_table import RouletteTable
+
+# Guard against counter declarations exploding the compiled state space
+MAX_COMPILED_STATES = 1 << 16
+
+
+@dataclass
+class CompiledMachine:
+    """Dense tables of a compiled strategy machine"""
+
+    # Compiled state -> "state" or "state[counter=value,...]"
+    state_names: List[str]
+    # Next compiled state, at index (state * 2 + won) * 37 + number
+    transitions: array
+    # Compiled state -> (bet_type, multiplier) pairs
+    bets: List[Tuple[Tuple[str, float], ...]]
+    initial: int = 0
+
+    def next_state(self, state: int, won: bool, number: int | None) -> int:
+        """
+        State after a spin. Without the number, only a transition that does
+        not depend on it is followed, like every transition of a plain list.
+        """
+        row = (state * 2 + won) * 37
+        if number is not None:
+            return self.transitions[row + number]
+        targets = set(self.transitions[row : row + 37])
+        return targets.pop() if len(targets) == 1 else state
+
+
+def sequence_machine(sequence: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Machine spec cycling through a list of {bet_type, multiplier} entries"""
+    if not sequence:
+        raise ValueError("Empty bet sequence")
+    return {
+        "initial": "0",
+        "states": {
+            str(i): {
+                "bets": [entry],
+                "on": [{"goto": str((i + 1) % len(sequence))}],
+            }
+            for i, entry in enumerate(sequence)
+        },
+    }
+
+
+def _rule_matcher(rule: Dict[str, Any], counters: List[str], number_classes):
+    """(won, number, counter values) -> bool for one rule"""
+    result = rule.get("result")
+    if result not in (None, "win", "loss"):
+        raise ValueError(f"Unknown result {result!r}, expected 'win' or 'loss'")
+    numbers = None
+    if "number" in rule:
+        if rule["number"] not in number_classes:
+            raise ValueError(f"Unknown number class {rule['number']!r}")
+        numbers = number_classes[rule["number"]]
+    counter = None
+    if "counter" in rule:
+        if rule["counter"] not in counters:
+            raise ValueError(f"Unknown counter {rule['counter']!r}")
+        counter = counters.index(rule["counter"])
+    at_least = rule.get("at_least", 0)
+
+    def matches(won: bool, number: int, values: Tuple[int, ...]) -> bool:
+        if result is not None and won != (result == "win"):
+            return False
+        if numbers is not None and number not in numbers:
+            return False
+        return counter is None or values[counter] >= at_least
+
+    return matches
+
+
+def compile_machine(spec: Dict[str, Any] | List[Dict[str, Any]]) -> CompiledMachine:
+    """Compile a machine spec (or a plain bet sequence) into dense tables"""
+    if isinstance(spec, list):
+        spec = sequence_machine(spec)
+    states = spec["states"]
+    initial = spec.get("initial", next(iter(states)))
+    limits: Dict[str, int] = spec.get("counters", {})
+    counters = list(limits)
+    number_classes = RouletteTable().bets
+    if initial not in states:
+        raise ValueError(f"Unknown initial state {initial!r}")
+
+    rules: Dict[str, List[Tuple[Any, str, List[int], List[int]]]] = {}
+    for name, state in states.items():
+        rules[name] = []
+        for rule in state.get("on", []):
+            goto = rule.get("goto", name)
+            if goto not in states:
+                raise ValueError(f"Unknown state {goto!r} in rules of {name!r}")
+            for counter in rule.get("inc", []) + rule.get("reset", []):
+                if counter not in limits:
+                    raise ValueError(f"Unknown counter {counter!r} in {name!r} rules")
+            rules[name].append(
+                (
+                    _rule_matcher(rule, counters, number_classes),
+                    goto,
+                    [counters.index(counter) for counter in rule.get("inc", [])],
+                    [counters.index(counter) for counter in rule.get("reset", [])],
+                )
+            )
+
+    # Breadth-first over the reachable (state, counter values) pairs
+    start = (initial, (0,) * len(counters))
+    index = {start: 0}
+    order = [start]
+    queue = deque([start])
+    targets = []
+    while queue:
+        name, values = queue.popleft()
+        row = []
+        for won in (False, True):
+            for number in range(37):
+                target = (name, values)
+                for matches, goto, inc, reset in rules[name]:
+                    if matches(won, number, values):
+                        next_values = list(values)
+                        for counter in reset:
+                            next_values[counter] = 0
+                        for counter in inc:
+                            limit = limits[counters[counter]]
+                            next_values[counter] = min(next_values[counter] + 1, limit)
+                        target = (goto, tuple(next_values))
+                        break
+                if target not in index:
+                    if len(order) >= MAX_COMPILED_STATES:
+                        raise ValueError("Machine has too many counter combinations")
+                    index[target] = len(order)
+                    order.append(target)
+                    queue.append(target)
+                row.append(index[target])
+        targets.extend(row)
+
+    state_names = []
+    bets = []
+    for name, values in order:
+        if counters:
+            values_text = ",".join(f"{c}={v}" for c, v in zip(counters, values))
+            state_names.append(f"{name}[{values_text}]")
+        else:
+            state_names.append(name)
+        bets.append(
+            tuple(
+                (entry["bet_type"], entry.get("multiplier", 1))
+                for entry in states[name].get("bets", [])
+            )
+        )
+    return CompiledMachine(state_names, array("l", targets), bets)
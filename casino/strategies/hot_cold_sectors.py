@@ -1,6 +1,6 @@
 from typing import List, Dict, Set
-from collections import deque
-from .base import Strategy, PlacedBet
+from .base import Strategy, PlacedBet, SpinOutcome
+from .spin_stats import WHEEL_SEQUENCE
 
 
 class HotColdSectorsStrategy(Strategy):
@@ -10,6 +10,8 @@ class HotColdSectorsStrategy(Strategy):
     bets on neighbors of numbers that haven't hit recently.
     """
 
+    _state_fields = Strategy._state_fields + ("current_sector",)
+
     def __init__(
         self,
         base_bet: int = 100,
@@ -19,7 +21,11 @@ class HotColdSectorsStrategy(Strategy):
     ):
         super().__init__(base_bet, max_progression)
         self.sector_size = sector_size
-        self.history = deque(maxlen=history_size)
+        # A sector is the arc of `sector_size // 2` pockets on both sides of its
+        # center, unless it wraps over the whole wheel (see _initialize_sectors)
+        self._sector_radius = sector_size // 2
+        width = 2 * self._sector_radius + 1
+        self._track_spins(history_size, arcs=(width,) if width < 37 else ())
         self.sectors: Dict[int, Set[int]] = self._initialize_sectors()
         self.current_sector = None
 
@@ -88,17 +94,22 @@ class HotColdSectorsStrategy(Strategy):
 
     def _analyze_cold_sectors(self) -> int:
         """Find the coldest sector (the least frequent numbers)"""
-        if not self.history:
+        if not self.spin_stats.length(self.spin_window):
             return 0
 
-        sector_hits = {num: 0 for num in range(37)}
-        for num in self.history:
-            for sector_center, sector_nums in self.sectors.items():
-                if num in sector_nums:
-                    sector_hits[sector_center] += 1
+        if not self.spin_arcs:
+            counts = self.spin_stats.number_counts(self.spin_window)
+            sector_hits = {
+                sector_center: sum(counts[num] for num in sector_nums)
+                for sector_center, sector_nums in self.sectors.items()
+            }
+            return min(sector_hits.items(), key=lambda x: x[1])[0]
 
-        # Return center of sector with the least hits
-        return min(sector_hits.items(), key=lambda x: x[1])[0]
+        # Return center of sector with the least hits, the lowest one on ties
+        coldest = self.spin_stats.coldest_arcs(self.spin_window, self.spin_arcs[0])
+        return min(
+            WHEEL_SEQUENCE[(start + self._sector_radius) % 37] for start in coldest
+        )
 
     def calculate_bets(self) -> List[PlacedBet]:
         if not self.current_sector:
@@ -114,17 +125,19 @@ class HotColdSectorsStrategy(Strategy):
         bet_per_number = self.validate_bet_amount(current_bet // len(sector_numbers))
 
         return [
-            PlacedBet(bet_type=f"straight_{num}", amount=bet_per_number)
+            PlacedBet.of(bet_type=f"straight_{num}", amount=bet_per_number)
             for num in sector_numbers
             if bet_per_number >= 50
         ]
 
-    def update_after_spin(self, *, won: bool, number: int):
+    def update_after_spin(
+        self, *, won: bool, number: int, outcome: SpinOutcome | None = None
+    ):
         """Update history and sector analysis"""
-        super().update_after_spin(won=won, number=number)
+        super().update_after_spin(won=won, number=number, outcome=outcome)
 
         if number is not None:
-            self.history.append(number)
+            self._record_spin(number)
 
         if not won:
             # Change sector after loss
@@ -1,7 +1,7 @@
-from collections import deque
 from typing import List
 
-from .base import Strategy, PlacedBet
+from .base import Strategy, PlacedBet, SpinOutcome
+from .spin_stats import SpinRing
 
 
 class HybridMartingaleStrategy(Strategy):
@@ -12,25 +12,32 @@ class HybridMartingaleStrategy(Strategy):
     system to distribute bets based on success rates.
     """
 
+    uses_outcome = True
+    _state_fields = Strategy._state_fields + (
+        "history",
+        "progressions",
+        "success_rates",
+        "bet_results",
+        "allocation_weights",
+    )
+
     def __init__(
         self, base_bet: int = 100, max_progression: int = 4, history_size: int = 50
     ):
         super().__init__(base_bet, max_progression)
-        self.history = deque(maxlen=history_size)
+        self.history = SpinRing(history_size)
         # Track separate progressions for each bet type
         self.progressions = {"red": 0, "first_dozen": 0, "column_1": 0}
         # Track success rates for bet types
         self.success_rates = {bet_type: 0.33 for bet_type in self.progressions}
-        self.bet_results = {
-            bet_type: deque(maxlen=20) for bet_type in self.progressions
-        }
+        self.bet_results = {bet_type: SpinRing(20) for bet_type in self.progressions}
         self.allocation_weights = {bet_type: 1.0 for bet_type in self.progressions}
 
     def _update_success_rates(self):
         """Update success rates for each bet type"""
         for bet_type, results in self.bet_results.items():
             if results:
-                self.success_rates[bet_type] = sum(results) / len(results)
+                self.success_rates[bet_type] = results.count(1) / len(results)
             else:
                 self.success_rates[bet_type] = 0.33  # Default rate
 
@@ -59,7 +66,7 @@ class HybridMartingaleStrategy(Strategy):
             current_bet = self.validate_bet_amount(weighted_base * multiplier)
 
             if current_bet >= 50:
-                bets.append(PlacedBet(bet_type=bet_type, amount=current_bet))
+                bets.append(PlacedBet.of(bet_type=bet_type, amount=current_bet))
 
         return bets
 
@@ -80,16 +87,26 @@ class HybridMartingaleStrategy(Strategy):
 
         return False
 
-    def update_after_spin(self, *, won: bool, number: int):
+    def update_after_spin(
+        self, *, won: bool, number: int, outcome: SpinOutcome | None = None
+    ):
         """Update individual progressions and success tracking"""
-        super().update_after_spin(won=won, number=number)
+        super().update_after_spin(won=won, number=number, outcome=outcome)
 
         if number is not None:
             self.history.append(number)
 
+            # Results of the settled bets, the others are checked by hand
+            settled = {}
+            if outcome is not None:
+                for i, bet in enumerate(outcome.bets):
+                    settled[bet.bet_type] = outcome.won(i)
+
             # Update each progression separately
             for bet_type in self.progressions:
-                bet_won = self._check_win(bet_type, number)
+                bet_won = settled.get(bet_type)
+                if bet_won is None:
+                    bet_won = self._check_win(bet_type, number)
 
                 # Update progression
                 if bet_won:
@@ -100,4 +117,4 @@ class HybridMartingaleStrategy(Strategy):
                     )
 
                 # Track result
-                self.bet_results[bet_type].append(bet_won)
+                self.bet_results[bet_type].append(int(bet_won))
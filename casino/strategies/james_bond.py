@@ -1,6 +1,6 @@
 from typing import List
 
-from .base import PlacedBet, Strategy
+from .base import PlacedBet, Strategy, SpinOutcome
 
 
 class JamesBondStrategy(Strategy):
@@ -28,17 +28,17 @@ class JamesBondStrategy(Strategy):
         current_base = int(self.base_bet * multiplier)
         bets = [
             # 70% high numbers (19-36)
-            PlacedBet(
+            PlacedBet.of(
                 bet_type="high",
                 amount=self.validate_bet_amount(int(current_base * 0.7)),
             ),
             # 25% on sixline_13 (13-18)
-            PlacedBet(
+            PlacedBet.of(
                 bet_type="sixline_13",
                 amount=self.validate_bet_amount(int(current_base * 0.25)),
             ),
             # 5% on zero
-            PlacedBet(
+            PlacedBet.of(
                 bet_type="straight_0",
                 amount=self.validate_bet_amount(int(current_base * 0.05)),
             ),
@@ -46,6 +46,8 @@ class JamesBondStrategy(Strategy):
 
         return [bet for bet in bets if bet.amount > 0]
 
-    def update_after_spin(self, *, won: bool, number: int):
+    def update_after_spin(
+        self, *, won: bool, number: int, outcome: SpinOutcome | None = None
+    ):
         """Update progression state"""
-        super().update_after_spin(won=won, number=number)
+        super().update_after_spin(won=won, number=number, outcome=outcome)
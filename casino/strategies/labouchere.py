@@ -1,6 +1,6 @@
 from typing import List
 
-from .base import Strategy, PlacedBet
+from .base import Strategy, PlacedBet, SpinOutcome
 
 
 class LabouchereStrategy(Strategy):
@@ -10,6 +10,8 @@ class LabouchereStrategy(Strategy):
     After a win, remove these numbers. After a loss, add the lost amount to the end.
     """
 
+    _state_fields = Strategy._state_fields + ("sequence",)
+
     def __init__(
         self, base_bet: int = 100, sequence_length: int = 6, bet_type: str = "red"
     ):
@@ -33,9 +35,11 @@ class LabouchereStrategy(Strategy):
         if current_bet <= 0:
             return []
 
-        return [PlacedBet(bet_type=self.bet_type, amount=current_bet)]
+        return [PlacedBet.of(bet_type=self.bet_type, amount=current_bet)]
 
-    def update_after_spin(self, *, won: bool, number: int):
+    def update_after_spin(
+        self, *, won: bool, number: int, outcome: SpinOutcome | None = None
+    ):
         """Update sequence based on win/loss"""
         if won and len(self.sequence) >= 2:
             # Remove first and last numbers after win
@@ -52,4 +56,4 @@ class LabouchereStrategy(Strategy):
             # Reset sequence when empty (win achieved)
             self.sequence = self.original_sequence.copy()
 
-        super().update_after_spin(won=won, number=number)
+        super().update_after_spin(won=won, number=number, outcome=outcome)
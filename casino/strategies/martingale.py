@@ -1,9 +1,9 @@
-from typing import List
+from typing import List, Tuple, Hashable
 
-from .base import Strategy, PlacedBet
+from .base import PlanCachedStrategy, PlacedBet
 
 
-class MartingaleStrategy(Strategy):
+class MartingaleStrategy(PlanCachedStrategy):
     """
     Classic Martingale strategy betting on black.
     Double the bet after each loss, reset to base after win.
@@ -16,11 +16,21 @@ class MartingaleStrategy(Strategy):
         super().__init__(base_bet, max_progression)
         self.color = color  # 'red' or 'black'
 
-    def calculate_bets(self) -> List[PlacedBet]:
+    def calculate_bets(self) -> Tuple[PlacedBet, ...]:
+        return self._cached_plan()
+
+    def plan_key(self) -> Hashable:
+        return (
+            self.base_bet,
+            self.color,
+            min(self.consecutive_losses, self.max_progression),
+        )
+
+    def _build_plan(self) -> List[PlacedBet]:
         """Calculate next bet based on Martingale progression"""
         multiplier = min(2**self.consecutive_losses, 2**self.max_progression)
         current_bet = min(self.base_bet * multiplier, 2000)  # Cap at 2000 cents
         current_bet = self.validate_bet_amount(int(current_bet))
         if current_bet <= 0:
             return []
-        return [PlacedBet(bet_type=self.color, amount=current_bet)]
+        return [PlacedBet.of(bet_type=self.color, amount=current_bet)]
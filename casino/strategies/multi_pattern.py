@@ -1,7 +1,7 @@
-from collections import deque
 from typing import List
 
-from .base import Strategy, PlacedBet
+from .base import Strategy, PlacedBet, SpinOutcome
+from .spin_stats import SpinRing
 
 
 class MultiPatternStrategy(Strategy):
@@ -11,59 +11,48 @@ class MultiPatternStrategy(Strategy):
     dynamically adjusting bet distribution based on success rates.
     """
 
+    uses_outcome = True
+    _state_fields = Strategy._state_fields + ("pattern_results", "bet_weights")
+
     def __init__(
         self, base_bet: int = 100, max_progression: int = 4, pattern_memory: int = 30
     ):
         super().__init__(base_bet, max_progression)
         self.pattern_memory = pattern_memory
-        self.history = deque(maxlen=pattern_memory)
+        self._track_spins(pattern_memory)
         self.pattern_results = {
-            "color": deque(maxlen=pattern_memory),
-            "dozen": deque(maxlen=pattern_memory),
-            "column": deque(maxlen=pattern_memory),
-            "split": deque(maxlen=pattern_memory),
+            "color": SpinRing(pattern_memory),
+            "dozen": SpinRing(pattern_memory),
+            "column": SpinRing(pattern_memory),
+            "split": SpinRing(pattern_memory),
         }
         self.bet_weights = {"color": 0.3, "dozen": 0.3, "column": 0.2, "split": 0.2}
 
     def _analyze_color_pattern(self) -> str:
         """Analyze color pattern"""
-        # fmt: off
-        red_numbers = {
-            1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36
-        }
-        # fmt: on
-        red_count = sum(1 for num in self.history if num in red_numbers)
-        black_count = sum(
-            1 for num in self.history if num > 0 and num not in red_numbers
-        )
+        _, red_count, black_count = self.spin_stats.color_counts(self.spin_window)
         return "red" if red_count < black_count else "black"
 
     def _analyze_dozen_pattern(self) -> str:
         """Analyze dozen pattern"""
-        dozens = {"first_dozen": 0, "second_dozen": 0, "third_dozen": 0}
-        for num in self.history:
-            if num > 0:
-                if num <= 12:
-                    dozens["first_dozen"] += 1
-                elif num <= 24:
-                    dozens["second_dozen"] += 1
-                else:
-                    dozens["third_dozen"] += 1
+        counts = self.spin_stats.dozen_counts(self.spin_window)
+        dozens = {
+            "first_dozen": counts[1],
+            "second_dozen": counts[2],
+            "third_dozen": counts[3],
+        }
         return min(dozens.items(), key=lambda x: x[1])[0]
 
     def _analyze_column_pattern(self) -> str:
         """Analyze column pattern"""
-        columns = {1: 0, 2: 0, 3: 0}
-        for num in self.history:
-            if num > 0:
-                col = (num - 1) % 3 + 1
-                columns[col] += 1
+        counts = self.spin_stats.column_counts(self.spin_window)
+        columns = {1: counts[1], 2: counts[2], 3: counts[3]}
         coldest_column = min(columns.items(), key=lambda x: x[1])[0]
         return f"column_{coldest_column}"
 
     def _analyze_split_pattern(self) -> str:
         """Analyze split pattern"""
-        recent_numbers = list(self.history)[-5:]
+        recent_numbers = self.spin_stats.last(min(5, self.spin_window))
         if not recent_numbers:
             return "split_h_1_2"
 
@@ -80,6 +69,17 @@ class MultiPatternStrategy(Strategy):
             return f"split_v_{last_num}_{last_num + 3}"
         return "split_h_1_2"  # Default fallback
 
+    @staticmethod
+    def _pattern_of(bet_type: str) -> str:
+        """Pattern type a bet of calculate_bets() comes from"""
+        if bet_type.endswith("_dozen"):
+            return "dozen"
+        if bet_type.startswith("column_"):
+            return "column"
+        if bet_type.startswith("split_"):
+            return "split"
+        return "color"
+
     def _update_weights(self):
         """Update bet weights based on pattern success rates"""
         if not any(self.pattern_results.values()):
@@ -88,7 +88,7 @@ class MultiPatternStrategy(Strategy):
         success_rates = {}
         for pattern_type, results in self.pattern_results.items():
             if results:
-                success_rates[pattern_type] = sum(results) / len(results)
+                success_rates[pattern_type] = results.count(1) / len(results)
             else:
                 success_rates[pattern_type] = 0.25
 
@@ -118,23 +118,29 @@ class MultiPatternStrategy(Strategy):
             bet_amount = int(current_bet * self.bet_weights[pattern_type])
             bet_amount = self.validate_bet_amount(bet_amount)
             if bet_amount > 0:
-                bets.append(PlacedBet(bet_type=bet_type, amount=bet_amount))
+                bets.append(PlacedBet.of(bet_type=bet_type, amount=bet_amount))
 
         return bets
 
-    def update_after_spin(self, *, won: bool, number: int):
+    def update_after_spin(
+        self, *, won: bool, number: int, outcome: SpinOutcome | None = None
+    ):
         """Update pattern tracking and weights"""
-        super().update_after_spin(won=won, number=number)
+        super().update_after_spin(won=won, number=number, outcome=outcome)
 
         if number is not None:
-            self.history.append(number)
+            self._record_spin(number)
 
             # Track success of each pattern type
-            if self.history:
-                self.pattern_results["color"].append(1 if won else 0)
-                self.pattern_results["dozen"].append(1 if won else 0)
-                self.pattern_results["column"].append(1 if won else 0)
-                self.pattern_results["split"].append(1 if won else 0)
+            if self.spin_stats.length(self.spin_window):
+                if outcome is not None:
+                    for i, bet in enumerate(outcome.bets):
+                        pattern_type = self._pattern_of(bet.bet_type)
+                        self.pattern_results[pattern_type].append(int(outcome.won(i)))
+                else:
+                    # Without the settlement every pattern gets the round result
+                    for results in self.pattern_results.values():
+                        results.append(1 if won else 0)
 
                 # Update weights based on pattern success
                 self._update_weights()
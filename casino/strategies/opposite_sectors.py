@@ -1,5 +1,5 @@
 from typing import List, Set
-from .base import Strategy, PlacedBet
+from .base import Strategy, PlacedBet, SpinOutcome
 
 
 class OppositeSectorsStrategy(Strategy):
@@ -9,6 +9,11 @@ class OppositeSectorsStrategy(Strategy):
     with dynamic adjustment based on results.
     """
 
+    _state_fields = Strategy._state_fields + (
+        "current_pair_index",
+        "consecutive_pair_losses",
+    )
+
     def __init__(self, base_bet: int = 100, max_progression: int = 4):
         super().__init__(base_bet, max_progression)
         # Define opposite sectors
@@ -37,30 +42,32 @@ class OppositeSectorsStrategy(Strategy):
         # Split bet between sectors
         bets = [
             (
-                PlacedBet(bet_type=f"first_dozen", amount=current_base)
+                PlacedBet.of(bet_type=f"first_dozen", amount=current_base)
                 if sector1 == set(range(1, 13))
                 else (
-                    PlacedBet(bet_type=f"second_dozen", amount=current_base)
+                    PlacedBet.of(bet_type=f"second_dozen", amount=current_base)
                     if sector1 == set(range(13, 25))
-                    else PlacedBet(bet_type=f"third_dozen", amount=current_base)
+                    else PlacedBet.of(bet_type=f"third_dozen", amount=current_base)
                 )
             ),
             (
-                PlacedBet(bet_type=f"first_dozen", amount=current_base)
+                PlacedBet.of(bet_type=f"first_dozen", amount=current_base)
                 if sector2 == set(range(1, 13))
                 else (
-                    PlacedBet(bet_type=f"second_dozen", amount=current_base)
+                    PlacedBet.of(bet_type=f"second_dozen", amount=current_base)
                     if sector2 == set(range(13, 25))
-                    else PlacedBet(bet_type=f"third_dozen", amount=current_base)
+                    else PlacedBet.of(bet_type=f"third_dozen", amount=current_base)
                 )
             ),
         ]
 
         return bets
 
-    def update_after_spin(self, *, won: bool, number: int):
+    def update_after_spin(
+        self, *, won: bool, number: int, outcome: SpinOutcome | None = None
+    ):
         """Update strategy state and sector selection"""
-        super().update_after_spin(won=won, number=number)
+        super().update_after_spin(won=won, number=number, outcome=outcome)
 
         if won:
             self.consecutive_pair_losses = 0
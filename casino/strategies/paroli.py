@@ -1,6 +1,6 @@
 from typing import List
 
-from .base import Strategy, PlacedBet
+from .base import Strategy, PlacedBet, SpinOutcome
 
 
 class ParoliStrategy(Strategy):
@@ -9,6 +9,8 @@ class ParoliStrategy(Strategy):
     Double bet after wins, reset after loss or reaching target progression
     """
 
+    _state_fields = Strategy._state_fields + ("consecutive_wins",)
+
     def __init__(
         self, base_bet: int = 100, max_progression: int = 3, bet_type: str = "black"
     ):
@@ -23,9 +25,11 @@ class ParoliStrategy(Strategy):
         current_bet = self.validate_bet_amount(int(self.base_bet * multiplier))
         if current_bet == 0:
             return []
-        return [PlacedBet(bet_type=self.bet_type, amount=current_bet)]
+        return [PlacedBet.of(bet_type=self.bet_type, amount=current_bet)]
 
-    def update_after_spin(self, *, won: bool, number: int):
+    def update_after_spin(
+        self, *, won: bool, number: int, outcome: SpinOutcome | None = None
+    ):
         """Update progression after spin result"""
         if won:
             self.consecutive_wins += 1
@@ -36,4 +40,4 @@ class ParoliStrategy(Strategy):
             # Reset after any loss
             self.consecutive_wins = 0
         # Update parent class tracking
-        super().update_after_spin(won=won, number=number)
+        super().update_after_spin(won=won, number=number, outcome=outcome)
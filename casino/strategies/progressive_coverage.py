@@ -1,9 +1,9 @@
-from typing import List, Dict
+from typing import List, Dict, Tuple, Hashable
 
-from .base import Strategy, PlacedBet
+from .base import PlanCachedStrategy, PlacedBet, SpinOutcome
 
 
-class ProgressiveCoverageStrategy(Strategy):
+class ProgressiveCoverageStrategy(PlanCachedStrategy):
     """
     Progressive Coverage Strategy:
     Starts with minimal coverage and progressively increases both
@@ -11,6 +11,11 @@ class ProgressiveCoverageStrategy(Strategy):
     bet types for optimal table coverage.
     """
 
+    _state_fields = PlanCachedStrategy._state_fields + (
+        "coverage_level",
+        "consecutive_stage_losses",
+    )
+
     def __init__(self, base_bet: int = 100, max_progression: int = 4):
         super().__init__(base_bet, max_progression)
         self.coverage_level = 0  # Current coverage level (0-3)
@@ -47,7 +52,18 @@ class ProgressiveCoverageStrategy(Strategy):
             ],
         }
 
-    def calculate_bets(self) -> List[PlacedBet]:
+    def calculate_bets(self) -> Tuple[PlacedBet, ...]:
+        return self._cached_plan()
+
+    def plan_key(self) -> Hashable:
+        # bet_patterns is the same for every instance
+        return (
+            self.base_bet,
+            min(self.consecutive_losses, self.max_progression),
+            self.coverage_level,
+        )
+
+    def _build_plan(self) -> List[PlacedBet]:
         """Calculate bets based on current coverage level"""
         # Progressive bet sizing
         multiplier = min(2**self.consecutive_losses, 2**self.max_progression)
@@ -61,13 +77,15 @@ class ProgressiveCoverageStrategy(Strategy):
         for bet_type, proportion in pattern:
             bet_amount = self.validate_bet_amount(int(current_base * proportion))
             if bet_amount > 0:
-                bets.append(PlacedBet(bet_type=bet_type, amount=bet_amount))
+                bets.append(PlacedBet.of(bet_type=bet_type, amount=bet_amount))
 
         return bets
 
-    def update_after_spin(self, *, won: bool, number: int):
+    def update_after_spin(
+        self, *, won: bool, number: int, outcome: SpinOutcome | None = None
+    ):
         """Update coverage level and progression"""
-        super().update_after_spin(won=won, number=number)
+        super().update_after_spin(won=won, number=number, outcome=outcome)
 
         if won:
             # Reset stage losses on win
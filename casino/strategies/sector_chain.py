@@ -1,7 +1,6 @@
-from collections import deque
 from typing import List, Set
 
-from .base import Strategy, PlacedBet
+from .base import Strategy, PlacedBet, SpinOutcome
 
 
 class SectorChainStrategy(Strategy):
@@ -12,6 +11,11 @@ class SectorChainStrategy(Strategy):
     the ball might be more likely to land based on mechanical bias.
     """
 
+    _state_fields = Strategy._state_fields + (
+        "current_chain_index",
+        "chain_performance",
+    )
+
     def __init__(
         self,
         base_bet: int = 100,
@@ -21,7 +25,7 @@ class SectorChainStrategy(Strategy):
     ):
         super().__init__(base_bet, max_progression)
         self.chain_size = chain_size
-        self.history = deque(maxlen=history_size)
+        self._track_spins(history_size)
         # fmt: off
         self.wheel_sequence = [
             0, 32, 15, 19, 4, 21, 2, 25, 17, 34, 6, 27, 13, 36, 11, 30, 8, 23,
@@ -48,18 +52,14 @@ class SectorChainStrategy(Strategy):
 
     def _analyze_chain_performance(self) -> int:
         """Analyze which chain has been most successful"""
-        if not self.history:
+        if not self.spin_stats.length(self.spin_window):
             return 0
 
-        # Count hits in each chain
-        chain_hits = {i: 0 for i in range(len(self.chains))}
-        for number in self.history:
-            for chain_idx, chain in enumerate(self.chains):
-                if number in chain:
-                    chain_hits[chain_idx] += 1
+        # Chain i is the wheel arc starting at position i
+        chain_hits = self.spin_stats.arc_hits(self.spin_window, self.chain_size)
 
         # Return the chain index with the lowest hits (cold sectors)
-        return min(chain_hits.items(), key=lambda x: x[1])[0]
+        return chain_hits.index(min(chain_hits))
 
     def calculate_bets(self) -> List[PlacedBet]:
         """Calculate bets based on chain analysis"""
@@ -93,7 +93,7 @@ class SectorChainStrategy(Strategy):
                     }
                     if corner_numbers & active_numbers and corner_start <= 32:
                         bets.append(
-                            PlacedBet(
+                            PlacedBet.of(
                                 bet_type=f"corner_{corner_start}",
                                 amount=bet_amount_corner,
                             )
@@ -105,17 +105,19 @@ class SectorChainStrategy(Strategy):
         if bet_amount_straight:
             for num in uncovered:
                 bets.append(
-                    PlacedBet(bet_type=f"straight_{num}", amount=bet_amount_straight)
+                    PlacedBet.of(bet_type=f"straight_{num}", amount=bet_amount_straight)
                 )
 
         return bets
 
-    def update_after_spin(self, *, won: bool, number: int):
+    def update_after_spin(
+        self, *, won: bool, number: int, outcome: SpinOutcome | None = None
+    ):
         """Update chain performance tracking"""
-        super().update_after_spin(won=won, number=number)
+        super().update_after_spin(won=won, number=number, outcome=outcome)
 
         if number is not None:
-            self.history.append(number)
+            self._record_spin(number)
 
             # Update chain performance metrics
             chain_hit = number in self.chains[self.current_chain_index]
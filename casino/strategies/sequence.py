@@ -1,24 +1,53 @@
 import json
 import os
 from pathlib import Path
-from typing import List, Dict, Any, Sequence
+from typing import List, Dict, Any, Tuple
 
-from .base import Strategy, PlacedBet
+from .base import Strategy, PlacedBet, SpinOutcome
+from .fsm import compile_machine
 
 
 class SequenceStrategy(Strategy):
     """
-    Strategy following a predefined sequence of bets loaded from a file
+    Strategy following a predefined sequence of bets loaded from a file, or
+    more generally a state machine (see casino.strategies.fsm for the format)
     """
 
-    def __init__(self, sequence_file: str | Path, base_bet: int = 100):
+    _state_fields = Strategy._state_fields + ("current_position",)
+
+    def __init__(
+        self,
+        sequence_file: str | Path | List[Dict[str, Any]] | Dict[str, Any],
+        base_bet: int = 100,
+    ):
+        """
+        Args:
+            sequence_file: JSON file holding a bet list or a machine spec, or
+                the list or spec itself
+            base_bet: Bet amount in cents for a multiplier of 1
+        """
         super().__init__(base_bet)
-        self.current_position = 0
-        self.sequence: Sequence[Dict[str, Any]] = self._load_sequence(sequence_file)
+        if isinstance(sequence_file, (list, dict)):
+            self.sequence = sequence_file
+        else:
+            self.sequence = self._load_sequence(sequence_file)
+        self.machine = compile_machine(self.sequence)
+        # Compiled state, the index in the list for a plain sequence
+        self.current_position = self.machine.initial
+        self._bets: List[Tuple[PlacedBet, ...]] = [
+            tuple(
+                PlacedBet.of(
+                    bet_type=bet_type,
+                    amount=self.validate_bet_amount(int(self.base_bet * multiplier)),
+                )
+                for bet_type, multiplier in state_bets
+            )
+            for state_bets in self.machine.bets
+        ]
 
     @staticmethod
-    def _load_sequence(filename: str | Path) -> List[Dict[str, Any]]:
-        """Load bet sequence from JSON file"""
+    def _load_sequence(filename: str | Path) -> List[Dict[str, Any]] | Dict[str, Any]:
+        """Load bet sequence or machine spec from JSON file"""
         default_sequence = [
             {"bet_type": "black", "multiplier": 1},
             {"bet_type": "red", "multiplier": 2},
@@ -36,25 +65,28 @@ class SequenceStrategy(Strategy):
         except json.JSONDecodeError:
             return default_sequence
 
-    def calculate_bets(self) -> List[PlacedBet]:
-        """Get next bet from sequence"""
-        sequence_entry = self.sequence[self.current_position]
-        current_bet = self.validate_bet_amount(
-            int(self.base_bet * sequence_entry["multiplier"])
-        )
-        if current_bet == 0:
-            return []
-        return [PlacedBet(bet_type=sequence_entry["bet_type"], amount=current_bet)]
+    def calculate_bets(self) -> Tuple[PlacedBet, ...]:
+        """Get the bets of the current state"""
+        return self._bets[self.current_position]
 
-    def update_after_spin(self, *, won: bool, number: int):
-        """Move to next position in sequence"""
-        self.current_position = (self.current_position + 1) % len(self.sequence)
-        super().update_after_spin(won=won, number=number)
+    def update_after_spin(
+        self, *, won: bool, number: int, outcome: SpinOutcome | None = None
+    ):
+        """Move to the next state"""
+        if number is not None:
+            self.current_position = self.machine.transitions[
+                (self.current_position * 2 + won) * 37 + number
+            ]
+        else:
+            self.current_position = self.machine.next_state(
+                self.current_position, won, None
+            )
+        super().update_after_spin(won=won, number=number, outcome=outcome)
 
     @staticmethod
-    def create_sequence_file(filename: str | Path, sequence: List[Dict]):
+    def create_sequence_file(filename: str | Path, sequence: List[Dict] | Dict):
         """
-        Create a sequence file with the specified bets
+        Create a sequence file with the specified bets, or machine spec
         Example sequence:
         [
             {"bet_type": "black", "multiplier": 1},
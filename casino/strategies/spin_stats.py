@@ -0,0 +1,360 @@
+from array import array
+from itertools import accumulate
+from typing import List, Dict, Set, Iterable, Iterator
+
+# fmt: off
+WHEEL_SEQUENCE = (
+    0, 32, 15, 19, 4, 21, 2, 25, 17, 34, 6, 27, 13, 36, 11, 30, 8, 23, 10, 5,
+    24, 16, 33, 1, 20, 14, 31, 9, 22, 18, 29, 7, 28, 12, 35, 3, 26,
+)
+RED_NUMBERS = frozenset(
+    {1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36}
+)
+# fmt: on
+
+# Per number lookups, index 0 of dozens/columns and colors is the zero
+WHEEL_POSITION = tuple(WHEEL_SEQUENCE.index(number) for number in range(37))
+DOZEN_OF = tuple(0 if n == 0 else (n - 1) // 12 + 1 for n in range(37))
+COLUMN_OF = tuple(0 if n == 0 else (n - 1) % 3 + 1 for n in range(37))
+COLOR_OF = tuple(0 if n == 0 else 1 if n in RED_NUMBERS else 2 for n in range(37))
+
+
+class SpinRing:
+    """
+    Last `capacity` spins (numbers 0 to 36) in a byte ring, with the count of
+    every number. Replaces a deque(maxlen=capacity) of spins at a fraction
+    of its memory.
+
+    Every spin is written twice, `capacity` bytes apart, so the last k spins
+    are always contiguous: last(k) is a view, not a copy. The counts are only
+    kept from the first count() on.
+    """
+
+    __slots__ = ("capacity", "_buffer", "_head", "_length", "_counts")
+
+    def __init__(self, capacity: int, spins: Iterable[int] = ()):
+        self.capacity = capacity
+        self._buffer = bytearray(2 * capacity)
+        self._head = 0  # Next slot to write, holds the oldest spin once full
+        self._length = 0
+        self._counts: array | None = None
+        for spin in spins:
+            self.append(spin)
+
+    @property
+    def maxlen(self) -> int:
+        return self.capacity
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[int]:
+        """Spins, oldest first"""
+        return iter(self.last(self._length))
+
+    def __getitem__(self, i: int) -> int:
+        if i < 0:
+            i += self._length
+        if not 0 <= i < self._length:
+            raise IndexError("SpinRing index out of range")
+        return self._buffer[self._head + self.capacity - self._length + i]
+
+    def __repr__(self) -> str:
+        return f"SpinRing({self.capacity}, {list(self)})"
+
+    def append(self, spin: int):
+        capacity = self.capacity
+        if not capacity:
+            return
+        head = self._head
+        buffer = self._buffer
+        counts = self._counts
+        if self._length == capacity:
+            if counts is not None:
+                counts[buffer[head]] -= 1
+        else:
+            self._length += 1
+        buffer[head] = spin
+        buffer[head + capacity] = spin
+        if counts is not None:
+            counts[spin] += 1
+        self._head = head + 1 if head + 1 < capacity else 0
+
+    def last(self, k: int) -> memoryview:
+        """Last k spins, oldest first, valid until the next append"""
+        end = self._head + self.capacity
+        return memoryview(self._buffer)[end - min(k, self._length) : end]
+
+    def count(self, spin: int) -> int:
+        """Occurrences of a number, O(1) once the counts are kept"""
+        if self._counts is None:
+            self._counts = array("I", bytes(4 * 37))
+            end = self._head + self.capacity
+            for stored in self._buffer[end - self._length : end]:
+                self._counts[stored] += 1
+        return self._counts[spin]
+
+    def clear(self):
+        self._head = 0
+        self._length = 0
+        self._counts = None
+
+    def copy(self) -> "SpinRing":
+        ring = SpinRing.__new__(SpinRing)
+        ring.capacity = self.capacity
+        ring._buffer = self._buffer[:]
+        ring._head = self._head
+        ring._length = self._length
+        ring._counts = None if self._counts is None else self._counts[:]
+        return ring
+
+
+class _ArcCounter:
+    """
+    Hits of every wheel arc of a given width, keyed by the position the arc
+    starts at, with the arcs grouped by hit count to track the coldest ones.
+    """
+
+    __slots__ = ("width", "counts", "buckets", "min_count", "users")
+
+    def __init__(self, width: int, positions: List[int]):
+        self.width = width
+        self.users = 0  # add_arcs calls not yet undone by remove_arcs
+        self.counts = [
+            sum(positions[(start + offset) % 37] for offset in range(width))
+            for start in range(37)
+        ]
+        self.buckets: Dict[int, Set[int]] = {}
+        for start, count in enumerate(self.counts):
+            self.buckets.setdefault(count, set()).add(start)
+        self.min_count = min(self.counts)
+
+    def add(self, position: int, delta: int):
+        """A spin entered (delta=1) or left (delta=-1) at this wheel position"""
+        counts = self.counts
+        buckets = self.buckets
+        for offset in range(self.width):
+            start = (position - offset) % 37
+            count = counts[start]
+            bucket = buckets[count]
+            bucket.discard(start)
+            if not bucket:
+                del buckets[count]
+            count += delta
+            counts[start] = count
+            if count in buckets:
+                buckets[count].add(start)
+            else:
+                buckets[count] = {start}
+            if count < self.min_count:
+                self.min_count = count
+        while self.min_count not in buckets:
+            self.min_count += 1
+
+    def copy(self) -> "_ArcCounter":
+        arc = _ArcCounter.__new__(_ArcCounter)
+        arc.width = self.width
+        arc.counts = self.counts.copy()
+        arc.buckets = {count: starts.copy() for count, starts in self.buckets.items()}
+        arc.min_count = self.min_count
+        arc.users = self.users
+        return arc
+
+
+class _Window:
+    """Counts of the last `size` spins"""
+
+    # fmt: off
+    __slots__ = (
+        "size", "length", "numbers", "squares", "positions", "dozens", "columns",
+        "colors", "arcs", "users",
+    )
+    # fmt: on
+
+    def __init__(self, size: int):
+        self.size = size
+        self.users = 0  # add_window calls not yet undone by remove_window
+        self.length = 0
+        self.numbers = [0] * 37
+        self.squares = 0  # Sum of the squared number counts
+        self.positions = [0] * 37  # By wheel position
+        self.dozens = [0] * 4
+        self.columns = [0] * 4
+        self.colors = [0] * 3  # Zero, red, black
+        self.arcs: Dict[int, _ArcCounter] = {}  # By width
+
+    def add(self, number: int, delta: int):
+        position = WHEEL_POSITION[number]
+        count = self.numbers[number]
+        self.length += delta
+        self.numbers[number] = count + delta
+        self.squares += delta * (2 * count + delta)
+        self.positions[position] += delta
+        for arc in self.arcs.values():
+            arc.add(position, delta)
+        self.dozens[DOZEN_OF[number]] += delta
+        self.columns[COLUMN_OF[number]] += delta
+        self.colors[COLOR_OF[number]] += delta
+
+    def copy(self) -> "_Window":
+        window = _Window.__new__(_Window)
+        window.size = self.size
+        window.length = self.length
+        window.squares = self.squares
+        window.users = self.users
+        for name in ("numbers", "positions", "dozens", "columns", "colors"):
+            setattr(window, name, getattr(self, name).copy())
+        window.arcs = {width: arc.copy() for width, arc in self.arcs.items()}
+        return window
+
+
+class SpinStats:
+    """
+    Sliding-window counts over the last spins of a table.
+
+    Updated once per spin, then every strategy at the table reads the counts
+    of its own window in O(1) instead of rescanning a private history.
+
+    Windows and arcs are reference counted: each add_window/add_arcs is undone
+    by a remove_window/remove_arcs, and a window is no longer updated once the
+    last strategy reading it left.
+    """
+
+    def __init__(self, *windows: int):
+        self._ring = SpinRing(max(windows, default=1))
+        self._windows: Dict[int, _Window] = {}
+        for size in windows:
+            self.add_window(size)
+
+    def __len__(self) -> int:
+        return len(self._ring)
+
+    @property
+    def capacity(self) -> int:
+        """Spins stored, the largest window ever tracked"""
+        return self._ring.capacity
+
+    def copy(self) -> "SpinStats":
+        """Independent copy, spins and counts included"""
+        stats = SpinStats.__new__(SpinStats)
+        stats._ring = self._ring.copy()
+        stats._windows = {size: w.copy() for size, w in self._windows.items()}
+        return stats
+
+    def add_window(self, size: int):
+        """Track a window size, a new one counted from the spins still stored"""
+        window = self._windows.get(size)
+        if window is None:
+            if size > self.capacity:
+                # Older spins are gone: the new window fills up as spins come
+                self._ring = SpinRing(size, self._ring)
+            window = _Window(size)
+            for number in self.last(size):
+                window.add(number, 1)
+            self._windows[size] = window
+        window.users += 1
+
+    def remove_window(self, size: int):
+        """Undo an add_window, the window is dropped with its last user"""
+        window = self._windows[size]
+        window.users -= 1
+        if not window.users:
+            del self._windows[size]
+
+    def add_arcs(self, window: int, width: int):
+        """
+        Maintain the hits of every wheel arc of `width` pockets in the window,
+        the window is added too
+        """
+        self.add_window(window)
+        target = self._windows[window]
+        arc = target.arcs.get(width)
+        if arc is None:
+            arc = target.arcs[width] = _ArcCounter(width, target.positions)
+        arc.users += 1
+
+    def remove_arcs(self, window: int, width: int):
+        """Undo an add_arcs, the window included"""
+        arcs = self._windows[window].arcs
+        arc = arcs[width]
+        arc.users -= 1
+        if not arc.users:
+            del arcs[width]
+        self.remove_window(window)
+
+    def push(self, number: int):
+        """Record a spin in every window"""
+        ring = self._ring
+        buffer = ring._buffer
+        end = ring._head + ring.capacity  # Spin `size` ago at end - size
+        for size, window in self._windows.items():
+            if window.length == size:
+                window.add(buffer[end - size], -1)
+            window.add(number, 1)
+        ring.append(number)
+
+    def last(self, k: int) -> memoryview:
+        """Last k spins, oldest first, valid until the next push"""
+        return self._ring.last(k)
+
+    def length(self, window: int) -> int:
+        """Spins currently counted in the window"""
+        return self._windows[window].length
+
+    def number_counts(self, window: int) -> List[int]:
+        return self._windows[window].numbers
+
+    def position_counts(self, window: int) -> List[int]:
+        """Counts by wheel position, WHEEL_SEQUENCE order"""
+        return self._windows[window].positions
+
+    def dozen_counts(self, window: int) -> List[int]:
+        """Zero, then first, second and third dozen"""
+        return self._windows[window].dozens
+
+    def column_counts(self, window: int) -> List[int]:
+        """Zero, then columns 1 to 3"""
+        return self._windows[window].columns
+
+    def color_counts(self, window: int) -> List[int]:
+        """Zero, red, black"""
+        return self._windows[window].colors
+
+    def chi_squared(self, window: int) -> float:
+        """Chi-squared statistic of the number counts against a uniform wheel"""
+        window = self._windows[window]
+        if not window.length:
+            return 0.0
+        # Σ(obs - e)² / e with e = n / 37 simplifies to Σobs² / e - n
+        expected = window.length / 37
+        return window.squares / expected - window.length
+
+    def arc_hits(self, window: int, width: int) -> List[int]:
+        """
+        Hits of every arc of `width` pockets, by start wheel position, from a
+        circular prefix sum of the position counts: O(37) for any width.
+        """
+        positions = self._windows[window].positions
+        width = min(width, 37)
+        prefix = [0, *accumulate(positions + positions[:width])]
+        return [prefix[start + width] - prefix[start] for start in range(37)]
+
+    def arc_counts(self, window: int, width: int) -> List[int]:
+        """Hits of the arcs added with add_arcs, by start wheel position"""
+        return self._windows[window].arcs[width].counts
+
+    def coldest_arcs(self, window: int, width: int) -> Set[int]:
+        """Start wheel positions of the arcs with the fewest hits"""
+        arc = self._windows[window].arcs[width]
+        return arc.buckets[arc.min_count]
+
+    def arcs_below(self, window: int, width: int, limit: float) -> Set[int]:
+        """Start wheel positions of the arcs with fewer than `limit` hits"""
+        arc = self._windows[window].arcs[width]
+        if arc.min_count >= limit:
+            return set()
+        below = set()
+        for count, bucket in arc.buckets.items():
+            if count < limit:
+                below |= bucket
+        return below
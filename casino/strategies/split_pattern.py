@@ -1,7 +1,6 @@
-from collections import deque
 from typing import List, Set
 
-from .base import Strategy, PlacedBet
+from .base import Strategy, PlacedBet, SpinOutcome
 
 
 class SplitPatternStrategy(Strategy):
@@ -11,15 +10,22 @@ class SplitPatternStrategy(Strategy):
     recent hit concentrations on the table layout.
     """
 
+    _state_fields = Strategy._state_fields + ("pattern_index",)
+
     def __init__(
         self, base_bet: int = 100, max_progression: int = 4, history_size: int = 15
     ):
         super().__init__(base_bet, max_progression)
-        self.history = deque(maxlen=history_size)
+        self._track_spins(history_size)
         self.pattern_index = 0
         # Définir les groupes de splits horizontaux et verticaux
         self.horizontal_splits = self._init_horizontal_splits()
         self.vertical_splits = self._init_vertical_splits()
+        # Score of a hit on each number, for every split
+        self._split_weights = [
+            (frozenset(split), self._split_weights_of(split))
+            for split in self.horizontal_splits + self.vertical_splits
+        ]
 
     @staticmethod
     def _init_horizontal_splits() -> List[Set[int]]:
@@ -39,23 +45,28 @@ class SplitPatternStrategy(Strategy):
             splits.append({num, num + 3})
         return splits
 
+    @staticmethod
+    def _split_weights_of(split: Set[int]) -> List[tuple]:
+        """(number, score) pairs: 2 on the split, 1 within 3 of it"""
+        weights = []
+        for num in range(37):
+            if num in split:
+                weights.append((num, 2))
+            elif any(abs(num - split_num) <= 3 for split_num in split):
+                weights.append((num, 1))
+        return weights
+
     def _analyze_hot_zones(self) -> List[Set[int]]:
         """Analyze recent numbers to find hot zones"""
-        if not self.history:
+        if not self.spin_stats.length(self.spin_window):
             return self.horizontal_splits[:4]  # Default start pattern
 
         # Count hits near each split
-        split_scores = {}
-        all_splits = self.horizontal_splits + self.vertical_splits
-
-        for split in all_splits:
-            score = 0
-            for num in self.history:
-                if num in split:
-                    score += 2
-                elif any(abs(num - split_num) <= 3 for split_num in split):
-                    score += 1
-            split_scores[frozenset(split)] = score
+        counts = self.spin_stats.number_counts(self.spin_window)
+        split_scores = {
+            split: sum(counts[num] * weight for num, weight in weights)
+            for split, weights in self._split_weights
+        }
 
         # Select top scoring splits
         sorted_splits = sorted(split_scores.items(), key=lambda x: x[1], reverse=True)
@@ -84,16 +95,18 @@ class SplitPatternStrategy(Strategy):
                     else:  # Vertical
                         bet_type = f"split_v_{split_list[0]}_{split_list[1]}"
 
-                    bets.append(PlacedBet(bet_type=bet_type, amount=bet_per_split))
+                    bets.append(PlacedBet.of(bet_type=bet_type, amount=bet_per_split))
 
         return [bet for bet in bets if bet.amount > 0]
 
-    def update_after_spin(self, *, won: bool, number: int):
+    def update_after_spin(
+        self, *, won: bool, number: int, outcome: SpinOutcome | None = None
+    ):
         """Update strategy state and pattern analysis"""
-        super().update_after_spin(won=won, number=number)
+        super().update_after_spin(won=won, number=number, outcome=outcome)
 
         if number is not None:
-            self.history.append(number)
+            self._record_spin(number)
             if not won:
                 # Rotate pattern after loss
                 self.pattern_index = (self.pattern_index + 1) % 4
@@ -1,14 +1,20 @@
-from typing import List
-from .base import Strategy, PlacedBet
+from typing import List, Tuple, Hashable
+from .base import PlanCachedStrategy, PlacedBet, SpinOutcome
+from .spin_stats import SpinRing
 
 
-class ThirdsCoverageStrategy(Strategy):
+class ThirdsCoverageStrategy(PlanCachedStrategy):
     """
     Thirds Coverage strategy:
     Bets on two thirds of the table, adjusting coverage based on recent results.
     Uses pattern recognition to switch between different thirds combinations.
     """
 
+    _state_fields = PlanCachedStrategy._state_fields + (
+        "last_numbers",
+        "current_coverage",
+    )
+
     def __init__(self, base_bet: int = 100, max_progression: int = 4):
         super().__init__(base_bet, max_progression)
         self.thirds = {
@@ -16,8 +22,8 @@ class ThirdsCoverageStrategy(Strategy):
             "second": list(range(13, 25)),  # 13-24
             "third": list(range(25, 37)),  # 25-36
         }
-        self.last_numbers = []
         self.max_history = 10
+        self.last_numbers = SpinRing(self.max_history)
         self.current_coverage = ["first", "second"]  # Default coverage
 
     def _analyze_pattern(self) -> None:
@@ -27,7 +33,7 @@ class ThirdsCoverageStrategy(Strategy):
 
         # Count hits in each third
         hits = {third: 0 for third in self.thirds.keys()}
-        for num in self.last_numbers[-5:]:
+        for num in self.last_numbers.last(5):
             for third, numbers in self.thirds.items():
                 if num in numbers:
                     hits[third] += 1
@@ -36,10 +42,19 @@ class ThirdsCoverageStrategy(Strategy):
         sorted_thirds = sorted(hits.items(), key=lambda x: x[1])
         self.current_coverage = [third for third, _ in sorted_thirds[:2]]
 
-    def calculate_bets(self) -> List[PlacedBet]:
+    def calculate_bets(self) -> Tuple[PlacedBet, ...]:
         """Calculate bets for two thirds coverage"""
         self._analyze_pattern()
+        return self._cached_plan()
+
+    def plan_key(self) -> Hashable:
+        return (
+            self.base_bet,
+            min(self.consecutive_losses // 2, self.max_progression),
+            tuple(self.current_coverage),
+        )
 
+    def _build_plan(self) -> List[PlacedBet]:
         # Base bet increases with consecutive losses but split between coverage areas
         multiplier = min(2 ** (self.consecutive_losses // 2), 2**self.max_progression)
         bet_per_third = self.validate_bet_amount(int(self.base_bet * multiplier))
@@ -48,15 +63,15 @@ class ThirdsCoverageStrategy(Strategy):
 
         bets = []
         for third in self.current_coverage:
-            bets.append(PlacedBet(bet_type=f"{third}_dozen", amount=bet_per_third))
+            bets.append(PlacedBet.of(bet_type=f"{third}_dozen", amount=bet_per_third))
 
         return bets
 
-    def update_after_spin(self, *, won: bool, number: int):
+    def update_after_spin(
+        self, *, won: bool, number: int, outcome: SpinOutcome | None = None
+    ):
         """Update strategy state and number history"""
-        super().update_after_spin(won=won, number=number)
+        super().update_after_spin(won=won, number=number, outcome=outcome)
 
         if number is not None:
             self.last_numbers.append(number)
-            if len(self.last_numbers) > self.max_history:
-                self.last_numbers.pop(0)
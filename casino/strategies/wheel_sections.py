@@ -1,5 +1,5 @@
 from typing import List
-from .base import Strategy, PlacedBet
+from .base import Strategy, PlacedBet, SpinOutcome
 
 
 class WheelSectionsStrategy(Strategy):
@@ -9,6 +9,8 @@ class WheelSectionsStrategy(Strategy):
     covering a total of 20 numbers on the wheel.
     """
 
+    _state_fields = Strategy._state_fields + ("current_focus",)
+
     def __init__(self, base_bet: int = 100, max_progression: int = 4):
         super().__init__(base_bet, max_progression)
         self.tier_numbers = {27, 13, 36, 11, 30, 8, 23, 10, 5, 24, 16, 33}  # 12 numbers
@@ -27,7 +29,7 @@ class WheelSectionsStrategy(Strategy):
         if current_bet_div_12 and self.current_focus == "tier":
             for num in self.tier_numbers:
                 bets.append(
-                    PlacedBet(
+                    PlacedBet.of(
                         bet_type=f"straight_{num}",
                         amount=current_bet_div_12,  # Split bet among tier numbers
                     )
@@ -35,7 +37,7 @@ class WheelSectionsStrategy(Strategy):
         elif current_bet_div_8:  # orphans
             for num in self.orphans_numbers:
                 bets.append(
-                    PlacedBet(
+                    PlacedBet.of(
                         bet_type=f"straight_{num}",
                         amount=current_bet_div_8,  # Split bet among orphans numbers
                     )
@@ -43,9 +45,11 @@ class WheelSectionsStrategy(Strategy):
 
         return [bet for bet in bets if bet.amount > 0]
 
-    def update_after_spin(self, *, won: bool, number: int):
+    def update_after_spin(
+        self, *, won: bool, number: int, outcome: SpinOutcome | None = None
+    ):
         """Update strategy state and alternate between sections"""
-        super().update_after_spin(won=won, number=number)
+        super().update_after_spin(won=won, number=number, outcome=outcome)
 
         if won:
             # Keep current focus if winning
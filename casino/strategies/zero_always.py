@@ -1,11 +1,17 @@
-from .base import Strategy, PlacedBet
-from typing import List
+from .base import PlanCachedStrategy, PlacedBet
+from typing import List, Tuple, Hashable
 
 
-class ZeroAlwaysStrategy(Strategy):
+class ZeroAlwaysStrategy(PlanCachedStrategy):
 
     def __init__(self, base_bet: int = 200, max_progression: int = 4):
         super().__init__(base_bet, max_progression)
 
-    def calculate_bets(self) -> List[PlacedBet]:
-        return [PlacedBet(bet_type="straight_0", amount=self.base_bet)]
+    def calculate_bets(self) -> Tuple[PlacedBet, ...]:
+        return self._cached_plan()
+
+    def plan_key(self) -> Hashable:
+        return self.base_bet
+
+    def _build_plan(self) -> List[PlacedBet]:
+        return [PlacedBet.of(bet_type="straight_0", amount=self.base_bet)]
@@ -1,10 +1,15 @@
-from .base import Strategy, PlacedBet
-from typing import List
+from .base import PlanCachedStrategy, PlacedBet, SpinOutcome
+from typing import List, Tuple, Hashable
 
 
-class ZeroAndHalfStrategy(Strategy):
+class ZeroAndHalfStrategy(PlanCachedStrategy):
     ACCEPTABLE_OTHER_BET = ["red", "black", "even", "odd", "low", "high"]
 
+    _state_fields = PlanCachedStrategy._state_fields + (
+        "non_zero_count",
+        "is_betting",
+    )
+
     def __init__(
         self,
         *,
@@ -25,28 +30,36 @@ class ZeroAndHalfStrategy(Strategy):
         self.non_zero_count = 0
         self.larger_on_zero = larger_on_zero
 
-    def calculate_bets(self) -> List[PlacedBet]:
+    def calculate_bets(self) -> Tuple[PlacedBet, ...]:
         if not self.is_betting:
-            return []
+            return ()
+        return self._cached_plan()
+
+    def plan_key(self) -> Hashable:
+        return self.base_bet, self.other, self.larger_on_zero
+
+    def _build_plan(self) -> List[PlacedBet]:
         # 2/3 on 0, 1/30 on the other (should be 50% win like 'black' or 'red')
         if self.larger_on_zero:
             larger = self.validate_bet_amount(self.base_bet * 2 // 3)
             smaller = self.validate_bet_amount(self.base_bet - larger)
-            first_bet = PlacedBet(bet_type="straight_0", amount=larger)
-            second_bet = PlacedBet(bet_type=self.other, amount=smaller)
+            first_bet = PlacedBet.of(bet_type="straight_0", amount=larger)
+            second_bet = PlacedBet.of(bet_type=self.other, amount=smaller)
         else:
             larger = self.validate_bet_amount(self.base_bet * 2 // 3)
             smaller = self.validate_bet_amount(self.base_bet - larger)
-            first_bet = PlacedBet(bet_type=self.other, amount=larger)
-            second_bet = PlacedBet(bet_type="straight_0", amount=smaller)
+            first_bet = PlacedBet.of(bet_type=self.other, amount=larger)
+            second_bet = PlacedBet.of(bet_type="straight_0", amount=smaller)
 
         if larger and smaller:
             return [first_bet, second_bet]
 
-        return [PlacedBet(bet_type="straight_0", amount=self.base_bet)]
+        return [PlacedBet.of(bet_type="straight_0", amount=self.base_bet)]
 
-    def update_after_spin(self, *, won: bool, number: int):
-        super().update_after_spin(won=won, number=number)
+    def update_after_spin(
+        self, *, won: bool, number: int, outcome: SpinOutcome | None = None
+    ):
+        super().update_after_spin(won=won, number=number, outcome=outcome)
         if number:
             self.non_zero_count += 1
             if self.non_zero_count >= self.wait_before_bet:
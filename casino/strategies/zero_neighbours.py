@@ -26,16 +26,16 @@ class ZeroNeighboursStrategy(Strategy):
         if current_bet == 0:
             return []
 
-        bets = [PlacedBet(bet_type="straight_0", amount=current_bet)]
+        bets = [PlacedBet.of(bet_type="straight_0", amount=current_bet)]
 
         # Base bet on zero
 
         # Add neighbours after first loss
         if self.consecutive_losses >= 1:
-            bets.append(PlacedBet(bet_type="neighbours_0", amount=current_bet))
+            bets.append(PlacedBet.of(bet_type="neighbours_0", amount=current_bet))
 
         # Add first dozen after second loss
         if self.consecutive_losses >= 2:
-            bets.append(PlacedBet(bet_type="first_dozen", amount=current_bet * 2))
+            bets.append(PlacedBet.of(bet_type="first_dozen", amount=current_bet * 2))
 
         return bets
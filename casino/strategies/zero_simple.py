@@ -1,4 +1,4 @@
-from .base import Strategy, PlacedBet
+from .base import Strategy, PlacedBet, SpinOutcome
 from typing import List
 
 
@@ -7,6 +7,8 @@ class ZeroSimpleStrategy(Strategy):
     Strategy focusing on zero
     """
 
+    _state_fields = Strategy._state_fields + ("non_zero_count", "is_betting")
+
     def __init__(
         self, base_bet: int = 200, max_progression: int = 4, wait_before_bet: int = 5
     ):
@@ -17,11 +19,13 @@ class ZeroSimpleStrategy(Strategy):
 
     def calculate_bets(self) -> List[PlacedBet]:
         if self.is_betting:
-            return [PlacedBet(bet_type="straight_0", amount=self.base_bet)]
+            return [PlacedBet.of(bet_type="straight_0", amount=self.base_bet)]
         return []
 
-    def update_after_spin(self, *, won: bool, number: int):
-        super().update_after_spin(won=won, number=number)
+    def update_after_spin(
+        self, *, won: bool, number: int, outcome: SpinOutcome | None = None
+    ):
+        super().update_after_spin(won=won, number=number, outcome=outcome)
         if number:
             self.non_zero_count += 1
             if self.non_zero_count >= self.wait_before_bet:
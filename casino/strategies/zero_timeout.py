@@ -1,8 +1,15 @@
-from .base import Strategy, PlacedBet
+from .base import Strategy, PlacedBet, SpinOutcome
 from typing import List
 
 
 class ZeroTimeoutStrategy(Strategy):
+    _state_fields = Strategy._state_fields + (
+        "non_zero_count",
+        "is_betting",
+        "rounds_since_zero",
+        "timeout_remaining",
+    )
+
     def __init__(
         self,
         *,
@@ -25,10 +32,12 @@ class ZeroTimeoutStrategy(Strategy):
         if not self.is_betting or self.timeout_remaining > 0:
             return []
 
-        return [PlacedBet(bet_type="straight_0", amount=self.base_bet)]
+        return [PlacedBet.of(bet_type="straight_0", amount=self.base_bet)]
 
-    def update_after_spin(self, *, won: bool, number: int):
-        super().update_after_spin(won=won, number=number)
+    def update_after_spin(
+        self, *, won: bool, number: int, outcome: SpinOutcome | None = None
+    ):
+        super().update_after_spin(won=won, number=number, outcome=outcome)
 
         if self.timeout_remaining > 0:
             self.timeout_remaining -= 1
@@ -1,7 +1,7 @@
-from typing import List, Deque
-from collections import deque
+from typing import List
 
-from .base import Strategy, PlacedBet
+from .base import Strategy, PlacedBet, SpinOutcome
+from .spin_stats import SpinRing
 
 
 class ZeroTrendStrategy(Strategy):
@@ -10,6 +10,12 @@ class ZeroTrendStrategy(Strategy):
     for a specified number of spins.
     """
 
+    _state_fields = Strategy._state_fields + (
+        "spins_history",
+        "non_zero_count",
+        "is_betting",
+    )
+
     def __init__(
         self,
         base_bet: int = 100,
@@ -28,7 +34,7 @@ class ZeroTrendStrategy(Strategy):
         """
         super().__init__(base_bet, max_progression)
         self.zero_threshold = zero_threshold
-        self.spins_history: Deque[int] = deque(maxlen=history_size)
+        self.spins_history = SpinRing(history_size)
         self.non_zero_count = 0
         self.is_betting = False
 
@@ -61,14 +67,14 @@ class ZeroTrendStrategy(Strategy):
 
         bets = [
             # Main bet on zero
-            PlacedBet(bet_type="straight_0", amount=current_bet)
+            PlacedBet.of(bet_type="straight_0", amount=current_bet)
         ]
 
         # If we've been waiting for a long time, add some coverage
         if self.non_zero_count >= self.zero_threshold * 2:
             # Add neighbors bet for coverage
             bets.append(
-                PlacedBet(
+                PlacedBet.of(
                     bet_type="neighbours_0",
                     amount=current_bet // 2,  # Half size on coverage
                 )
@@ -76,7 +82,9 @@ class ZeroTrendStrategy(Strategy):
 
         return bets
 
-    def update_after_spin(self, *, won: bool, number: int):
+    def update_after_spin(
+        self, *, won: bool, number: int, outcome: SpinOutcome | None = None
+    ):
         """
         Update strategy state after a spin
 
@@ -84,7 +92,7 @@ class ZeroTrendStrategy(Strategy):
             won: Whether any bet was won
             number: The actual number that came up
         """
-        super().update_after_spin(won=won, number=number)
+        super().update_after_spin(won=won, number=number, outcome=outcome)
 
         if number is not None:
             self.update_history(number)
@@ -0,0 +1,342 @@
+"""
+Parameter sweeps of a strategy over a process pool.
+
+Usage: python -m casino.sweep STRATEGY --grid name=v1,v2 [--grid ...]
+           [--simulations N] [--rounds N] [--output FILE] [--cache DIR]
+"""
+
+import argparse
+import functools
+import hashlib
+import inspect
+import itertools
+import json
+import os
+import random
+import statistics
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import List, Dict, Any, Sequence, Tuple, Iterator
+
+import casino_player
+import roulette_table
+from .player import Player
+from .strategies import create_strategy, get_strategy_class
+from .strategies.spin_stats import SpinStats
+from .table import Casino
+
+# Parameter space of the samplers: a list of choices or a (low, high) range,
+# ints give ints, floats give floats
+Space = Dict[str, Sequence[Any] | Tuple[float, float]]
+
+
+def grid(params: Dict[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """Every combination of the parameter values"""
+    names = list(params)
+    return [
+        dict(zip(names, values))
+        for values in itertools.product(*(params[name] for name in names))
+    ]
+
+
+def _draw(choices: Sequence[Any] | Tuple[float, float], u: float) -> Any:
+    """Value of a parameter for u uniform in [0, 1)"""
+    if isinstance(choices, tuple) and len(choices) == 2:
+        low, high = choices
+        if isinstance(low, int) and isinstance(high, int):
+            return low + min(int(u * (high - low + 1)), high - low)
+        return low + u * (high - low)
+    return choices[min(int(u * len(choices)), len(choices) - 1)]
+
+
+def random_samples(space: Space, samples: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Independent uniform samples of the parameter space"""
+    rng = random.Random(seed)
+    return [
+        {name: _draw(choices, rng.random()) for name, choices in space.items()}
+        for _ in range(samples)
+    ]
+
+
+def latin_hypercube(space: Space, samples: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Latin hypercube samples: every parameter range is cut into `samples`
+    strata and each stratum is drawn exactly once.
+    """
+    rng = random.Random(seed)
+    columns = {}
+    for name, choices in space.items():
+        strata = list(range(samples))
+        rng.shuffle(strata)
+        columns[name] = [
+            _draw(choices, (stratum + rng.random()) / samples) for stratum in strata
+        ]
+    return [
+        {name: column[i] for name, column in columns.items()} for i in range(samples)
+    ]
+
+
+def _digest(data: Dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+# Modules of base classes that are not part of the simulation code
+_STDLIB = ("builtins", "abc")
+
+
+@functools.lru_cache(maxsize=None)
+def code_version(strategy: str) -> str:
+    """
+    Digest of the code simulating a strategy: the modules of its class and
+    base classes, and the ones of the engine (tables, players, wheel)
+    """
+    classes = [*get_strategy_class(strategy).__mro__, Casino, Player, SpinStats]
+    paths = {inspect.getfile(cls) for cls in classes if cls.__module__ not in _STDLIB}
+    paths |= {inspect.getfile(roulette_table), inspect.getfile(casino_player)}
+    digest = hashlib.sha256()
+    for path in sorted(paths):
+        digest.update(Path(path).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def cell_seed(strategy: str, params: Dict[str, Any], seed: int) -> int:
+    """64 bits seed of a configuration, stable across runs and machines"""
+    digest = _digest({"strategy": strategy, "params": params, "seed": seed})
+    return int(digest[:16], 16)
+
+
+@dataclass
+class SweepCell:
+    """One strategy configuration simulated `simulations` times"""
+
+    strategy: str
+    params: Dict[str, Any]
+    simulations: int
+    rounds: int
+    initial_bankroll: int  # In cents
+    seed: int  # Derived from the configuration and the sweep seed
+    version: str = ""  # code_version() of the strategy, for the cache
+
+    @property
+    def key(self) -> str:
+        """
+        Content address of the cell: same configuration, seed and code, same
+        result
+        """
+        return _digest(asdict(self))
+
+
+@dataclass
+class CellResult:
+    strategy: str
+    params: Dict[str, Any]
+    seed: int
+    simulations: int
+    rounds: int
+    survival_rate: float  # Percent of simulations the player was still seated
+    avg_rounds: float
+    avg_profit: float  # In euros
+    profit_std: float  # In euros
+    cached: bool = field(default=False, compare=False)
+
+
+def run_cell(cell: SweepCell) -> CellResult:
+    """Simulate a cell, one player alone in a seeded casino per simulation"""
+    seeds = random.Random(cell.seed)
+    survived = 0
+    rounds_played = 0
+    profits = []
+    for simulation in range(cell.simulations):
+        casino = Casino(seed=seeds.getrandbits(64))
+        player = Player(
+            f"{cell.strategy}_{simulation}",
+            cell.initial_bankroll,
+            create_strategy(cell.strategy, **cell.params),
+        )
+        casino.add_player(player)
+        for _ in casino.iter_rounds(cell.rounds, results="none"):
+            pass
+        survived += not player.should_leave()
+        rounds_played += player.rounds_played
+        profits.append(
+            (player.get_current_bankroll() - player.get_initial_bankroll()) / 100
+        )
+
+    return CellResult(
+        strategy=cell.strategy,
+        params=cell.params,
+        seed=cell.seed,
+        simulations=cell.simulations,
+        rounds=cell.rounds,
+        survival_rate=survived / cell.simulations * 100,
+        avg_rounds=rounds_played / cell.simulations,
+        avg_profit=statistics.fmean(profits),
+        profit_std=statistics.stdev(profits) if len(profits) > 1 else 0.0,
+    )
+
+
+class ParameterSweep:
+    """
+    Simulate a strategy for many parameter sets in worker processes.
+
+    Every cell gets a seed derived from its configuration and the sweep seed,
+    so results do not depend on the order cells run in. Results are written
+    to a JSON lines file as cells complete, and kept in a cache directory
+    named after the cell content and code version so rerunning a sweep skips
+    known cells until the strategy or the engine changes.
+    """
+
+    def __init__(
+        self,
+        strategy: str,
+        param_sets: List[Dict[str, Any]],
+        *,
+        simulations: int = 100,
+        rounds: int = 300,
+        initial_bankroll: int = 74 * 100 * 2,
+        seed: int = 0,
+        cache_dir: str | Path | None = None,
+        workers: int | None = None,
+    ):
+        self.strategy = strategy
+        self.workers = workers or os.cpu_count() or 1
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        version = code_version(strategy)
+        self.cells = [
+            SweepCell(
+                strategy=strategy,
+                params=params,
+                simulations=simulations,
+                rounds=rounds,
+                initial_bankroll=initial_bankroll,
+                seed=cell_seed(strategy, params, seed),
+                version=version,
+            )
+            for params in param_sets
+        ]
+
+    def _cached(self, cell: SweepCell) -> CellResult | None:
+        if self.cache_dir is None:
+            return None
+        path = self.cache_dir / f"{cell.key}.json"
+        if not path.exists():
+            return None
+        result = CellResult(**json.loads(path.read_text(encoding="utf-8")))
+        result.cached = True
+        return result
+
+    def _store(self, cell: SweepCell, result: CellResult):
+        if self.cache_dir is None:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.cache_dir / f"{cell.key}.json"
+        temporary = path.with_suffix(".tmp")
+        data = asdict(result)
+        del data["cached"]
+        temporary.write_text(json.dumps(data), encoding="utf-8")
+        temporary.replace(path)  # Readers never see a partial file
+
+    def results(self) -> Iterator[CellResult]:
+        """Cached cells first, then the others as soon as they complete"""
+        pending = []
+        for cell in self.cells:
+            result = self._cached(cell)
+            if result is None:
+                pending.append(cell)
+            else:
+                yield result
+        if not pending:
+            return
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            futures = {pool.submit(run_cell, cell): cell for cell in pending}
+            for future in as_completed(futures):
+                result = future.result()
+                self._store(futures[future], result)
+                yield result
+
+    def run(self, output: str | Path | None = None) -> List[CellResult]:
+        """
+        Run every cell, writing each result to `output` (JSON lines). The file
+        is rewritten with the results of this run, cached cells included.
+        """
+        collected = []
+        stream = open(output, "w", encoding="utf-8") if output is not None else None
+        try:
+            for result in self.results():
+                collected.append(result)
+                if stream is not None:
+                    stream.write(json.dumps(asdict(result)) + "\n")
+                    stream.flush()
+        finally:
+            if stream is not None:
+                stream.close()
+        return collected
+
+
+def parse_value(text: str) -> Any:
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return text
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sweep the parameters of a strategy")
+    parser.add_argument("strategy", help="Registered strategy name, e.g. zero_simple")
+    parser.add_argument(
+        "--grid",
+        action="append",
+        default=[],
+        metavar="NAME=V1,V2",
+        help="Values of a parameter, repeat for every swept parameter",
+    )
+    parser.add_argument(
+        "--sampler",
+        choices=("grid", "random", "lhs"),
+        default="grid",
+        help="random and lhs draw --samples points between the first and last value",
+    )
+    parser.add_argument("--samples", type=int, default=20)
+    parser.add_argument("--simulations", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--output", default="sweep.jsonl")
+    parser.add_argument("--cache", default=".sweep_cache")
+    args = parser.parse_args()
+
+    values = {}
+    for option in args.grid:
+        name, _, text = option.partition("=")
+        values[name] = [parse_value(value) for value in text.split(",")]
+    if args.sampler == "grid":
+        param_sets = grid(values)
+    else:
+        space = {
+            name: (
+                (choices[0], choices[-1])
+                if all(isinstance(value, (int, float)) for value in choices)
+                else choices
+            )
+            for name, choices in values.items()
+        }
+        sampler = random_samples if args.sampler == "random" else latin_hypercube
+        param_sets = sampler(space, args.samples, args.seed)
+
+    sweep = ParameterSweep(
+        args.strategy,
+        param_sets,
+        simulations=args.simulations,
+        rounds=args.rounds,
+        seed=args.seed,
+        cache_dir=args.cache,
+        workers=args.workers,
+    )
+    results = sweep.run(args.output)
+    for result in sorted(results, key=lambda r: r.avg_profit, reverse=True):
+        print(
+            f"{json.dumps(result.params):<50} survival {result.survival_rate:6.2f}% "
+            f"rounds {result.avg_rounds:8.1f} profit €{result.avg_profit:+10.2f}"
+            f"{' (cached)' if result.cached else ''}"
+        )
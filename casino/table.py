@@ -1,19 +1,75 @@
-from typing import List, Dict
+import heapq
+import pickle
+import random
+import struct
+import zlib
+from array import array
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Dict, Deque, Set, Literal, Iterator, Any
 
+from . import profiling
+from .execution import SerialBackend
 from .player import PlayerStatus, Player
+from .strategies.spin_stats import SpinStats
+from .strategies.base import SpinOutcome
 from roulette_table import RouletteTable
 
+ResultsLevel = Literal["none", "summary", "full"]
+RESULTS_LEVELS = ("none", "summary", "full")
+
+# Casino.save() file header: magic bytes then format version (uint16)
+CHECKPOINT_MAGIC = b"CASINOCK"
+CHECKPOINT_VERSION = 1
+
+
+@dataclass
+class RoundSummary:
+    """
+    Compact columnar results of one round at a table.
+    Column i describes the player Casino.players[players[i]].
+    """
+
+    table_id: str
+    winning_number: int | None = None
+    players: array = field(default_factory=lambda: array("l"))
+    profits: array = field(default_factory=lambda: array("q"))  # In cents
+    total_bets: array = field(default_factory=lambda: array("q"))  # In cents
+
+
+@dataclass
+class RoundRecord:
+    """One round of Casino.iter_rounds"""
+
+    round_number: int
+    results: Dict[str, Dict[str, Any] | RoundSummary]  # By table_id
+    active_players: int  # Players still seated after the round
+
 
 class CasinoTable:
     """Single roulette table in the casino"""
 
-    def __init__(self, table_id: str, min_bet: int = 100, max_bet: int = 100_000):
+    def __init__(
+        self,
+        table_id: str,
+        min_bet: int = 100,
+        max_bet: int = 100_000,
+        spin_interval: float = 40.0,
+        seed: int | None = None,
+    ):
         self.table_id = table_id
         self.min_bet = min_bet
         self.max_bet = max_bet
-        self.roulette = RouletteTable()
-        self.current_players: List[Player] = []
+        self.spin_interval = spin_interval  # Seconds between two spins
+        self.roulette = RouletteTable(seed)
+        # Seated players keyed by player_id, in seating order
+        self.current_players: Dict[str, Player] = {}
         self.max_players = 70
+        # Recent spins, shared by the strategies of every seated player
+        self.spin_stats = SpinStats()
+        # Ids of the players who left since the owner last drained the list
+        self.departed: List[str] = []
 
     def can_add_player(self) -> bool:
         return len(self.current_players) < self.max_players
@@ -21,104 +77,412 @@ class CasinoTable:
     def add_player(self, player: Player) -> bool:
         if not self.can_add_player():
             return False
-        self.current_players.append(player)
+        self.current_players[player.player_id] = player
         player.status = PlayerStatus.PLAYING
+        player.strategy.bind_spin_stats(self.spin_stats)
         return True
 
     def remove_player(self, player: Player):
-        if player in self.current_players:
-            self.current_players.remove(player)
+        if self.current_players.pop(player.player_id, None) is not None:
             player.status = PlayerStatus.FINISHED
+            player.strategy.unbind_spin_stats()
+            self.departed.append(player.player_id)
+
+    def play_round(
+        self, results: ResultsLevel = "full"
+    ) -> Dict[str, Any] | RoundSummary:
+        """
+        Play one round at the table
 
-    def play_round(self) -> Dict[str, any]:
-        """Play one round at the table"""
+        Args:
+            results: "full" returns the detailed dict used by the round printers,
+                "summary" a columnar RoundSummary, "none" a RoundSummary holding
+                only the winning number
+        """
+        if results not in RESULTS_LEVELS:
+            raise ValueError(f"Unknown results level: {results}")
+        if not profiling.enabled:
+            return self._play_round(results)
+        profiling.start("play_round")
+        try:
+            return self._play_round(results)
+        finally:
+            profiling.stop()
+
+    def _play_round(self, results: ResultsLevel) -> Dict[str, Any] | RoundSummary:
+        full = results == "full"
+        summary = None if full else RoundSummary(self.table_id)
         round_stats = {"winning_number": None, "players_results": {}}
 
         if not self.current_players:
-            return round_stats
+            return round_stats if full else summary
 
         # Collect bets
-        player_bets = {}
-        for player in self.current_players:
+        player_bets = []
+        for player in self.current_players.values():
             bets = player.calculate_bets()
             total_bet = sum(bet.amount for bet in bets)
 
             if total_bet <= player.get_current_bankroll():
-                player_bets[player.player_id] = bets
+                player_bets.append((player, bets))
 
         # Spin wheel
         winning_number = self.roulette.spin()
-        round_stats["winning_number"] = winning_number
+        self.spin_stats.push(winning_number)
+        if full:
+            round_stats["winning_number"] = winning_number
+        else:
+            summary.winning_number = winning_number
+        keep_players = results == "summary"
 
         # Process results
-        for player in self.current_players[:]:
-            player_id = player.player_id
-            if player_id not in player_bets:
-                continue
-
-            bets = player_bets[player_id]
+        for player, bets in player_bets:
             total_profit = 0
             total_bet = 0
+            won_mask = 0
+            # Per-bet settlement, only for the strategies reading it
+            profits = [] if player.strategy.uses_outcome else None
             winning_bets = []
             losing_bets = []
 
-            for bet in bets:
+            for i, bet in enumerate(bets):
                 total_bet += bet.amount
                 if self.roulette.check_win(bet.bet_type, winning_number):
                     payout_multiplier = self.roulette.get_payout(bet.bet_type)
                     profit = int(bet.amount * payout_multiplier)
-                    total_profit += profit
-                    winning_bets.append(bet)
+                    if profits is not None:
+                        won_mask |= 1 << i
+                    if full:
+                        winning_bets.append(bet)
                 else:
-                    total_profit -= bet.amount
-                    losing_bets.append(bet)
-
-            player.update_after_round(total_profit, total_bet, winning_number)
-            round_stats["players_results"][player_id] = {
-                "profit": total_profit,
-                "total_bet": total_bet,
-                "bankroll": player.get_current_bankroll(),
-                "initial_bankroll": player.get_initial_bankroll(),
-                "winning_bets": winning_bets,
-                "losing_bets": losing_bets,
-            }
+                    profit = -bet.amount
+                    if full:
+                        losing_bets.append(bet)
+                total_profit += profit
+                if profits is not None:
+                    profits.append(profit)
+
+            outcome = None
+            if profits is not None:
+                outcome = SpinOutcome(bets, won_mask, profits)
+            player.update_after_round(total_profit, total_bet, winning_number, outcome)
+            if full:
+                round_stats["players_results"][player.player_id] = {
+                    "profit": total_profit,
+                    "total_bet": total_bet,
+                    "bankroll": player.get_current_bankroll(),
+                    "initial_bankroll": player.get_initial_bankroll(),
+                    "winning_bets": winning_bets,
+                    "losing_bets": losing_bets,
+                }
+            elif keep_players:
+                summary.players.append(player.index)
+                summary.profits.append(total_profit)
+                summary.total_bets.append(total_bet)
 
             if player.should_leave():
                 self.remove_player(player)
 
-        return round_stats
+        return round_stats if full else summary
 
 
 class Casino:
     """Main casino class managing tables and players"""
 
-    def __init__(self):
-        self.tables: List[CasinoTable] = [
-            CasinoTable("table_1", min_bet=100),
-            CasinoTable("table_2", min_bet=500),
-            CasinoTable("table_3", min_bet=1000),
-        ]
-        self.waiting_players: List[Player] = []
+    def __init__(
+        self,
+        tables: List[CasinoTable] | None = None,
+        backend=None,
+        seed: int | None = None,
+    ):
+        """
+        Args:
+            tables: Tables of the casino, three tables with increasing minimum
+                bets by default
+            backend: How tables are played each round, see casino.execution
+                (SerialBackend by default)
+            seed: Seed of the default tables' wheels, for reproducible runs
+        """
+        if tables is None:
+            seeds = random.Random(seed)
+            tables = [
+                CasinoTable(
+                    f"table_{number}",
+                    min_bet=min_bet,
+                    seed=None if seed is None else seeds.getrandbits(64),
+                )
+                for number, min_bet in ((1, 100), (2, 500), (3, 1000))
+            ]
+        self.tables: List[CasinoTable] = tables
+        self.backend = backend or SerialBackend()
+        # Waiting players grouped by bet bracket (their strategy base bet)
+        self._waiting: Dict[int, Deque[Player]] = {}
+        # Per bracket: heap of indexes of eligible tables that may have a free seat
+        self._open_tables: Dict[int, List[int]] = {}
+        self._open_members: Dict[int, Set[int]] = {}
+        # Indexes of tables dropped from a heap because they were full
+        self._full_tables: Set[int] = set()
+        # Table index of seated players
+        self._seats: Dict[str, int] = {}
+        # Seated players count, kept up to date without rescanning the tables
+        self._table_sizes = [len(table.current_players) for table in self.tables]
+        self.active_players = sum(self._table_sizes)
         self.finished_players: List[Player] = []
+        # Every player ever added, Player.index is the position in this list
+        self.players: List[Player] = []
+
+    @property
+    def waiting_players(self) -> List[Player]:
+        """Waiting players in arrival order"""
+        return [
+            player
+            for player in heapq.merge(
+                *self._waiting.values(), key=lambda player: player.index
+            )
+            if player.status != PlayerStatus.FINISHED
+        ]
+
+    def has_waiting_players(self) -> bool:
+        """Whether a player still waits for a seat, forgetting those who left"""
+        for bracket, queue in list(self._waiting.items()):
+            while queue and queue[0].status == PlayerStatus.FINISHED:
+                queue.popleft()
+            if queue:
+                return True
+            del self._waiting[bracket]
+        return False
+
+    def add_player(self, player: Player, table: int | None = None):
+        """
+        Add a player waiting for a seat. Given a table index, the player sits
+        there right away when it has a free seat.
+        """
+        player.index = len(self.players)
+        self.players.append(player)
+        if table is not None and self.tables[table].add_player(player):
+            self._seats[player.player_id] = table
+            self._table_sizes[table] += 1
+            self.active_players += 1
+            return
+        bracket = player.strategy.base_bet
+        queue = self._waiting.get(bracket)
+        if queue is None:
+            queue = self._waiting[bracket] = deque()
+            self._open_bracket(bracket)
+        queue.append(player)
+
+    def _open_bracket(self, bracket: int):
+        """Build the heap of tables accepting this bet, first table first"""
+        if bracket in self._open_tables:
+            return
+        heap = [
+            idx
+            for idx, table in enumerate(self.tables)
+            if table.min_bet <= bracket <= table.max_bet
+            and idx not in self._full_tables
+        ]
+        self._open_tables[bracket] = heap
+        self._open_members[bracket] = set(heap)
+
+    def _reopen_table(self, idx: int):
+        """Put back a table that got a free seat in every bracket it accepts"""
+        self._full_tables.discard(idx)
+        table = self.tables[idx]
+        for bracket, heap in self._open_tables.items():
+            members = self._open_members[bracket]
+            if idx not in members and table.min_bet <= bracket <= table.max_bet:
+                heapq.heappush(heap, idx)
+                members.add(idx)
+
+    def assign_players(self) -> Set[int]:
+        """Assign waiting players to tables, return indexes of tables that got players"""
+        if not profiling.enabled:
+            return self._assign_players()
+        profiling.start("assign_players")
+        try:
+            return self._assign_players()
+        finally:
+            profiling.stop()
+
+    def _assign_players(self) -> Set[int]:
+        seated_tables = set()
+        # Heads of the bracket queues that have open tables, by arrival order,
+        # so players are seated first come first served across brackets
+        heads = [
+            (queue[0].index, bracket)
+            for bracket, queue in self._waiting.items()
+            if self._open_tables[bracket]
+        ]
+        heapq.heapify(heads)
+        while heads:
+            _, bracket = heapq.heappop(heads)
+            queue = self._waiting[bracket]
+            player = queue[0]
+            if player.status == PlayerStatus.FINISHED:
+                # Left the casino while waiting
+                queue.popleft()
+            else:
+                idx = self._seat(player, bracket)
+                if idx is None:
+                    # Every table of the bracket is full, it waits for a seat
+                    continue
+                queue.popleft()
+                seated_tables.add(idx)
+            if queue:
+                heapq.heappush(heads, (queue[0].index, bracket))
+            else:
+                del self._waiting[bracket]
+        return seated_tables
+
+    def _seat(self, player: Player, bracket: int) -> int | None:
+        """Seat a player at the first open table of its bracket, return its index"""
+        heap = self._open_tables[bracket]
+        members = self._open_members[bracket]
+        while heap:
+            idx = heap[0]
+            if self.tables[idx].add_player(player):
+                self._seats[player.player_id] = idx
+                self._table_sizes[idx] += 1
+                self.active_players += 1
+                return idx
+            heapq.heappop(heap)
+            members.discard(idx)
+            self._full_tables.add(idx)
+        return None
+
+    def remove_player(self, player: Player):
+        """Make a player leave the casino, whether seated or still waiting"""
+        idx = self._seats.pop(player.player_id, None)
+        if idx is not None and player.player_id in self.tables[idx].current_players:
+            self.tables[idx].remove_player(player)
+            self._table_played(idx)
+        else:
+            # Waiting players are skipped by assign_players once finished
+            player.status = PlayerStatus.FINISHED
 
-    def add_player(self, player: Player):
-        self.waiting_players.append(player)
-
-    def assign_players(self):
-        """Assign waiting players to tables"""
-        for player in self.waiting_players[:]:
-            for table in self.tables:
-                if (
-                    table.can_add_player()
-                    and table.min_bet <= player.strategy.base_bet <= table.max_bet
-                ):
-                    if table.add_player(player):
-                        self.waiting_players.remove(player)
-                        break
-
-    def simulate_round(self) -> Dict[str, any]:
+    def play_table(
+        self, idx: int, results: ResultsLevel = "full"
+    ) -> Dict[str, Any] | RoundSummary:
+        """Play one round at a single table, in the calling thread"""
+        table_results = self.tables[idx].play_round(results)
+        self._table_played(idx)
+        return table_results
+
+    def _table_played(self, idx: int):
+        """Account for the players who left a table"""
+        table = self.tables[idx]
+        if table.departed:
+            for player_id in table.departed:
+                self._seats.pop(player_id, None)
+            table.departed.clear()
+        size = len(table.current_players)
+        self.active_players += size - self._table_sizes[idx]
+        self._table_sizes[idx] = size
+        if idx in self._full_tables and table.can_add_player():
+            self._reopen_table(idx)
+
+    def simulate_round(
+        self, results: ResultsLevel = "full"
+    ) -> Dict[str, Dict[str, Any] | RoundSummary]:
         """Simulate one round at all tables"""
+        if not profiling.enabled:
+            return self._simulate_round(results)
+        profiling.start("simulate_round")
+        try:
+            return self._simulate_round(results)
+        finally:
+            profiling.stop()
+
+    def _simulate_round(
+        self, results: ResultsLevel
+    ) -> Dict[str, Dict[str, Any] | RoundSummary]:
         round_results = {}
-        for table in self.tables:
-            round_results[table.table_id] = table.play_round()
+        tables_results = self.backend.play_round(self.tables, results)
+        for idx, (table, table_results) in enumerate(zip(self.tables, tables_results)):
+            round_results[table.table_id] = table_results
+            self._table_played(idx)
         return round_results
+
+    def iter_rounds(
+        self,
+        max_rounds: int,
+        stop_when_empty: bool = True,
+        results: ResultsLevel = "summary",
+    ) -> Iterator[RoundRecord]:
+        """
+        Seat waiting players and play rounds one at a time, yielding a record
+        per round so consumers can stream them without keeping past rounds.
+
+        Args:
+            max_rounds: Maximum number of rounds to play
+            stop_when_empty: Stop once nobody is seated nor waiting
+            results: Results level of each round, see CasinoTable.play_round
+        """
+        for round_number in range(1, max_rounds + 1):
+            self.assign_players()
+            if (
+                stop_when_empty
+                and not self.active_players
+                and not self.has_waiting_players()
+            ):
+                return
+            round_results = self.simulate_round(results)
+            yield RoundRecord(round_number, round_results, self.active_players)
+
+    def _collect_tables(self):
+        """
+        Tables and players that were played in worker processes replace their
+        stale copies: wheels, spin statistics, players in Casino.players and
+        at the tables.
+        """
+        tables, departed = self.backend.fetch_tables()
+        for player in departed:
+            self.players[player.index] = player
+        for idx, played in tables.items():
+            table = self.tables[idx]
+            table.roulette = played.roulette
+            table.spin_stats = played.spin_stats
+            seated = table.current_players
+            for player_id, player in played.current_players.items():
+                if player_id in seated:
+                    seated[player_id] = player
+                    self.players[player.index] = player
+            # Players seated since the last round are not in the workers yet
+            for player in seated.values():
+                player.strategy.bind_spin_stats(table.spin_stats)
+
+    def close(self):
+        """Stop the backend"""
+        self._collect_tables()
+        self.backend.close()
+
+    def save(self, path: str | Path):
+        """
+        Checkpoint the whole casino: tables, seated and waiting players, their
+        strategies' state and the wheels' random state. Only seeded wheels can
+        resume bit for bit, unseeded ones keep drawing from the system source.
+        """
+        self._collect_tables()
+        state = self.__dict__.copy()
+        state["backend"] = None  # Worker processes cannot be saved
+        payload = zlib.compress(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+        with open(path, "wb") as f:
+            f.write(CHECKPOINT_MAGIC)
+            f.write(struct.pack("<H", CHECKPOINT_VERSION))
+            f.write(payload)
+
+    @classmethod
+    def load(cls, path: str | Path, backend=None) -> "Casino":
+        """Resume a casino saved by Casino.save()"""
+        with open(path, "rb") as f:
+            data = f.read()
+        header_size = len(CHECKPOINT_MAGIC) + 2
+        if data[: len(CHECKPOINT_MAGIC)] != CHECKPOINT_MAGIC:
+            raise ValueError(f"{path} is not a casino checkpoint")
+        (version,) = struct.unpack("<H", data[len(CHECKPOINT_MAGIC) : header_size])
+        if version != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version: {version}")
+        casino = cls.__new__(cls)
+        casino.__dict__.update(pickle.loads(zlib.decompress(data[header_size:])))
+        casino.backend = backend or SerialBackend()
+        return casino
@@ -1,5 +1,11 @@
 from typing import List, Dict, Union, Optional
 
+KEEP_PLAYING: int
+LEAVE_MIN_BANKROLL: int
+LEAVE_STOP_LOSS: int
+LEAVE_TAKE_PROFIT: int
+LEAVE_MAX_ROUNDS: int
+
 class Player:
     """Roulette player object to track game history and statistics (all monetary values in cents)
     
@@ -10,28 +16,59 @@ class Player:
     - Current bankroll
     """
 
-    def __init__(self, initial_bankroll: int = 100000) -> None:
-        """Initialize a new Player with an optional initial bankroll.
+    def __init__(
+        self,
+        initial_bankroll: int = 100000,
+        *,
+        stop_loss: int = 0,
+        take_profit: int = 0,
+        max_rounds: int = 0,
+        min_bankroll: int = 0,
+    ) -> None:
+        """Initialize a new Player with an optional initial bankroll and exit thresholds.
         
         Args:
             initial_bankroll: Initial bankroll in cents (default: 100000 = 1000.00€)
+            stop_loss: Leave once this many cents are lost (0 disables it)
+            take_profit: Leave once this many cents are won (0 disables it)
+            max_rounds: Leave after this many games (0 disables it)
+            min_bankroll: Leave when the bankroll drops below this (0 disables it)
         """
         ...
 
-    def add_game(self, result: int, bet_size: int, number: int) -> None:
+    def add_game(self, result: int, bet_size: int, number: int) -> int:
         """Add a game result with bet size and number.
         
         Args:
             result: Game result in cents (positive for wins, negative for losses)
             bet_size: Amount bet in cents
             number: Number bet on (0-36)
+
+        Returns:
+            KEEP_PLAYING, or the LEAVE_* constant of the first threshold reached
             
         Example:
-            >>> player = Player(10000)  # Start with 100€
+            >>> player = Player(10000, stop_loss=5000)  # Start with 100€
             >>> player.add_game(3500, 100, 17)  # Won 35€ on a 1€ bet on 17
+            0
         """
         ...
 
+    def get_status(self) -> int:
+        """Get KEEP_PLAYING or the LEAVE_* constant of the first threshold reached."""
+        ...
+
+    def set_thresholds(
+        self,
+        *,
+        stop_loss: int = ...,
+        take_profit: int = ...,
+        max_rounds: int = ...,
+        min_bankroll: int = ...,
+    ) -> int:
+        """Update some exit thresholds (in cents, 0 disables one) and return the status."""
+        ...
+
     def get_history(self) -> List[int]:
         """Get the complete history of game results.
         
@@ -6,8 +6,36 @@ typedef struct {
     PyObject *bet_sizes;    // Python list of bet amounts in cents
     PyObject *numbers_bet;  // Python list of numbers bet on
     long bankroll;         // Current bankroll in cents
+    long initial_bankroll; // Bankroll at creation in cents
+    long stop_loss;        // Leave once this much is lost (0 = disabled)
+    long take_profit;      // Leave once this much is won (0 = disabled)
+    long max_rounds;       // Leave after this many games (0 = disabled)
+    long min_bankroll;     // Leave when the bankroll drops below (0 = disabled)
 } PlayerObject;
 
+/* Status returned by add_game() and get_status() */
+enum {
+    KEEP_PLAYING = 0,
+    LEAVE_MIN_BANKROLL = 1,
+    LEAVE_STOP_LOSS = 2,
+    LEAVE_TAKE_PROFIT = 3,
+    LEAVE_MAX_ROUNDS = 4,
+};
+
+static int
+Player_compute_status(const PlayerObject *self)
+{
+    if (self->min_bankroll > 0 && self->bankroll < self->min_bankroll)
+        return LEAVE_MIN_BANKROLL;
+    if (self->stop_loss > 0 && self->initial_bankroll - self->bankroll >= self->stop_loss)
+        return LEAVE_STOP_LOSS;
+    if (self->take_profit > 0 && self->bankroll - self->initial_bankroll >= self->take_profit)
+        return LEAVE_TAKE_PROFIT;
+    if (self->max_rounds > 0 && PyList_Size(self->history) >= self->max_rounds)
+        return LEAVE_MAX_ROUNDS;
+    return KEEP_PLAYING;
+}
+
 static void
 Player_dealloc(const PlayerObject *self)
 {
@@ -31,6 +59,11 @@ static PyObject *
             return NULL;
         }
         self->bankroll = 0;
+        self->initial_bankroll = 0;
+        self->stop_loss = 0;
+        self->take_profit = 0;
+        self->max_rounds = 0;
+        self->min_bankroll = 0;
     }
     return (PyObject *) self;
 }
@@ -38,13 +71,22 @@ static PyObject *
 static int
 Player_init(PlayerObject *self, PyObject *args, PyObject *keywords)
 {
-    static char *kwlist[] = {"initial_bankroll", NULL};
+    static char *kwlist[] = {"initial_bankroll", "stop_loss", "take_profit",
+                             "max_rounds", "min_bankroll", NULL};
     long initial_bankroll = 100000;  // Default value: 1000.00 in cents
+    long stop_loss = 0, take_profit = 0, max_rounds = 0, min_bankroll = 0;
 
-    if (!PyArg_ParseTupleAndKeywords(args, keywords, "|l", kwlist, &initial_bankroll))
+    if (!PyArg_ParseTupleAndKeywords(args, keywords, "|l$llll", kwlist,
+                                     &initial_bankroll, &stop_loss, &take_profit,
+                                     &max_rounds, &min_bankroll))
         return -1;
 
     self->bankroll = initial_bankroll;
+    self->initial_bankroll = initial_bankroll;
+    self->stop_loss = stop_loss;
+    self->take_profit = take_profit;
+    self->max_rounds = max_rounds;
+    self->min_bankroll = min_bankroll;
     return 0;
 }
 
@@ -83,7 +125,33 @@ Player_add_game(PlayerObject *self, PyObject *args, PyObject *keywords)
     Py_DECREF(result_obj);
     Py_DECREF(bet_size_obj);
     Py_DECREF(number_obj);
-    Py_RETURN_NONE;
+    return PyLong_FromLong(Player_compute_status(self));
+}
+
+static PyObject *
+Player_get_status(const PlayerObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return PyLong_FromLong(Player_compute_status(self));
+}
+
+static PyObject *
+Player_set_thresholds(PlayerObject *self, PyObject *args, PyObject *keywords)
+{
+    static char *kwlist[] = {"stop_loss", "take_profit", "max_rounds", "min_bankroll", NULL};
+    /* Parsed into locals so a bad argument leaves the thresholds untouched */
+    long stop_loss = self->stop_loss, take_profit = self->take_profit;
+    long max_rounds = self->max_rounds, min_bankroll = self->min_bankroll;
+
+    if (!PyArg_ParseTupleAndKeywords(args, keywords, "|$llll", kwlist,
+                                     &stop_loss, &take_profit,
+                                     &max_rounds, &min_bankroll))
+        return NULL;
+
+    self->stop_loss = stop_loss;
+    self->take_profit = take_profit;
+    self->max_rounds = max_rounds;
+    self->min_bankroll = min_bankroll;
+    return PyLong_FromLong(Player_compute_status(self));
 }
 
 static PyObject *
@@ -145,9 +213,57 @@ Player_get_stats(const PlayerObject *self, PyObject *Py_UNUSED(ignored))
     return stats;
 }
 
+static PyObject *
+Player_reduce(const PlayerObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return Py_BuildValue("(O()(OOOllllll))", Py_TYPE(self),
+                         self->history, self->bet_sizes, self->numbers_bet,
+                         self->bankroll, self->initial_bankroll, self->stop_loss,
+                         self->take_profit, self->max_rounds, self->min_bankroll);
+}
+
+static PyObject *
+Player_setstate(PlayerObject *self, PyObject *state)
+{
+    PyObject *history, *bet_sizes, *numbers_bet;
+    long bankroll, initial_bankroll, stop_loss, take_profit, max_rounds, min_bankroll;
+
+    if (!PyArg_ParseTuple(state, "O!O!O!llllll", &PyList_Type, &history,
+                          &PyList_Type, &bet_sizes, &PyList_Type, &numbers_bet,
+                          &bankroll, &initial_bankroll, &stop_loss, &take_profit,
+                          &max_rounds, &min_bankroll))
+        return NULL;
+
+    PyObject *history_copy = PyList_GetSlice(history, 0, PyList_Size(history));
+    PyObject *bet_sizes_copy = PyList_GetSlice(bet_sizes, 0, PyList_Size(bet_sizes));
+    PyObject *numbers_bet_copy = PyList_GetSlice(numbers_bet, 0, PyList_Size(numbers_bet));
+
+    if (history_copy == NULL || bet_sizes_copy == NULL || numbers_bet_copy == NULL) {
+        Py_XDECREF(history_copy);
+        Py_XDECREF(bet_sizes_copy);
+        Py_XDECREF(numbers_bet_copy);
+        return NULL;
+    }
+
+    Py_XSETREF(self->history, history_copy);
+    Py_XSETREF(self->bet_sizes, bet_sizes_copy);
+    Py_XSETREF(self->numbers_bet, numbers_bet_copy);
+    self->bankroll = bankroll;
+    self->initial_bankroll = initial_bankroll;
+    self->stop_loss = stop_loss;
+    self->take_profit = take_profit;
+    self->max_rounds = max_rounds;
+    self->min_bankroll = min_bankroll;
+    Py_RETURN_NONE;
+}
+
 static PyMethodDef Player_methods[] = {
     {"add_game", (PyCFunction) Player_add_game, METH_VARARGS | METH_KEYWORDS,
-     "Add a game result with bet size (in cents) and number"},
+     "Add a game result with bet size (in cents) and number, return the status"},
+    {"get_status", (PyCFunction) Player_get_status, METH_NOARGS,
+     "Get KEEP_PLAYING or the LEAVE_* reason given the thresholds"},
+    {"set_thresholds", (PyCFunction) Player_set_thresholds, METH_VARARGS | METH_KEYWORDS,
+     "Update exit thresholds (in cents, 0 disables), return the status"},
     {"get_history", (PyCFunction) Player_get_history, METH_NOARGS,
      "Get the complete history of game results (in cents)"},
     {"get_bet_sizes", (PyCFunction) Player_get_bet_sizes, METH_NOARGS,
@@ -158,6 +274,10 @@ static PyMethodDef Player_methods[] = {
      "Get current bankroll (in cents)"},
     {"get_stats", (PyCFunction) Player_get_stats, METH_NOARGS,
      "Get player statistics (monetary values in cents)"},
+    {"__reduce__", (PyCFunction) Player_reduce, METH_NOARGS,
+     "Support pickling, so players can be sent to worker processes"},
+    {"__setstate__", (PyCFunction) Player_setstate, METH_O,
+     "Restore the state produced by __reduce__"},
     {NULL}  /* Sentinel */
 };
 
@@ -198,5 +318,14 @@ PyInit_casino_player(void)
         return NULL;
     }
 
+    if (PyModule_AddIntConstant(m, "KEEP_PLAYING", KEEP_PLAYING) < 0 ||
+        PyModule_AddIntConstant(m, "LEAVE_MIN_BANKROLL", LEAVE_MIN_BANKROLL) < 0 ||
+        PyModule_AddIntConstant(m, "LEAVE_STOP_LOSS", LEAVE_STOP_LOSS) < 0 ||
+        PyModule_AddIntConstant(m, "LEAVE_TAKE_PROFIT", LEAVE_TAKE_PROFIT) < 0 ||
+        PyModule_AddIntConstant(m, "LEAVE_MAX_ROUNDS", LEAVE_MAX_ROUNDS) < 0) {
+        Py_DECREF(m);
+        return NULL;
+    }
+
     return m;
 }
@@ -1,3 +1,4 @@
+import random
 import secrets
 from typing import Dict, List, Set
 
@@ -27,12 +28,36 @@ class RouletteTable:
         "neighbours": 6,  # Neighbors
     }
 
-    def __init__(self):
+    def __init__(self, seed: int | None = None):
+        """
+        Args:
+            seed: Seed for a reproducible wheel, None to draw numbers from the
+                system's secure random source
+        """
+        self.seed = seed
+        self.rng = self._make_rng(seed)
         self.current_number: int | None = None
         self._validate_wheel()
         self.bets: Dict[str, Set[int]] = {}
         self._initialize_bets()
 
+    @staticmethod
+    def _make_rng(seed: int | None) -> random.Random:
+        return secrets.SystemRandom() if seed is None else random.Random(seed)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        # The system random source has no state to save, only seeded wheels do
+        state["rng"] = None if self.seed is None else self.rng.getstate()
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        rng_state = state.pop("rng")
+        self.__dict__.update(state)
+        self.rng = self._make_rng(self.seed)
+        if rng_state is not None:
+            self.rng.setstate(rng_state)
+
     def _validate_wheel(self) -> None:
         if set(self.NUMBERS_SEQUENCE) != set(range(37)):
             raise ValueError("Invalid wheel sequence")
@@ -143,7 +168,7 @@ class RouletteTable:
             self._add_bet(f"neighbours_{_number}", set(neighbours))
 
     def spin(self) -> int:
-        self.current_number = secrets.choice(self.NUMBERS_SEQUENCE)
+        self.current_number = self.rng.choice(self.NUMBERS_SEQUENCE)
         return self.current_number
 
     def get_payout(self, bet_type: str) -> int:
@@ -83,10 +83,8 @@ def run_simulation(num_rounds: int = 50):
         casino.add_player(player)
 
     print("Starting casino simulation...")
-    for round_num in range(1, num_rounds + 1):
-        casino.assign_players()
-        results = casino.simulate_round()
-        print_round_results(round_num, results)
+    for record in casino.iter_rounds(num_rounds, stop_when_empty=False, results="full"):
+        print_round_results(record.round_number, record.results)
 
     print("\nSimulation finished!")
 
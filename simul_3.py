@@ -1,35 +1,7 @@
 from typing import Dict
 
-from tabulate import tabulate
-
 from casino.player import Player
-from casino.strategies.adaptive_distribution import AdaptiveDistributionStrategy
-from casino.strategies.column_pattern import ColumnPatternStrategy
-from casino.strategies.corner_momentum import CornerMomentumStrategy
-from casino.strategies.dalembert import DAlembertStrategy
-from casino.strategies.dynamic_sectors import DynamicSectorsStrategy
-from casino.strategies.enhanced_zero_trend import EnhancedZeroTrendStrategy
-from casino.strategies.fibonacci import FibonacciStrategy
-from casino.strategies.hot_cold_sectors import HotColdSectorsStrategy
-from casino.strategies.hybrid_martingale import HybridMartingaleStrategy
-from casino.strategies.james_bond import JamesBondStrategy
-from casino.strategies.labouchere import LabouchereStrategy
-from casino.strategies.martingale import MartingaleStrategy
-from casino.strategies.multi_pattern import MultiPatternStrategy
-from casino.strategies.opposite_sectors import OppositeSectorsStrategy
-from casino.strategies.paroli import ParoliStrategy
-from casino.strategies.progressive_coverage import ProgressiveCoverageStrategy
-from casino.strategies.sector_chain import SectorChainStrategy
-from casino.strategies.sequence import SequenceStrategy
-from casino.strategies.split_pattern import SplitPatternStrategy
-from casino.strategies.thirds_coverage import ThirdsCoverageStrategy
-from casino.strategies.wheel_sections import WheelSectionsStrategy
-
-from casino.strategies.zero_always import ZeroAlwaysStrategy
-from casino.strategies.zero_and_half import ZeroAndHalfStrategy
-from casino.strategies.zero_simple import ZeroSimpleStrategy
-from casino.strategies.zero_timeout import ZeroTimeoutStrategy
-from casino.strategies.zero_trend import ZeroTrendStrategy
+from casino.strategies import create_strategy, get_strategy_class
 from casino.table import Casino
 from roulette_table import RouletteTable
 
@@ -57,6 +29,9 @@ def print_round_results(round_number: int, results: Dict[str, any]):
 
     """Print results of a casino round in a formatted table with compact bet details using UTF-8 symbols"""
 
+    # Only needed to print, not to simulate
+    from tabulate import tabulate
+
     # Get winning number from first table (they all have the same winning number)
     winning_number = None
     for table_results in results.values():
@@ -202,95 +177,115 @@ def run_strategy_comparison(*, num_rounds: int):
         {"bet_type": "straight_0", "multiplier": 1},
         {"bet_type": "red", "multiplier": 1},
     ]
-    SequenceStrategy.create_sequence_file("custom_sequence.json", sequence)
+    get_strategy_class("sequence").create_sequence_file(
+        "custom_sequence.json", sequence
+    )
 
     # Create players with different strategies
     players = [
         Player(
             player_id="martingale",
             initial_bankroll=initial_bankroll,
-            strategy=MartingaleStrategy(base_bet=base_bet, max_progression=4),
+            strategy=create_strategy(
+                "martingale", base_bet=base_bet, max_progression=4
+            ),
         ),
         Player(
             player_id="dalembert",
             initial_bankroll=initial_bankroll,
-            strategy=DAlembertStrategy(base_bet=base_bet, max_progression=8),
+            strategy=create_strategy("dalembert", base_bet=base_bet, max_progression=8),
         ),
         Player(
             player_id="paroli",
             initial_bankroll=initial_bankroll,
-            strategy=ParoliStrategy(base_bet=base_bet, max_progression=3),
+            strategy=create_strategy("paroli", base_bet=base_bet, max_progression=3),
         ),
         Player(
             player_id="sequence",
             initial_bankroll=initial_bankroll,
-            strategy=SequenceStrategy("custom_sequence.json", base_bet=base_bet),
+            strategy=create_strategy(
+                "sequence", sequence_file="custom_sequence.json", base_bet=base_bet
+            ),
         ),
         Player(
             player_id="zero",
             initial_bankroll=initial_bankroll,
-            strategy=ZeroTrendStrategy(
-                base_bet=base_bet, zero_threshold=5, history_size=100
+            strategy=create_strategy(
+                "zero_trend", base_bet=base_bet, zero_threshold=5, history_size=100
             ),
         ),
         Player(
             player_id="fibonacci",
             initial_bankroll=initial_bankroll,
-            strategy=FibonacciStrategy(base_bet=base_bet, max_progression=4),
+            strategy=create_strategy("fibonacci", base_bet=base_bet, max_progression=4),
         ),
         Player(
             player_id="labouchere",
             initial_bankroll=initial_bankroll,
-            strategy=LabouchereStrategy(
-                base_bet=base_bet, sequence_length=6, bet_type="red"
+            strategy=create_strategy(
+                "labouchere", base_bet=base_bet, sequence_length=6, bet_type="red"
             ),
         ),
         Player(
             player_id="thirds coverage",
             initial_bankroll=initial_bankroll,
-            strategy=ThirdsCoverageStrategy(base_bet=base_bet, max_progression=4),
+            strategy=create_strategy(
+                "thirds_coverage", base_bet=base_bet, max_progression=4
+            ),
         ),
         Player(
             player_id="enhanced zero",
             initial_bankroll=initial_bankroll,
-            strategy=EnhancedZeroTrendStrategy(
-                base_bet=base_bet, zero_threshold=5, history_size=100
+            strategy=create_strategy(
+                "enhanced_zero_trend",
+                base_bet=base_bet,
+                zero_threshold=5,
+                history_size=100,
             ),
         ),
         Player(
             player_id="zero wait 10",
             initial_bankroll=initial_bankroll,
-            strategy=ZeroSimpleStrategy(base_bet=base_bet, wait_before_bet=10),
+            strategy=create_strategy(
+                "zero_simple", base_bet=base_bet, wait_before_bet=10
+            ),
         ),
         Player(
             player_id="zero wait 30",
             initial_bankroll=initial_bankroll,
-            strategy=ZeroSimpleStrategy(base_bet=base_bet, wait_before_bet=30),
+            strategy=create_strategy(
+                "zero_simple", base_bet=base_bet, wait_before_bet=30
+            ),
         ),
         Player(
             player_id="zero wait 50",
             initial_bankroll=initial_bankroll,
-            strategy=ZeroSimpleStrategy(base_bet=base_bet, wait_before_bet=50),
+            strategy=create_strategy(
+                "zero_simple", base_bet=base_bet, wait_before_bet=50
+            ),
         ),
         Player(
             player_id="zero wait 80",
             initial_bankroll=initial_bankroll,
-            strategy=ZeroSimpleStrategy(base_bet=base_bet, wait_before_bet=80),
+            strategy=create_strategy(
+                "zero_simple", base_bet=base_bet, wait_before_bet=80
+            ),
         ),
         Player(
             player_id="james bond",
             initial_bankroll=initial_bankroll,
-            strategy=JamesBondStrategy(base_bet=base_bet),
+            strategy=create_strategy("james_bond", base_bet=base_bet),
         ),
         Player(
             player_id="zero all time",
             initial_bankroll=initial_bankroll,
-            strategy=ZeroAlwaysStrategy(base_bet=base_bet),
+            strategy=create_strategy("zero_always", base_bet=base_bet),
         ),
         Player(
             player_id="zero 2/3, half 1/3",
             initial_bankroll=initial_bankroll,
-            strategy=ZeroAndHalfStrategy(
+            strategy=create_strategy(
+                "zero_and_half",
                 base_bet=base_bet,
                 max_progression=4,
                 other="black",
@@ -301,7 +296,8 @@ def run_strategy_comparison(*, num_rounds: int):
         Player(
             player_id="zero 1/3, half 2/3",
             initial_bankroll=initial_bankroll,
-            strategy=ZeroAndHalfStrategy(
+            strategy=create_strategy(
+                "zero_and_half",
                 base_bet=base_bet,
                 max_progression=4,
                 other="black",
@@ -312,7 +308,8 @@ def run_strategy_comparison(*, num_rounds: int):
         Player(
             player_id="zero timeout",
             initial_bankroll=initial_bankroll,
-            strategy=ZeroTimeoutStrategy(
+            strategy=create_strategy(
+                "zero_timeout",
                 base_bet=base_bet,
                 max_progression=4,
                 wait_before_bet=5,
@@ -323,62 +320,68 @@ def run_strategy_comparison(*, num_rounds: int):
         Player(
             player_id="wheel sections",
             initial_bankroll=initial_bankroll,
-            strategy=WheelSectionsStrategy(base_bet=base_bet),
+            strategy=create_strategy("wheel_sections", base_bet=base_bet),
         ),
         Player(
             player_id="hot cold",
             initial_bankroll=initial_bankroll,
-            strategy=HotColdSectorsStrategy(base_bet=base_bet, sector_size=5),
+            strategy=create_strategy(
+                "hot_cold_sectors", base_bet=base_bet, sector_size=5
+            ),
         ),
         Player(
             player_id="opposite sectors",
             initial_bankroll=initial_bankroll,
-            strategy=OppositeSectorsStrategy(base_bet=base_bet),
+            strategy=create_strategy("opposite_sectors", base_bet=base_bet),
         ),
         Player(
             player_id="column_pattern",
             initial_bankroll=initial_bankroll,
-            strategy=ColumnPatternStrategy(base_bet=base_bet),
+            strategy=create_strategy("column_pattern", base_bet=base_bet),
         ),
         Player(
             player_id="dynamic_sectors",
             initial_bankroll=initial_bankroll,
-            strategy=DynamicSectorsStrategy(base_bet=base_bet),
+            strategy=create_strategy("dynamic_sectors", base_bet=base_bet),
         ),
         Player(
             player_id="progressive_coverage",
             initial_bankroll=initial_bankroll,
-            strategy=ProgressiveCoverageStrategy(base_bet=base_bet),
+            strategy=create_strategy("progressive_coverage", base_bet=base_bet),
         ),
         Player(
             player_id="split pattern",
             initial_bankroll=initial_bankroll,
-            strategy=SplitPatternStrategy(base_bet=base_bet),
+            strategy=create_strategy("split_pattern", base_bet=base_bet),
         ),
         Player(
             player_id="corner momentum",
             initial_bankroll=initial_bankroll,
-            strategy=CornerMomentumStrategy(base_bet=base_bet, momentum_threshold=3),
+            strategy=create_strategy(
+                "corner_momentum", base_bet=base_bet, momentum_threshold=3
+            ),
         ),
         Player(
             player_id="multi pattern",
             initial_bankroll=initial_bankroll,
-            strategy=MultiPatternStrategy(base_bet=base_bet, pattern_memory=30),
+            strategy=create_strategy(
+                "multi_pattern", base_bet=base_bet, pattern_memory=30
+            ),
         ),
         Player(
             player_id="sector chain",
             initial_bankroll=initial_bankroll,
-            strategy=SectorChainStrategy(base_bet=base_bet, chain_size=8),
+            strategy=create_strategy("sector_chain", base_bet=base_bet, chain_size=8),
         ),
         Player(
             player_id="hybrid martingale",
             initial_bankroll=initial_bankroll,
-            strategy=HybridMartingaleStrategy(base_bet=base_bet),
+            strategy=create_strategy("hybrid_martingale", base_bet=base_bet),
         ),
         Player(
             player_id="adaptive distribution",
             initial_bankroll=initial_bankroll,
-            strategy=AdaptiveDistributionStrategy(base_bet=base_bet),
+            strategy=create_strategy("adaptive_distribution", base_bet=base_bet),
         ),
     ]
     ids = set(p.player_id for p in players)
@@ -389,28 +392,15 @@ def run_strategy_comparison(*, num_rounds: int):
         casino.add_player(player)
 
     print("Starting strategy comparison...")
-    round_num = 1
-    while round_num <= num_rounds:
-        casino.assign_players()
-
-        # Check if there are any active players
-        has_active_players = False
-        for table in casino.tables:
-            if table.current_players:
-                has_active_players = True
-                break
-
-        # If no active players and no waiting players, stop the simulation
-        if not has_active_players and not casino.waiting_players:
-            print("Simulation stopped: No more active players!")
-            break
-
-        results = casino.simulate_round()
-        print_round_results(round_num, results)
-        round_num += 1
+    completed_rounds = 0
+    for record in casino.iter_rounds(num_rounds, results="full"):
+        print_round_results(record.round_number, record.results)
+        completed_rounds = record.round_number
+    if completed_rounds < num_rounds:
+        print("Simulation stopped: No more active players!")
 
     print("Simulation finished!")
-    print(f"Completed rounds: {round_num - 1}")
+    print(f"Completed rounds: {completed_rounds}")
 
 
 def run_multiple_simulations(num_simulations: int, num_rounds: int):
@@ -421,33 +411,38 @@ def run_multiple_simulations(num_simulations: int, num_rounds: int):
             Player(
                 "martingale",
                 initial_bankroll,
-                MartingaleStrategy(base_bet=base_bet, max_progression=4),
+                create_strategy("martingale", base_bet=base_bet, max_progression=4),
             ),
             Player(
                 "dalembert",
                 initial_bankroll,
-                DAlembertStrategy(base_bet=base_bet, max_progression=8),
+                create_strategy("dalembert", base_bet=base_bet, max_progression=8),
             ),
             Player(
                 "zero wait 10",
                 initial_bankroll,
-                ZeroSimpleStrategy(base_bet=base_bet, wait_before_bet=10),
+                create_strategy("zero_simple", base_bet=base_bet, wait_before_bet=10),
             ),
             Player(
                 "zero wait 30",
                 initial_bankroll,
-                ZeroSimpleStrategy(base_bet=base_bet, wait_before_bet=30),
+                create_strategy("zero_simple", base_bet=base_bet, wait_before_bet=30),
             ),
             Player(
-                "james bond", initial_bankroll, JamesBondStrategy(base_bet=base_bet)
+                "james bond",
+                initial_bankroll,
+                create_strategy("james_bond", base_bet=base_bet),
             ),
             Player(
-                "zero all time", initial_bankroll, ZeroAlwaysStrategy(base_bet=base_bet)
+                "zero all time",
+                initial_bankroll,
+                create_strategy("zero_always", base_bet=base_bet),
             ),
             Player(
                 "zero and half",
                 initial_bankroll,
-                ZeroAndHalfStrategy(
+                create_strategy(
+                    "zero_and_half",
                     base_bet=base_bet,
                     max_progression=4,
                     other="black",
@@ -469,37 +464,33 @@ def run_multiple_simulations(num_simulations: int, num_rounds: int):
     for sim in range(num_simulations):
         casino = Casino()
         players = _gen_players()
-        active_players = {p.player_id: True for p in players}
         for player in players:
             casino.add_player(player)
 
-        round_num = 1
-        while round_num <= num_rounds:
-            casino.assign_players()
+        active_players = {p.player_id: True for p in players}
 
-            # Track which players are still active
+        def start_round():
+            """Track which players are still active at the start of a round"""
             for player in players:
                 if player.should_leave():
                     active_players[player.player_id] = False
                 else:
                     final_stats[player.player_id]["avg_rounds"] += 1
 
-            # Check if any players remain
-            if not any(active_players.values()) and not casino.waiting_players:
-                break
-
-            results_dict = casino.simulate_round()
-
+        start_round()
+        for record in casino.iter_rounds(num_rounds, results="summary"):
             # Update profit tracking
-            for table_results in results_dict.values():
-                for player_id, stats in table_results.get(
-                    "players_results", {}
-                ).items():
-                    final_stats[player_id]["total_profit"] += stats["profit"]
+            for summary in record.results.values():
+                for index, profit in zip(summary.players, summary.profits):
+                    final_stats[casino.players[index].player_id][
+                        "total_profit"
+                    ] += profit
 
-            round_num += 1
+            if record.round_number < num_rounds:
+                start_round()
 
-        # Record which strategies survived
+        # Record which strategies survived: still active when the last round
+        # started
         for player_id, active in active_players.items():
             if active:
                 final_stats[player_id]["survived"] += 1
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+from casino.player import Player, PlayerStatus
+from casino.strategies.martingale import MartingaleStrategy
+from casino.table import Casino
+
+
+def make_player(player_id: str, base_bet: int) -> Player:
+    return Player(player_id, 1000_00, MartingaleStrategy(base_bet=base_bet))
+
+
+def test_seating_follows_arrival_order_across_brackets():
+    casino = Casino(seed=1)
+    arrivals = [make_player("b0", 100), make_player("a", 500)]
+    arrivals += [make_player(f"b{i}", 100) for i in range(1, 70)]
+    for player in arrivals:
+        casino.add_player(player)
+    casino.assign_players()
+
+    # table_1 has 70 seats: the 500 player arrived second and takes one of
+    # them, so the last 100 player is the one left waiting
+    assert "a" in casino.tables[0].current_players
+    assert [player.player_id for player in casino.waiting_players] == ["b69"]
+    assert casino.has_waiting_players()
+
+
+def test_finished_waiting_players_are_not_waiting():
+    casino = Casino(tables=[], seed=1)
+    player = make_player("p", 100)
+    casino.add_player(player)
+    assert casino.has_waiting_players()
+    casino.remove_player(player)
+    assert player.status == PlayerStatus.FINISHED
+    assert not casino.has_waiting_players()
+    assert casino.waiting_players == []
+
+
+def test_players_who_leave_free_their_seat_entry():
+    casino = Casino(seed=1)
+    for i in range(200):
+        strategy = MartingaleStrategy(base_bet=100)
+        casino.add_player(Player(f"p{i}", 1000_00, strategy, max_rounds=1 + i % 5))
+    for _ in casino.iter_rounds(20):
+        pass
+    seated = {
+        player_id for table in casino.tables for player_id in table.current_players
+    }
+    assert set(casino._seats) == seated
+
+
+if __name__ == "__main__":
+    test_seating_follows_arrival_order_across_brackets()
+    test_finished_waiting_players_are_not_waiting()
+    test_players_who_leave_free_their_seat_entry()
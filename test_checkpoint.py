@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+from casino.execution import ProcessBackend, SerialBackend
+from casino.player import Player
+from casino.strategies.hot_cold_sectors import HotColdSectorsStrategy
+from casino.strategies.labouchere import LabouchereStrategy
+from casino.strategies.martingale import MartingaleStrategy
+from casino.table import Casino
+
+
+def make_casino(backend=None) -> Casino:
+    casino = Casino(backend=backend, seed=42)
+    strategies = [
+        lambda: HotColdSectorsStrategy(base_bet=300),
+        lambda: LabouchereStrategy(base_bet=500),
+        lambda: MartingaleStrategy(base_bet=1000),
+    ]
+    for i in range(30):
+        casino.add_player(Player(f"p{i}", 500_00, strategies[i % 3]()))
+    return casino
+
+
+def play(casino: Casino, rounds: int) -> list:
+    return [
+        [
+            (table_id, summary.winning_number, list(summary.players))
+            + (list(summary.profits),)
+            for table_id, summary in record.results.items()
+        ]
+        for record in casino.iter_rounds(rounds, stop_when_empty=False)
+    ]
+
+
+def test_process_backend_save_resumes_like_an_uninterrupted_run(tmp_path):
+    expected = play(make_casino(), 60)
+
+    casino = make_casino(ProcessBackend(2))
+    rounds = play(casino, 25)
+    casino.save(tmp_path / "casino.ckpt")
+    casino.close()
+    resumed = Casino.load(tmp_path / "casino.ckpt", SerialBackend())
+    rounds += play(resumed, 35)
+
+    assert rounds == expected
+
+
+if __name__ == "__main__":
+    import pathlib
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as directory:
+        test_process_backend_save_resumes_like_an_uninterrupted_run(
+            pathlib.Path(directory)
+        )
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+from casino.events import CasinoScheduler
+from casino.player import Player
+from casino.strategies.martingale import MartingaleStrategy
+from casino.table import Casino, CasinoTable
+
+
+def run_one_table(**breaks) -> int:
+    casino = Casino(tables=[CasinoTable("t0", spin_interval=40, seed=1)])
+    # A bankroll no Martingale run of 4000s can lose, so the table never idles
+    casino.add_player(Player("p", 10_000_000_00, MartingaleStrategy()))
+    scheduler = CasinoScheduler(casino, seed=1, **breaks)
+    return scheduler.run(4000).spins
+
+
+def test_breaks_do_not_duplicate_spins():
+    assert run_one_table() == 100
+    # 100s of play then 10s of break: the wheel spins every 40s of play only,
+    # 36 breaks leave 3640s of play
+    spins = run_one_table(break_every=100, break_duration=10)
+    assert abs(spins - 91) <= 1
+
+
+def test_long_breaks_skip_spins():
+    # Half of the time on break
+    spins = run_one_table(break_every=100, break_duration=100)
+    assert abs(spins - 50) <= 1
+
+
+if __name__ == "__main__":
+    test_breaks_do_not_duplicate_spins()
+    test_long_breaks_skip_spins()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+from casino.execution import ProcessBackend
+from casino.player import Player
+from casino.strategies.martingale import MartingaleStrategy
+from casino.table import Casino
+
+
+def test_process_backend_stops_playing_removed_players():
+    casino = Casino(backend=ProcessBackend(2), seed=3)
+    for i in range(10):
+        casino.add_player(Player(f"p{i}", 1000_00, MartingaleStrategy()))
+    removed = casino.players[4]
+    for record in casino.iter_rounds(10):
+        if record.round_number == 5:
+            casino.remove_player(removed)
+        elif record.round_number > 5:
+            for summary in record.results.values():
+                assert removed.index not in summary.players
+    casino.close()
+    assert casino.players[removed.index].rounds_played == 5
+
+
+def test_process_backend_sends_departed_players_once():
+    backend = ProcessBackend(1)
+    casino = Casino(backend=backend, seed=3)
+    for i in range(4):
+        casino.add_player(Player(f"p{i}", 1000_00, MartingaleStrategy()))
+    for record in casino.iter_rounds(3):
+        if record.round_number == 1:
+            casino.remove_player(casino.players[0])
+    _, departed = backend.fetch_tables()
+    assert [player.player_id for player in departed] == ["p0"]
+    _, departed = backend.fetch_tables()
+    assert departed == []
+    casino.close()
+
+
+if __name__ == "__main__":
+    test_process_backend_stops_playing_removed_players()
+    test_process_backend_sends_departed_players_once()
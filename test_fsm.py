@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+import pytest
+
+from casino.strategies.fsm import compile_machine
+from casino.strategies.sequence import SequenceStrategy
+
+ZERO_HUNTER = {
+    "initial": "bet",
+    "counters": {"since_zero": 3, "paused": 2},
+    "states": {
+        "bet": {
+            "bets": [{"bet_type": "straight_0", "multiplier": 1}],
+            "on": [
+                {"number": "straight_0", "reset": ["since_zero"]},
+                {
+                    "counter": "since_zero",
+                    "at_least": 2,
+                    "goto": "pause",
+                    "reset": ["since_zero"],
+                },
+                {"inc": ["since_zero"]},
+            ],
+        },
+        "pause": {
+            "bets": [],
+            "on": [
+                {
+                    "counter": "paused",
+                    "at_least": 1,
+                    "goto": "bet",
+                    "reset": ["paused"],
+                },
+                {"inc": ["paused"]},
+            ],
+        },
+    },
+}
+
+
+# Each makes the spec of test_invalid_machines_are_rejected invalid
+INVALID_CHANGES = [
+    lambda spec: spec.update(initial="missing"),
+    lambda spec: spec["states"]["bet"]["on"].append({"goto": "missing"}),
+    lambda spec: spec["states"]["bet"]["on"].append({"inc": ["missing"]}),
+    lambda spec: spec["states"]["bet"]["on"].append({"counter": "missing"}),
+    lambda spec: spec["states"]["bet"]["on"].append({"number": "purple"}),
+    lambda spec: spec["states"]["bet"]["on"].append({"result": "draw"}),
+]
+
+
+def test_compiled_machine_steps_through_its_rules():
+    machine = compile_machine(ZERO_HUNTER)
+    state = machine.initial
+    names = []
+    for won, number in [(False, 7), (False, 9), (True, 0), (False, 5), (False, 3)]:
+        state = machine.next_state(state, won, number)
+        names.append(machine.state_names[state])
+    assert names == [
+        "bet[since_zero=1,paused=0]",
+        "bet[since_zero=2,paused=0]",
+        "bet[since_zero=0,paused=0]",
+        "bet[since_zero=1,paused=0]",
+        "bet[since_zero=2,paused=0]",
+    ]
+    for _ in range(3):
+        state = machine.next_state(state, False, 12)
+        names.append(machine.state_names[state])
+    assert names[-3:] == [
+        "pause[since_zero=0,paused=0]",
+        "pause[since_zero=0,paused=1]",
+        "bet[since_zero=0,paused=0]",
+    ]
+    assert machine.bets[state] == (("straight_0", 1),)
+    # The zero rule needs the number, a pause counts rounds whatever it is
+    assert machine.next_state(state, False, None) == state
+    paused = machine.next_state(state, False, 12)
+    paused = machine.next_state(paused, False, 12)
+    paused = machine.next_state(paused, False, 12)
+    after = machine.state_names[machine.next_state(paused, False, None)]
+    assert after == "pause[since_zero=0,paused=1]"
+
+
+@pytest.mark.parametrize("change", INVALID_CHANGES)
+def test_invalid_machines_are_rejected(change):
+    spec = {
+        "counters": {"n": 2},
+        "states": {"bet": {"bets": [], "on": [{"inc": ["n"]}]}},
+    }
+    change(spec)
+    with pytest.raises(ValueError):
+        compile_machine(spec)
+
+
+def test_plain_sequence_advances_without_a_number():
+    strategy = SequenceStrategy(
+        [
+            {"bet_type": "red", "multiplier": 1},
+            {"bet_type": "black", "multiplier": 2},
+            {"bet_type": "straight_0", "multiplier": 1},
+        ]
+    )
+    played = []
+    for _ in range(4):
+        played.append(strategy.calculate_bets()[0].bet_type)
+        strategy.update_after_spin(won=False, number=None)
+    assert played == ["red", "black", "straight_0", "red"]
+
+
+if __name__ == "__main__":
+    test_compiled_machine_steps_through_its_rules()
+    for change in INVALID_CHANGES:
+        test_invalid_machines_are_rejected(change)
+    test_plain_sequence_advances_without_a_number()
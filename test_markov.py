@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+import random
+
+import pytest
+
+from casino.markov import MarkovChain
+from casino.player import Player
+from casino.strategies.hybrid_martingale import HybridMartingaleStrategy
+from casino.strategies.martingale import MartingaleStrategy
+from casino.table import Casino
+
+
+def test_ruin_probability_matches_monte_carlo():
+    bankroll, take_profit = 1500, 500
+    result = MarkovChain(
+        MartingaleStrategy(base_bet=100), bankroll, take_profit=take_profit
+    ).solve()
+
+    seeds = random.Random(5)
+    simulations = 2000
+    ruined = 0
+    rounds = 0
+    for _ in range(simulations):
+        casino = Casino(seed=seeds.getrandbits(64))
+        player = Player(
+            "p", bankroll, MartingaleStrategy(base_bet=100), take_profit=take_profit
+        )
+        casino.add_player(player)
+        # Stalled players stay seated, every other one leaves long before
+        for _ in casino.iter_rounds(100, results="none"):
+            pass
+        ruined += player.get_current_bankroll() - bankroll < take_profit
+        rounds += player.rounds_played
+
+    # Four standard errors of the Monte Carlo estimates
+    assert abs(ruined / simulations - result.ruin_probability) < 0.04
+    assert abs(rounds / simulations - result.expected_rounds) < 0.6
+
+
+def test_growing_strategy_states_are_rejected_early():
+    with pytest.raises(ValueError, match="keeps growing"):
+        MarkovChain(HybridMartingaleStrategy(), 14800, take_profit=5000)
+
+
+if __name__ == "__main__":
+    test_ruin_probability_matches_monte_carlo()
+    test_growing_strategy_states_are_rejected_early()
@@ -12,6 +12,23 @@ def test_player():
     numbers = player.get_numbers_bet()
     bankroll = player.get_bankroll()
 
+    player = casino_player.Player(1000_00, stop_loss=5_00, max_rounds=2)
+    assert player.add_game(-2_00, 2_00, 24) == casino_player.KEEP_PLAYING
+    assert player.add_game(-3_00, 3_00, 24) == casino_player.LEAVE_STOP_LOSS
+
+
+def test_set_thresholds_is_all_or_nothing():
+    player = casino_player.Player(1000_00, stop_loss=5_00)
+    try:
+        player.set_thresholds(stop_loss=1_00, take_profit="high")
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("take_profit must be an integer")
+    # The stop loss parsed before the bad argument was not applied
+    assert player.add_game(-2_00, 2_00, 24) == casino_player.KEEP_PLAYING
+
 
 if __name__ == "__main__":
     test_player()
+    test_set_thresholds_is_all_or_nothing()
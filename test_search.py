@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+import pytest
+
+from casino.search import SuccessiveHalving, hyperband
+
+BUDGETS = [
+    {"min_simulations": 0},
+    {"min_simulations": -4},
+    {"max_simulations": 0},
+    {"eta": 1},
+    {"eta": 0},
+]
+
+
+@pytest.mark.parametrize("budget", BUDGETS)
+def test_invalid_budgets_are_rejected_up_front(budget):
+    with pytest.raises(ValueError):
+        SuccessiveHalving("martingale", [{"base_bet": 100}], **budget)
+
+
+@pytest.mark.parametrize("budget", [{"max_simulations": 0}, {"eta": 1}])
+def test_hyperband_rejects_invalid_budgets(budget):
+    with pytest.raises(ValueError):
+        hyperband("martingale", {"base_bet": [100, 200]}, **budget)
+
+
+if __name__ == "__main__":
+    for budget in BUDGETS:
+        test_invalid_budgets_are_rejected_up_front(budget)
+    for budget in [{"max_simulations": 0}, {"eta": 1}]:
+        test_hyperband_rejects_invalid_budgets(budget)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+from casino.player import Player
+from casino.sharded import ShardedCasino
+from casino.strategies.martingale import MartingaleStrategy
+from casino.table import CasinoTable
+
+
+def test_finish_reports_every_player_after_close_table():
+    tables = [CasinoTable(f"t{i}", seed=i) for i in range(4)]
+    for table in tables:
+        table.max_players = 5
+    casino = ShardedCasino(tables, shards=2)
+    for i in range(30):
+        casino.add_player(Player(f"p{i}", 10_000_00, MartingaleStrategy()))
+
+    seated_rounds = {}
+    for record in casino.iter_rounds(10):
+        for summary in record.results.values():
+            for index in summary.players:
+                player_id = casino.player_ids[index]
+                seated_rounds[player_id] = seated_rounds.get(player_id, 0) + 1
+        if record.round_number == 5:
+            casino.close_table("t0")
+    stats = casino.finish()
+
+    # 20 seats for 30 players: t0's players are evicted with 5 rounds played
+    # and wait at the coordinator with the 10 players who never got a seat
+    assert len(stats.per_player) == 30
+    assert sorted(rounds for rounds, _, _ in stats.per_player.values()) == (
+        [0] * 10 + [5] * 5 + [10] * 15
+    )
+    assert stats.players == 30
+    for player_id, (rounds, _, _) in stats.per_player.items():
+        assert rounds == seated_rounds.get(player_id, 0)
+    assert stats.rounds_played == sum(seated_rounds.values())
+    assert stats.total_profit == sum(
+        bankroll - initial for _, initial, bankroll in stats.per_player.values()
+    )
+
+
+def test_routed_players_sit_at_their_reserved_table():
+    tables = [
+        CasinoTable("low", min_bet=100, max_bet=100, seed=1),
+        CasinoTable("any", min_bet=100, max_bet=500, seed=2),
+    ]
+    for table in tables:
+        table.max_players = 2
+    casino = ShardedCasino(tables, shards=1)
+    for i, base_bet in enumerate((500, 100, 100, 100, 500)):
+        strategy = MartingaleStrategy(base_bet=base_bet)
+        casino.add_player(Player(f"p{i}", 10_000_00, strategy))
+
+    record = next(casino.iter_rounds(1))
+    seated = {
+        table_id: sorted(casino.player_ids[index] for index in summary.players)
+        for table_id, summary in record.results.items()
+    }
+    assert seated == {"low": ["p1", "p2"], "any": ["p0", "p3"]}
+    stats = casino.finish()
+    assert sorted(stats.per_player) == ["p0", "p1", "p2", "p3", "p4"]
+    assert stats.per_player["p4"][0] == 0
+
+
+def test_finish_reports_players_waiting_inside_a_shard():
+    tables = [CasinoTable("t0", seed=1)]
+    tables[0].max_players = 1
+    casino = ShardedCasino(tables, shards=1)
+    # Stale seat count: the coordinator routes a player the table cannot seat
+    casino._free_seats["t0"] = 2
+    for i in range(2):
+        casino.add_player(Player(f"p{i}", 10_000_00, MartingaleStrategy()))
+    for _ in casino.iter_rounds(3):
+        pass
+    stats = casino.finish()
+    assert stats.per_player == {
+        "p0": (3, 10_000_00, stats.per_player["p0"][2]),
+        "p1": (0, 10_000_00, 10_000_00),
+    }
+    assert stats.survivors == 1
+
+
+if __name__ == "__main__":
+    test_finish_reports_every_player_after_close_table()
+    test_routed_players_sit_at_their_reserved_table()
+    test_finish_reports_players_waiting_inside_a_shard()
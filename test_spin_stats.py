@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+import random
+from collections import deque
+
+from casino.player import Player
+from casino.strategies.hot_cold_sectors import HotColdSectorsStrategy
+from casino.strategies.spin_stats import (
+    COLOR_OF,
+    COLUMN_OF,
+    DOZEN_OF,
+    WHEEL_POSITION,
+    SpinRing,
+    SpinStats,
+)
+from casino.table import CasinoTable
+
+
+def recount(spins: list, width: int) -> dict:
+    """Counts of a window from its spins, the slow way"""
+    numbers = [spins.count(n) for n in range(37)]
+    positions = [0] * 37
+    dozens, columns, colors = [0] * 4, [0] * 4, [0] * 3
+    for number in spins:
+        positions[WHEEL_POSITION[number]] += 1
+        dozens[DOZEN_OF[number]] += 1
+        columns[COLUMN_OF[number]] += 1
+        colors[COLOR_OF[number]] += 1
+    arcs = [
+        sum(positions[(start + offset) % 37] for offset in range(width))
+        for start in range(37)
+    ]
+    return {
+        "numbers": numbers,
+        "positions": positions,
+        "dozens": dozens,
+        "columns": columns,
+        "colors": colors,
+        "arcs": arcs,
+    }
+
+
+def check(stats: SpinStats, history: list, window: int, width: int):
+    spins = history[-min(window, len(stats)) :] if len(stats) else []
+    expected = recount(spins, width)
+    assert stats.length(window) == len(spins)
+    assert stats.number_counts(window) == expected["numbers"]
+    assert stats.position_counts(window) == expected["positions"]
+    assert stats.dozen_counts(window) == expected["dozens"]
+    assert stats.column_counts(window) == expected["columns"]
+    assert stats.color_counts(window) == expected["colors"]
+    assert stats.arc_hits(window, width) == expected["arcs"]
+    assert stats.arc_counts(window, width) == expected["arcs"]
+    fewest = min(expected["arcs"])
+    coldest = {start for start, hits in enumerate(expected["arcs"]) if hits == fewest}
+    assert stats.coldest_arcs(window, width) == coldest
+    below = {start for start, hits in enumerate(expected["arcs"]) if hits < 3}
+    assert stats.arcs_below(window, width, 3) == below
+    if spins:
+        e = len(spins) / 37
+        chi_squared = sum((count - e) ** 2 / e for count in expected["numbers"])
+        assert abs(stats.chi_squared(window) - chi_squared) < 1e-6
+
+
+def test_window_counts_match_a_recount():
+    rng = random.Random(7)
+    stats = SpinStats()
+    history = []
+    tracked = []  # (window, arc width), added while spins come in
+    for spin in range(600):
+        if spin in (0, 5, 80, 250):
+            window = rng.choice([1, 12, 37, 100])
+            width = rng.choice([1, 5, 12, 37])
+            stats.add_arcs(window, width)
+            tracked.append((window, width))
+        number = rng.randrange(37)
+        stats.push(number)
+        history.append(number)
+        assert list(stats.last(len(stats))) == history[-len(stats) :]
+        for window, width in tracked:
+            check(stats, history, window, width)
+
+
+def test_windows_are_dropped_with_their_last_user():
+    stats = SpinStats()
+    stats.add_arcs(20, 5)
+    stats.add_arcs(20, 5)
+    stats.add_window(30)
+    stats.remove_arcs(20, 5)
+    assert stats.arc_counts(20, 5) == [0] * 37
+    stats.remove_arcs(20, 5)
+    assert sorted(stats._windows) == [30]
+    stats.remove_window(30)
+    assert stats._windows == {}
+
+
+def test_players_leaving_release_their_table_windows():
+    table = CasinoTable("t", seed=1)
+    players = [
+        Player(f"p{i}", 1000_00, HotColdSectorsStrategy(history_size=24))
+        for i in range(2)
+    ]
+    for player in players:
+        table.add_player(player)
+    for _ in range(30):
+        table.play_round("none")
+    assert table.spin_stats._windows[24].users == 4  # Window and arcs, twice
+
+    table.remove_player(players[0])
+    strategy = players[0].strategy
+    assert strategy.spin_stats is not table.spin_stats
+    assert list(strategy.spin_stats.last(24)) == list(table.spin_stats.last(24))
+    table.remove_player(players[1])
+    assert table.spin_stats._windows == {}
+
+
+def test_spin_ring_wraps_around():
+    ring = SpinRing(4, range(1, 11))
+    assert len(ring) == 4
+    assert list(ring) == [7, 8, 9, 10]
+    assert list(ring.last(2)) == [9, 10]
+    assert list(ring.last(9)) == [7, 8, 9, 10]
+    assert (ring[0], ring[-1]) == (7, 10)
+    assert ring.count(7) == 1 and ring.count(3) == 0
+    ring.append(7)
+    assert list(ring) == [8, 9, 10, 7]
+    assert ring.count(7) == 1
+
+
+def test_spin_ring_grows_in_order():
+    stats = SpinStats(5)
+    for number in range(12):
+        stats.push(number)
+    stats.add_window(8)
+    assert stats.capacity == 8
+    assert list(stats.last(8)) == [7, 8, 9, 10, 11]
+    for number in range(12, 15):
+        stats.push(number)
+    assert list(stats.last(8)) == list(range(7, 15))
+    assert list(SpinRing(10, SpinRing(3, range(6)))) == [3, 4, 5]
+
+
+def test_spin_ring_matches_a_deque():
+    rng = random.Random(3)
+    for capacity in (1, 2, 7, 37, 100):
+        ring = SpinRing(capacity)
+        spins = deque(maxlen=capacity)
+        for step in range(3 * capacity + 5):
+            number = rng.randrange(37)
+            ring.append(number)
+            spins.append(number)
+            if step == capacity:
+                ring.count(0)  # Counts are kept from here on
+            assert list(ring) == list(spins)
+            assert ring[-1] == spins[-1] and ring[0] == spins[0]
+            k = rng.randrange(capacity + 2)
+            assert list(ring.last(k)) == list(spins)[max(len(spins) - k, 0) :]
+            if step >= capacity:
+                assert [ring.count(n) for n in range(37)] == [
+                    spins.count(n) for n in range(37)
+                ]
+        copy = ring.copy()
+        ring.append(36)
+        assert list(copy) == list(spins)
+        ring.clear()
+        assert len(ring) == 0 and list(ring) == []
+
+
+if __name__ == "__main__":
+    test_window_counts_match_a_recount()
+    test_windows_are_dropped_with_their_last_user()
+    test_players_leaving_release_their_table_windows()
+    test_spin_ring_wraps_around()
+    test_spin_ring_grows_in_order()
+    test_spin_ring_matches_a_deque()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+import json
+from dataclasses import replace
+
+from casino.sweep import ParameterSweep
+
+
+def make_sweep(cache_dir) -> ParameterSweep:
+    return ParameterSweep(
+        "martingale",
+        [{"base_bet": 100}, {"base_bet": 500}],
+        simulations=3,
+        rounds=20,
+        cache_dir=cache_dir,
+        workers=1,
+    )
+
+
+def test_rerun_rewrites_the_output_from_the_cache(tmp_path):
+    output = tmp_path / "sweep.jsonl"
+    first = make_sweep(tmp_path / "cache").run(output)
+    second = make_sweep(tmp_path / "cache").run(output)
+
+    assert all(result.cached for result in second)
+    assert sorted(second, key=lambda r: r.params["base_bet"]) == sorted(
+        first, key=lambda r: r.params["base_bet"]
+    )
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert sorted(json.loads(line)["params"]["base_bet"] for line in lines) == [
+        100,
+        500,
+    ]
+
+
+def test_cache_key_depends_on_the_code_version():
+    cell = make_sweep(None).cells[0]
+    assert cell.version
+    assert replace(cell, version="older").key != cell.key
+
+
+if __name__ == "__main__":
+    import pathlib
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as directory:
+        test_rerun_rewrites_the_output_from_the_cache(pathlib.Path(directory))
+    test_cache_key_depends_on_the_code_version()